@@ -0,0 +1,91 @@
+import threading
+import time
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import Session
+
+from .config import settings
+from .database import SessionLocal
+from .models.catalog_state import CatalogState
+
+CATALOG_STATE_ID = 1
+_PENDING_KEY = "pending_catalog_version"
+
+
+class CatalogVersion:
+    """In-memory view of the persisted catalog version.
+
+    Repositories bump the persisted counter inside their write transaction and the new value
+    becomes visible here once that transaction commits. The value is re-read from the database
+    at most every ``catalog_version_refresh_seconds`` so writes made by other worker processes
+    are picked up without a query per request.
+    """
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._version = 0
+        self._updated_at = datetime.utcnow()
+        self._checked_at: float | None = None
+        self._external_change_listeners: list[Callable[[], None]] = []
+
+    def add_external_change_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback run when another process is seen to have changed the catalog."""
+        self._external_change_listeners.append(listener)
+
+    def current(self) -> tuple[int, datetime]:
+        now = time.monotonic()
+        if self._checked_at is None or now - self._checked_at >= self.refresh_seconds:
+            self._refresh(now)
+        return self._version, self._updated_at
+
+    def bump(self, db: Session) -> None:
+        """Increment the persisted version as part of ``db``'s pending transaction."""
+        now = datetime.utcnow()
+        result = db.execute(
+            update(CatalogState)
+            .where(CatalogState.id == CATALOG_STATE_ID)
+            .values(version=CatalogState.version + 1, updated_at=now)
+        )
+        if result.rowcount == 0:
+            db.execute(insert(CatalogState).values(id=CATALOG_STATE_ID, version=1, updated_at=now))
+        version = db.scalar(select(CatalogState.version).where(CatalogState.id == CATALOG_STATE_ID))
+        db.info[_PENDING_KEY] = (version, now)
+
+    def _apply(self, version: int, updated_at: datetime) -> bool:
+        with self._lock:
+            if version <= self._version:
+                return False
+            self._version = version
+            self._updated_at = updated_at
+            return True
+
+    def _refresh(self, now: float) -> None:
+        self._checked_at = now
+        with SessionLocal() as db:
+            state = db.get(CatalogState, CATALOG_STATE_ID)
+            if state is None:
+                return
+            version, updated_at = state.version, state.updated_at
+
+        first_load = self._version == 0
+        if self._apply(version, updated_at) and not first_load:
+            for listener in self._external_change_listeners:
+                listener()
+
+
+catalog_version = CatalogVersion(refresh_seconds=settings.catalog_version_refresh_seconds)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_version(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending is not None:
+        catalog_version._apply(*pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_version(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
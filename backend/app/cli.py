@@ -0,0 +1,218 @@
+"""Maintenance commands, run from the backend directory: ``python -m app.cli <command>``."""
+
+import argparse
+import json
+import logging
+import sys
+
+from .database import SessionLocal, engine, init_db
+
+
+def migrate(args: argparse.Namespace) -> None:
+    from .migrations import pending_migrations
+
+    if args.dry_run:
+        pending = pending_migrations(engine)
+        for version, name in pending:
+            print(f"pending {version}: {name}")
+        if not pending:
+            print("Database schema is up to date")
+        return
+
+    applied = init_db()
+    print(f"Applied migrations: {applied}" if applied else "Database schema is up to date")
+
+
+def rebuild_search_index(args: argparse.Namespace) -> None:
+    from .repositories.search_index import rebuild_search_index as rebuild
+
+    init_db()
+    with engine.begin() as connection:
+        rebuild(connection)
+    print("Product search index rebuilt")
+
+
+def refresh_category_stats(args: argparse.Namespace) -> None:
+    from .repositories.category_repository import CategoryRepository
+
+    init_db()
+    with SessionLocal() as db:
+        CategoryRepository(db).rebuild_stats()
+    print("Category product counts and price ranges recomputed")
+
+
+def export_translations(args: argparse.Namespace) -> None:
+    from .repositories.translation_repository import TranslationRepository
+
+    init_db()
+    output = sys.stdout if args.path == "-" else open(args.path, "w", encoding="utf-8")
+    exported = 0
+    try:
+        with SessionLocal() as db:
+            for translation in TranslationRepository(db).iter_all():
+                record = {
+                    "source_lang": translation.source_lang,
+                    "target_lang": translation.target_lang,
+                    "source_text": translation.source_text,
+                    "translated_text": translation.translated_text,
+                }
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                exported += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(f"Exported {exported} translations", file=sys.stderr)
+
+
+def import_translations(args: argparse.Namespace) -> None:
+    from .repositories.translation_repository import TranslationRepository
+    from .services.translation_memo import normalize_text, text_hash
+
+    init_db()
+    imported = 0
+    batch: list[tuple[str, str, str, str, str]] = []
+    with SessionLocal() as db, open(args.path, encoding="utf-8") as source:
+        repository = TranslationRepository(db)
+        for line_number, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                source_text = normalize_text(record["source_text"])
+                entry = (
+                    text_hash(source_text),
+                    record["source_lang"],
+                    record["target_lang"],
+                    source_text,
+                    record["translated_text"],
+                )
+            except (KeyError, TypeError, ValueError) as exc:
+                print(f"Skipping line {line_number}: {exc}", file=sys.stderr)
+                continue
+            batch.append(entry)
+            if len(batch) >= 500:
+                repository.save_many(batch)
+                imported += len(batch)
+                batch = []
+        if batch:
+            repository.save_many(batch)
+            imported += len(batch)
+    print(f"Imported {imported} translations")
+
+
+def backfill_translations(args: argparse.Namespace) -> None:
+    from .services.translation_backfill import TranslationBackfill
+
+    init_db()
+    with SessionLocal() as db:
+        TranslationBackfill(db, workers=args.workers, batch_size=args.batch_size, restart=args.restart).run()
+
+
+def import_products(args: argparse.Namespace) -> None:
+    from .services.image_processing import fill_missing_image_variants, shutdown_image_workers
+    from .services.product_import import (
+        ProductImporter,
+        detect_import_format,
+        iter_import_records,
+        iter_text_lines,
+    )
+
+    import_format = detect_import_format(args.path, args.format)
+    if import_format is None:
+        sys.exit("Cannot tell the file format from its name; pass --format csv|jsonl")
+
+    init_db()
+    with SessionLocal() as db, open(args.path, "rb") as source:
+        records = iter_import_records(iter_text_lines(source), import_format)
+        result = ProductImporter(db, batch_size=args.batch_size).run(records)
+        for error in result.errors:
+            print(f"Line {error.line}: {error.message}", file=sys.stderr)
+        if result.error:
+            print(result.error, file=sys.stderr)
+        if result.images_queued and not args.skip_image_variants:
+            try:
+                fill_missing_image_variants(db)
+            finally:
+                shutdown_image_workers()
+    print(
+        f"Imported {result.created} products, rejected {result.failed}, "
+        f"queued {result.translations_queued} translations"
+    )
+
+
+def generate_image_variants(args: argparse.Namespace) -> None:
+    from .services.image_processing import fill_missing_image_variants, shutdown_image_workers
+
+    init_db()
+    with SessionLocal() as db:
+        try:
+            processed = fill_missing_image_variants(db, batch_size=args.batch_size, regenerate=args.all)
+        finally:
+            shutdown_image_workers()
+    print(f"Generated variants for {processed} images")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help="Apply pending schema migrations")
+    migrate_parser.add_argument("--dry-run", action="store_true", help="Only list pending migrations")
+    migrate_parser.set_defaults(handler=migrate)
+
+    rebuild_parser = subparsers.add_parser("rebuild-search-index", help="Rebuild the product full-text search index")
+    rebuild_parser.set_defaults(handler=rebuild_search_index)
+
+    stats_parser = subparsers.add_parser(
+        "refresh-category-stats",
+        help="Recompute category product counts and price ranges, e.g. after editing products in SQL",
+    )
+    stats_parser.set_defaults(handler=refresh_category_stats)
+
+    export_parser = subparsers.add_parser("export-translations", help="Export the translation memo as JSON lines")
+    export_parser.add_argument("path", nargs="?", default="-", help="Output file, '-' for stdout")
+    export_parser.set_defaults(handler=export_translations)
+
+    import_parser = subparsers.add_parser("import-translations", help="Pre-seed the translation memo from JSON lines")
+    import_parser.add_argument("path", help="File produced by export-translations")
+    import_parser.set_defaults(handler=import_translations)
+
+    backfill_parser = subparsers.add_parser(
+        "backfill-translations",
+        help="Translate existing categories and products that have no translations yet",
+    )
+    backfill_parser.add_argument("--workers", type=int, default=4, help="Concurrent translation workers")
+    backfill_parser.add_argument("--batch-size", type=int, default=200, help="Rows per committed batch")
+    backfill_parser.add_argument("--restart", action="store_true", help="Ignore the saved checkpoint")
+    backfill_parser.set_defaults(handler=backfill_translations)
+
+    products_parser = subparsers.add_parser("import-products", help="Bulk-create products from CSV or JSON lines")
+    products_parser.add_argument("path", help="CSV with a header row, or one JSON object per line")
+    products_parser.add_argument("--format", choices=("csv", "jsonl"), help="Override detection by file extension")
+    products_parser.add_argument("--batch-size", type=int, default=500, help="Rows per committed batch")
+    products_parser.add_argument(
+        "--skip-image-variants",
+        action="store_true",
+        help="Leave variants of local images to generate-image-variants",
+    )
+    products_parser.set_defaults(handler=import_products)
+
+    variants_parser = subparsers.add_parser(
+        "generate-image-variants",
+        help="Create thumbnails and WebP copies for uploaded product images",
+    )
+    variants_parser.add_argument("--batch-size", type=int, default=50, help="Images per committed batch")
+    variants_parser.add_argument("--all", action="store_true", help="Regenerate images that already have variants")
+    variants_parser.set_defaults(handler=generate_image_variants)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,24 @@ class Settings(BaseSettings):
     app_name: str = "TashTemir"
     debug: bool = True
     database_url: str = "sqlite:///./shop.db"
+    migrate_on_startup: bool = True
+    # Defaults to database_url with its driver swapped for aiosqlite/asyncpg.
+    async_database_url: str | None = None
+
+    # SQLite connection profile, applied as PRAGMAs on every new connection.
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_cache_size_kib: int = 65536
+    sqlite_mmap_size: int = 268435456
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_temp_store: str = "MEMORY"
+
+    # Connection pool sizing (file-backed SQLite and Postgres).
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
 
     cors_origins: Annotated[List[str], NoDecode] = [
         "http://localhost:5173",
@@ -20,15 +38,51 @@ class Settings(BaseSettings):
         "http://127.0.0.1:3000",
     ]
 
+    # Absolute storefront address used for links in exported product feeds.
+    public_base_url: str = "http://localhost:5173"
+    feed_currency: str = "KGS"
+
     static_dir: str = str(Path(__file__).resolve().parent.parent / "static")
     images_dir: str = str(Path(__file__).resolve().parent.parent / "static" / "images")
+    # Longest edge in pixels of each derivative generated for uploaded images.
+    image_variant_sizes: dict[str, int] = {"thumb": 320, "medium": 800, "large": 1600}
+    image_jpeg_quality: int = 85
+    image_webp_quality: int = 80
+    image_workers: int = 2
 
     secret_key: str = "change-me-in-env"
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 60
+    # Changing the cost rehashes each local password at its owner's next login.
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 1
+    # Hash/verify calls allowed to wait for a worker before new ones are rejected with 503.
+    password_hash_max_pending: int = 32
+
+    catalog_cache_max_entries: int = 1024
+    catalog_cache_ttl_seconds: float = 300.0
+    catalog_version_refresh_seconds: float = 1.0
+    product_fragment_cache_max_entries: int = 20000
+    product_fragment_cache_ttl_seconds: float = 3600.0
+    principal_cache_max_entries: int = 10000
+    principal_cache_ttl_seconds: float = 30.0
+
+    translation_backend: str = "google"
+    translation_timeout_seconds: float = 8.0
+    translation_memo_max_entries: int = 10000
+    translation_memo_ttl_seconds: float = 86400.0
+    translation_worker_enabled: bool = True
+    translation_workers: int = 4
+    translation_poll_seconds: float = 2.0
+    translation_max_attempts: int = 5
+    translation_retry_base_seconds: float = 5.0
+    translation_retry_max_seconds: float = 600.0
+    # A running job whose claim is older than this is assumed orphaned and queued again.
+    translation_job_lease_seconds: float = 300.0
 
     google_client_id: str = ""
     google_client_secret: str = ""
+    google_jwks_url: str = "https://www.googleapis.com/oauth2/v3/certs"
     admin_emails: Annotated[List[str], NoDecode] = []
 
     @staticmethod
@@ -1,205 +1,110 @@
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from .config import settings
 
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False},
-)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+def async_database_url(database_url: str) -> str:
+    """Swap the sync DBAPI driver in ``database_url`` for its asyncio counterpart."""
+    url = make_url(database_url)
+    drivername = ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
 
 
-def init_db():
-    # Ensure all models are imported before metadata creation.
-    from .models import Category, Product, ProductImage, User  # noqa: F401
+def _is_memory_sqlite(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
 
-    Base.metadata.create_all(bind=engine)
-    _run_sqlite_migrations()
 
+def engine_options(database_url: str) -> dict:
+    """Dialect-specific ``create_engine`` keyword arguments for the configured profile."""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        options = {"connect_args": {"check_same_thread": False}}
+        if not _is_memory_sqlite(url):
+            options.update(
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                pool_timeout=settings.db_pool_timeout_seconds,
+            )
+        return options
+    return {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+
+
+def sqlite_pragmas(in_memory: bool = False) -> list[tuple[str, str | int]]:
+    pragmas: list[tuple[str, str | int]] = [
+        # Off by default in SQLite; without it ON DELETE CASCADE does nothing.
+        ("foreign_keys", "ON"),
+        ("busy_timeout", settings.sqlite_busy_timeout_ms),
+        ("synchronous", settings.sqlite_synchronous),
+        # Negative cache_size is in KiB rather than pages.
+        ("cache_size", -settings.sqlite_cache_size_kib),
+        ("temp_store", settings.sqlite_temp_store),
+    ]
+    if not in_memory:
+        pragmas.insert(0, ("journal_mode", settings.sqlite_journal_mode))
+        pragmas.append(("mmap_size", settings.sqlite_mmap_size))
+    return pragmas
+
+
+def install_sqlite_pragmas(target_engine) -> None:
+    pragmas = sqlite_pragmas(_is_memory_sqlite(target_engine.url))
+
+    @event.listens_for(target_engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+
+
+engine = create_engine(settings.database_url, **engine_options(settings.database_url))
+if engine.dialect.name == "sqlite":
+    install_sqlite_pragmas(engine)
 
-def _run_sqlite_migrations():
-    if not settings.database_url.startswith("sqlite"):
-        return
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+Base = declarative_base()
 
-    inspector = inspect(engine)
-    tables = set(inspector.get_table_names())
+# Async engine for request handlers; scripts, migrations and the worker use the sync one.
+ASYNC_DATABASE_URL = settings.async_database_url or async_database_url(settings.database_url)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL))
+if async_engine.dialect.name == "sqlite":
+    install_sqlite_pragmas(async_engine.sync_engine)
 
-    with engine.begin() as connection:
-        _migrate_users_table(connection, inspector, tables)
-        _migrate_product_images_table(connection, tables)
-        _migrate_translatable_columns(connection, tables)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
 
-def _migrate_users_table(connection, inspector, tables):
-    if "users" not in tables:
-        return
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
 
-    columns = {column["name"] for column in inspector.get_columns("users")}
-    if "role" not in columns:
-        connection.execute(text("ALTER TABLE users ADD COLUMN role VARCHAR NOT NULL DEFAULT 'user'"))
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
 
-def _migrate_product_images_table(connection, tables):
-    if "product" not in tables:
-        return
 
-    if "product_images" not in tables:
-        connection.execute(
-            text(
-                """
-                CREATE TABLE product_images (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    product_id INTEGER NOT NULL,
-                    image_url VARCHAR NOT NULL,
-                    sort_order INTEGER NOT NULL DEFAULT 0,
-                    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY(product_id) REFERENCES product(id) ON DELETE CASCADE
-                )
-                """
-            )
-        )
-        connection.execute(text("CREATE INDEX IF NOT EXISTS ix_product_images_product_id ON product_images (product_id)"))
-
-    # Keep existing image_url data compatible by seeding the new table once.
-    connection.execute(
-        text(
-            """
-            INSERT INTO product_images (product_id, image_url, sort_order, created_at)
-            SELECT p.id, p.image_url, 0, CURRENT_TIMESTAMP
-            FROM product p
-            LEFT JOIN product_images pi ON pi.product_id = p.id AND pi.sort_order = 0
-            WHERE p.image_url IS NOT NULL AND TRIM(p.image_url) != '' AND pi.id IS NULL
-            """
-        )
-    )
-
-    # Keep legacy image_url column synchronized with the first image.
-    connection.execute(
-        text(
-            """
-            UPDATE product
-            SET image_url = (
-                SELECT pi.image_url
-                FROM product_images pi
-                WHERE pi.product_id = product.id
-                ORDER BY pi.sort_order ASC, pi.id ASC
-                LIMIT 1
-            )
-            WHERE image_url IS NULL OR TRIM(image_url) = ''
-            """
-        )
-    )
-
-
-def _column_exists(table_name: str, column_name: str) -> bool:
-    inspector = inspect(engine)
-    if table_name not in set(inspector.get_table_names()):
-        return False
-    columns = {column["name"] for column in inspector.get_columns(table_name)}
-    return column_name in columns
-
-
-def _add_column_if_missing(connection, table_name: str, column_name: str, sql_type: str):
-    if _column_exists(table_name, column_name):
-        return
-    connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {sql_type}"))
-
-
-def _migrate_translatable_columns(connection, tables):
-    if "categories" in tables:
-        _add_column_if_missing(connection, "categories", "name_ru", "VARCHAR")
-        _add_column_if_missing(connection, "categories", "name_en", "VARCHAR")
-        connection.execute(text("UPDATE categories SET name_ru = name WHERE name_ru IS NULL OR TRIM(name_ru) = ''"))
-        connection.execute(text("UPDATE categories SET name_en = name WHERE name_en IS NULL OR TRIM(name_en) = ''"))
-
-    if "product" in tables:
-        _add_column_if_missing(connection, "product", "name_ru", "VARCHAR")
-        _add_column_if_missing(connection, "product", "name_en", "VARCHAR")
-        _add_column_if_missing(connection, "product", "description_ru", "TEXT")
-        _add_column_if_missing(connection, "product", "description_en", "TEXT")
-
-        connection.execute(text("UPDATE product SET name_ru = name WHERE name_ru IS NULL OR TRIM(name_ru) = ''"))
-        connection.execute(text("UPDATE product SET name_en = name WHERE name_en IS NULL OR TRIM(name_en) = ''"))
-        connection.execute(text("UPDATE product SET description_ru = description WHERE description_ru IS NULL"))
-        connection.execute(text("UPDATE product SET description_en = description WHERE description_en IS NULL"))
-
-    _backfill_translations(connection, tables)
-
-
-def _needs_translation(source_value: str | None, ru_value: str | None, en_value: str | None) -> bool:
-    source = (source_value or "").strip()
-    if not source:
-        return False
-    ru = (ru_value or "").strip()
-    en = (en_value or "").strip()
-    if not ru or not en:
-        return True
-    return ru == source and en == source
-
-
-def _backfill_translations(connection, tables):
-    from .services.translation_service import TranslationService
-
-    if "categories" in tables:
-        categories = connection.execute(text("SELECT id, name, name_ru, name_en FROM categories")).mappings().all()
-        for category in categories:
-            if not _needs_translation(category["name"], category["name_ru"], category["name_en"]):
-                continue
-            name_ru, name_en = TranslationService.build_ru_en(category["name"])
-            connection.execute(
-                text("UPDATE categories SET name_ru = :name_ru, name_en = :name_en WHERE id = :id"),
-                {"id": category["id"], "name_ru": name_ru, "name_en": name_en},
-            )
+def init_db():
+    """Bring the schema up to date; a no-op beyond one version lookup on a migrated database."""
+    from .migrations import run_migrations
 
-    if "product" in tables:
-        products = connection.execute(
-            text("SELECT id, name, name_ru, name_en, description, description_ru, description_en FROM product")
-        ).mappings().all()
-        for product in products:
-            update_payload: dict[str, str | int | None] = {"id": product["id"]}
-            should_update = False
-
-            if _needs_translation(product["name"], product["name_ru"], product["name_en"]):
-                name_ru, name_en = TranslationService.build_ru_en(product["name"])
-                update_payload["name_ru"] = name_ru
-                update_payload["name_en"] = name_en
-                should_update = True
-
-            if _needs_translation(product["description"], product["description_ru"], product["description_en"]):
-                description_ru, description_en = TranslationService.build_ru_en(product["description"])
-                update_payload["description_ru"] = description_ru
-                update_payload["description_en"] = description_en
-                should_update = True
-
-            if should_update:
-                connection.execute(
-                    text(
-                        """
-                        UPDATE product
-                        SET name_ru = COALESCE(:name_ru, name_ru),
-                            name_en = COALESCE(:name_en, name_en),
-                            description_ru = COALESCE(:description_ru, description_ru),
-                            description_en = COALESCE(:description_en, description_en)
-                        WHERE id = :id
-                        """
-                    ),
-                    {
-                        "id": update_payload["id"],
-                        "name_ru": update_payload.get("name_ru"),
-                        "name_en": update_payload.get("name_en"),
-                        "description_ru": update_payload.get("description_ru"),
-                        "description_en": update_payload.get("description_en"),
-                    },
-                )
+    return run_migrations(engine)
@@ -1,11 +1,20 @@
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
 from .config import settings
-from .database import init_db
+from .database import async_engine, engine, init_db
+from .migrations import pending_migrations
 from .routes import categories_router, products_router, cart_router, auth_router, admin_router
+from .services.google_id_token import google_keys
+from .services.image_processing import shutdown_image_workers
+from .static_files import ImageStaticFiles
+from .services.translation_jobs import translation_worker
+
+logger = logging.getLogger(__name__)
 
 Path(settings.static_dir).mkdir(parents=True, exist_ok=True)
 Path(settings.images_dir).mkdir(parents=True, exist_ok=True)
@@ -23,8 +32,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Cart-Token"],
 )
 
+# Mounted before "/static" so image requests reach it first.
+app.mount("/static/images", ImageStaticFiles(directory=settings.images_dir), name="images")
 app.mount("/static", StaticFiles(directory=settings.static_dir), name="static")
 
 app.include_router(categories_router)
@@ -35,8 +47,25 @@ app.include_router(admin_router)
 
 
 @app.on_event("startup")
-def on_startup():
-    init_db()
+async def on_startup():
+    if settings.migrate_on_startup:
+        init_db()
+    else:
+        pending = pending_migrations(engine)
+        if pending:
+            logger.warning("Database has unapplied migrations: %s; run `python -m app.cli migrate`", pending)
+    if settings.translation_worker_enabled:
+        await translation_worker.start()
+    if settings.google_client_id:
+        # Warm the signing keys so the first Google login does not wait for them.
+        google_keys.refresh_in_background()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await translation_worker.stop()
+    await async_engine.dispose()
+    shutdown_image_workers()
 
 
 @app.get("/")
@@ -0,0 +1,259 @@
+"""Numbered schema migrations recorded in the ``schema_version`` table.
+
+Each migration runs once, in its own transaction, and its number is stored when it
+commits; a database that is up to date costs a single ``SELECT MAX(version)``.
+
+Migration 1 creates every table from the current models, so a fresh database gets the
+latest schema in one step and the later migrations must stay idempotent (create with
+``checkfirst``, add columns only when missing).
+"""
+
+import logging
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import func, insert, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from .database import Base
+from .models.schema_version import SchemaVersion
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS: list[tuple[int, str, tuple[str, ...] | None, Callable[[Connection], None]]] = []
+
+
+def migration(version: int, name: str, dialects: tuple[str, ...] | None = None):
+    """Register a migration; ``dialects`` limits it to those database backends."""
+
+    def register(fn: Callable[[Connection], None]) -> Callable[[Connection], None]:
+        MIGRATIONS.append((version, name, dialects, fn))
+        MIGRATIONS.sort(key=lambda item: item[0])
+        return fn
+
+    return register
+
+
+def latest_version() -> int:
+    return MIGRATIONS[-1][0] if MIGRATIONS else 0
+
+
+def current_version(engine: Engine) -> int:
+    with engine.connect() as connection:
+        try:
+            return connection.scalar(select(func.max(SchemaVersion.version))) or 0
+        except (OperationalError, ProgrammingError):
+            return 0
+
+
+def pending_migrations(engine: Engine) -> list[tuple[int, str]]:
+    applied = current_version(engine)
+    return [(version, name) for version, name, _, _ in MIGRATIONS if version > applied]
+
+
+def run_migrations(engine: Engine) -> list[int]:
+    applied = current_version(engine)
+    if applied >= latest_version():
+        return []
+
+    SchemaVersion.__table__.create(bind=engine, checkfirst=True)
+    dialect_name = engine.dialect.name
+    newly_applied: list[int] = []
+    for version, name, dialects, fn in MIGRATIONS:
+        if version <= applied:
+            continue
+        with engine.begin() as connection:
+            if dialects is None or dialect_name in dialects:
+                logger.info("Applying migration %s: %s", version, name)
+                fn(connection)
+            connection.execute(insert(SchemaVersion).values(version=version, name=name, applied_at=datetime.utcnow()))
+        newly_applied.append(version)
+    return newly_applied
+
+
+def _column_exists(connection: Connection, table_name: str, column_name: str) -> bool:
+    inspector = inspect(connection)
+    if not inspector.has_table(table_name):
+        return False
+    return column_name in {column["name"] for column in inspector.get_columns(table_name)}
+
+
+def _add_column_if_missing(connection: Connection, table_name: str, column_name: str, sql_type: str) -> None:
+    if _column_exists(connection, table_name, column_name):
+        return
+    connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {sql_type}"))
+
+
+@migration(1, "initial_schema")
+def _initial_schema(connection: Connection) -> None:
+    from . import models  # noqa: F401  # register every model on Base.metadata
+
+    Base.metadata.create_all(bind=connection)
+
+
+@migration(2, "users_role_column", dialects=("sqlite",))
+def _users_role_column(connection: Connection) -> None:
+    _add_column_if_missing(connection, "users", "role", "VARCHAR NOT NULL DEFAULT 'user'")
+
+
+@migration(3, "product_images_table", dialects=("sqlite",))
+def _product_images_table(connection: Connection) -> None:
+    # The table itself comes from migration 1; copy legacy single-image data into it once.
+    connection.execute(
+        text(
+            """
+            INSERT INTO product_images (product_id, image_url, sort_order, created_at)
+            SELECT p.id, p.image_url, 0, CURRENT_TIMESTAMP
+            FROM product p
+            LEFT JOIN product_images pi ON pi.product_id = p.id AND pi.sort_order = 0
+            WHERE p.image_url IS NOT NULL AND TRIM(p.image_url) != '' AND pi.id IS NULL
+            """
+        )
+    )
+
+    # Keep legacy image_url column synchronized with the first image.
+    connection.execute(
+        text(
+            """
+            UPDATE product
+            SET image_url = (
+                SELECT pi.image_url
+                FROM product_images pi
+                WHERE pi.product_id = product.id
+                ORDER BY pi.sort_order ASC, pi.id ASC
+                LIMIT 1
+            )
+            WHERE image_url IS NULL OR TRIM(image_url) = ''
+            """
+        )
+    )
+
+
+@migration(4, "translatable_columns", dialects=("sqlite",))
+def _translatable_columns(connection: Connection) -> None:
+    _add_column_if_missing(connection, "categories", "name_ru", "VARCHAR")
+    _add_column_if_missing(connection, "categories", "name_en", "VARCHAR")
+    connection.execute(text("UPDATE categories SET name_ru = name WHERE name_ru IS NULL OR TRIM(name_ru) = ''"))
+    connection.execute(text("UPDATE categories SET name_en = name WHERE name_en IS NULL OR TRIM(name_en) = ''"))
+
+    _add_column_if_missing(connection, "product", "name_ru", "VARCHAR")
+    _add_column_if_missing(connection, "product", "name_en", "VARCHAR")
+    _add_column_if_missing(connection, "product", "description_ru", "TEXT")
+    _add_column_if_missing(connection, "product", "description_en", "TEXT")
+    connection.execute(text("UPDATE product SET name_ru = name WHERE name_ru IS NULL OR TRIM(name_ru) = ''"))
+    connection.execute(text("UPDATE product SET name_en = name WHERE name_en IS NULL OR TRIM(name_en) = ''"))
+    connection.execute(text("UPDATE product SET description_ru = description WHERE description_ru IS NULL"))
+    connection.execute(text("UPDATE product SET description_en = description WHERE description_en IS NULL"))
+
+
+@migration(5, "product_search_index")
+def _product_search_index(connection: Connection) -> None:
+    from .repositories.search_index import ensure_search_index
+
+    ensure_search_index(connection)
+
+
+@migration(6, "catalog_state_row")
+def _catalog_state_row(connection: Connection) -> None:
+    connection.execute(
+        text(
+            """
+            INSERT INTO catalog_state (id, version, updated_at)
+            SELECT 1, 1, CURRENT_TIMESTAMP
+            WHERE NOT EXISTS (SELECT 1 FROM catalog_state WHERE id = 1)
+            """
+        )
+    )
+
+
+@migration(7, "carts_tables")
+def _carts_tables(connection: Connection) -> None:
+    from .models.cart import Cart
+    from .models.cart_item import CartItem
+
+    Cart.__table__.create(bind=connection, checkfirst=True)
+    CartItem.__table__.create(bind=connection, checkfirst=True)
+
+
+@migration(8, "product_updated_at")
+def _product_updated_at(connection: Connection) -> None:
+    sql_type = "TIMESTAMP" if connection.dialect.name == "postgresql" else "DATETIME"
+    _add_column_if_missing(connection, "product", "updated_at", sql_type)
+    connection.execute(
+        text("UPDATE product SET updated_at = COALESCE(created_at, CURRENT_TIMESTAMP) WHERE updated_at IS NULL")
+    )
+
+
+@migration(9, "product_image_variants")
+def _product_image_variants(connection: Connection) -> None:
+    _add_column_if_missing(connection, "product_images", "width", "INTEGER")
+    _add_column_if_missing(connection, "product_images", "height", "INTEGER")
+    _add_column_if_missing(connection, "product_images", "variants", "JSON")
+
+
+@migration(10, "image_files_table")
+def _image_files_table(connection: Connection) -> None:
+    from .models.image_file import ImageFile
+
+    ImageFile.__table__.create(bind=connection, checkfirst=True)
+    connection.execute(
+        text(
+            """
+            INSERT INTO image_files (image_url, ref_count, created_at)
+            SELECT pi.image_url, COUNT(*), CURRENT_TIMESTAMP
+            FROM product_images pi
+            WHERE NOT EXISTS (SELECT 1 FROM image_files f WHERE f.image_url = pi.image_url)
+            GROUP BY pi.image_url
+            """
+        )
+    )
+
+
+@migration(11, "users_listing_indexes")
+def _users_listing_indexes(connection: Connection) -> None:
+    from .models.user import User
+
+    for index in User.__table__.indexes:
+        if index.name in ("ix_users_role_created_at", "ix_users_provider_created_at"):
+            index.create(bind=connection, checkfirst=True)
+
+
+@migration(12, "product_listing_indexes")
+def _product_listing_indexes(connection: Connection) -> None:
+    from .models.product import Product
+
+    for index in Product.__table__.indexes:
+        if index.name in ("ix_product_category_id_price", "ix_product_created_at_id"):
+            index.create(bind=connection, checkfirst=True)
+
+
+@migration(13, "category_stats")
+def _category_stats(connection: Connection) -> None:
+    from .repositories.category_repository import rebuild_category_stats
+
+    sql_type = "TIMESTAMP" if connection.dialect.name == "postgresql" else "DATETIME"
+    _add_column_if_missing(connection, "categories", "product_count", "INTEGER NOT NULL DEFAULT 0")
+    _add_column_if_missing(connection, "categories", "min_price", "FLOAT")
+    _add_column_if_missing(connection, "categories", "max_price", "FLOAT")
+    _add_column_if_missing(connection, "categories", "products_updated_at", sql_type)
+    connection.execute(rebuild_category_stats())
+
+
+@migration(14, "weighted_search_vector", dialects=("postgresql",))
+def _weighted_search_vector(connection: Connection) -> None:
+    from .repositories.search_index import ensure_search_index
+
+    # A generated column cannot be altered in place; dropping it also drops its GIN index.
+    connection.execute(text("ALTER TABLE product DROP COLUMN IF EXISTS search_vector"))
+    ensure_search_index(connection)
+
+
+@migration(15, "product_created_at_not_null")
+def _product_created_at_not_null(connection: Connection) -> None:
+    # Keyset pages compare created_at with the cursor, which never matches a NULL.
+    connection.execute(
+        text("UPDATE product SET created_at = COALESCE(updated_at, CURRENT_TIMESTAMP) WHERE created_at IS NULL")
+    )
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("ALTER TABLE product ALTER COLUMN created_at SET NOT NULL"))
@@ -1,6 +1,27 @@
+from .backfill_checkpoint import BackfillCheckpoint
+from .cart import Cart
+from .cart_item import CartItem
+from .catalog_state import CatalogState
 from .category import Category
+from .image_file import ImageFile
 from .product import Product
 from .product_image import ProductImage
+from .schema_version import SchemaVersion
+from .translation import Translation
+from .translation_job import TranslationJob
 from .user import User
 
-__all__ = ["Category", "Product", "ProductImage", "User"]
+__all__ = [
+    "BackfillCheckpoint",
+    "Cart",
+    "CartItem",
+    "CatalogState",
+    "Category",
+    "ImageFile",
+    "Product",
+    "ProductImage",
+    "SchemaVersion",
+    "Translation",
+    "TranslationJob",
+    "User",
+]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, DateTime, Float, Integer, String
 from sqlalchemy.orm import relationship
 from ..database import Base
 
@@ -11,6 +11,11 @@ class Category(Base):
     name_ru = Column(String, nullable=True)
     name_en = Column(String, nullable=True)
     slug = Column(String, unique=True, nullable=False, index=True)
+    # Aggregates over the category's products, kept current by the product write paths.
+    product_count = Column(Integer, nullable=False, default=0)
+    min_price = Column(Float, nullable=True)
+    max_price = Column(Float, nullable=True)
+    products_updated_at = Column(DateTime, nullable=True)
 
     products = relationship("Product", back_populates="category")
 
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from ..database import Base
+
+
+class ImageFile(Base):
+    """How many ``product_images`` rows point at one stored file; the file goes when this hits zero."""
+
+    __tablename__ = "image_files"
+
+    image_url = Column(String, primary_key=True)
+    ref_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<ImageFile(image_url={self.image_url}, ref_count={self.ref_count})>"
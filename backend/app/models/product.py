@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from ..database import Base
@@ -8,6 +8,11 @@ from ..database import Base
 
 class Product(Base):
     __tablename__ = "product"
+    __table_args__ = (
+        # Category pages filtered by price or sorted by it; newest-first keyset pages.
+        Index("ix_product_category_id_price", "category_id", "price"),
+        Index("ix_product_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
@@ -19,7 +24,9 @@ class Product(Base):
     price = Column(Float, nullable=False)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
     image_url = Column(String)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Changes on every write to the row; identifies cached serializations of the product.
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     category = relationship("Category", back_populates="products")
     product_images = relationship(
@@ -37,6 +44,10 @@ class Product(Base):
             return [self.image_url]
         return []
 
+    @property
+    def image_details(self) -> list:
+        return [image for image in self.product_images if image.image_url]
+
     @property
     def primary_image_url(self) -> str | None:
         images = self.images
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from ..database import Base
+
+
+class TranslationJob(Base):
+    __tablename__ = "translation_jobs"
+    __table_args__ = (
+        Index("ix_translation_jobs_status_next_attempt_at", "status", "next_attempt_at"),
+        Index("ix_translation_jobs_entity", "entity_type", "entity_id", "field"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    entity_type = Column(String, nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    field = Column(String, nullable=False)
+    source_text = Column(Text, nullable=False)
+    status = Column(String, nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<TranslationJob(id={self.id}, entity='{self.entity_type}:{self.entity_id}', "
+            f"field='{self.field}', status='{self.status}')>"
+        )
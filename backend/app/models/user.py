@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Index, Integer, String, DateTime
 from datetime import datetime
 from ..database import Base
 
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Admin user listing: filter by role or provider, newest first.
+        Index("ix_users_role_created_at", "role", "created_at"),
+        Index("ix_users_provider_created_at", "provider", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, nullable=False, index=True)
@@ -1,5 +1,16 @@
-from .category_repository import CategoryRepository
-from .product_repository import ProductRepository
-from .user_repository import UserRepository
+from .cart_repository import AsyncCartRepository
+from .category_repository import AsyncCategoryRepository, CategoryRepository
+from .image_file_repository import ImageFileRepository
+from .product_repository import AsyncProductRepository, ProductRepository
+from .user_repository import AsyncUserRepository, UserRepository
 
-__all__ = ["CategoryRepository", "ProductRepository", "UserRepository"]
+__all__ = [
+    "AsyncCartRepository",
+    "AsyncCategoryRepository",
+    "AsyncProductRepository",
+    "AsyncUserRepository",
+    "CategoryRepository",
+    "ImageFileRepository",
+    "ProductRepository",
+    "UserRepository",
+]
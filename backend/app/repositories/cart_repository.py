@@ -0,0 +1,116 @@
+import secrets
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.cart import Cart
+from ..models.cart_item import CartItem
+
+
+class AsyncCartRepository:
+    """Persisted carts; every item change is a single-row statement on ``cart_items``."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_user_id(self, user_id: int) -> Optional[Cart]:
+        return await self.db.scalar(select(Cart).where(Cart.user_id == user_id))
+
+    async def get_by_token(self, token: str) -> Optional[Cart]:
+        return await self.db.scalar(select(Cart).where(Cart.token == token))
+
+    async def get_or_create_for_user(self, user_id: int) -> Cart:
+        cart = await self.get_by_user_id(user_id)
+        if cart is not None:
+            return cart
+        try:
+            return await self._create(user_id=user_id)
+        except IntegrityError:
+            # A concurrent request created it first.
+            await self.db.rollback()
+            return await self.get_by_user_id(user_id)
+
+    async def create_anonymous(self) -> Cart:
+        return await self._create(token=secrets.token_urlsafe(32))
+
+    async def _create(self, user_id: int | None = None, token: str | None = None) -> Cart:
+        cart = Cart(user_id=user_id, token=token)
+        self.db.add(cart)
+        await self.db.commit()
+        return cart
+
+    async def get_items(self, cart_id: int) -> list[tuple[int, int]]:
+        """Return ``(product_id, quantity)`` pairs in the order they were first added."""
+        rows = await self.db.execute(
+            select(CartItem.product_id, CartItem.quantity).where(CartItem.cart_id == cart_id).order_by(CartItem.id)
+        )
+        return [(product_id, quantity) for product_id, quantity in rows]
+
+    async def add_quantity(self, cart_id: int, product_id: int, quantity: int) -> int:
+        """Increase an item's quantity, inserting it if absent; returns the new quantity."""
+        new_quantity = await self._increment(cart_id, product_id, quantity)
+        if new_quantity is None:
+            try:
+                await self.db.execute(
+                    insert(CartItem).values(
+                        cart_id=cart_id,
+                        product_id=product_id,
+                        quantity=quantity,
+                        updated_at=datetime.utcnow(),
+                    )
+                )
+                new_quantity = quantity
+            except IntegrityError:
+                await self.db.rollback()
+                new_quantity = await self._increment(cart_id, product_id, quantity)
+        await self.db.commit()
+        return new_quantity
+
+    async def _increment(self, cart_id: int, product_id: int, quantity: int) -> int | None:
+        return await self.db.scalar(
+            update(CartItem)
+            .where(CartItem.cart_id == cart_id, CartItem.product_id == product_id)
+            .values(quantity=CartItem.quantity + quantity, updated_at=datetime.utcnow())
+            .returning(CartItem.quantity)
+        )
+
+    async def set_quantity(self, cart_id: int, product_id: int, quantity: int) -> bool:
+        result = await self.db.execute(
+            update(CartItem)
+            .where(CartItem.cart_id == cart_id, CartItem.product_id == product_id)
+            .values(quantity=quantity, updated_at=datetime.utcnow())
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
+    async def remove_item(self, cart_id: int, product_id: int) -> bool:
+        result = await self.db.execute(
+            delete(CartItem).where(CartItem.cart_id == cart_id, CartItem.product_id == product_id)
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
+    async def claim_for_user(self, cart: Cart, user_id: int) -> bool:
+        """Turn an anonymous cart into the user's cart; False if the user got one meanwhile."""
+        try:
+            await self.db.execute(update(Cart).where(Cart.id == cart.id).values(user_id=user_id, token=None))
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            return False
+        return True
+
+    async def merge(self, source: Cart, target: Cart) -> None:
+        """Add every item of ``source`` to ``target`` and delete ``source``, in one transaction."""
+        now = datetime.utcnow()
+        for product_id, quantity in await self.get_items(source.id):
+            if await self._increment(target.id, product_id, quantity) is None:
+                await self.db.execute(
+                    insert(CartItem).values(cart_id=target.id, product_id=product_id, quantity=quantity, updated_at=now)
+                )
+        await self.db.execute(delete(CartItem).where(CartItem.cart_id == source.id))
+        await self.db.execute(delete(Cart).where(Cart.id == source.id))
+        await self.db.commit()
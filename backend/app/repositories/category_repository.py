@@ -1,28 +1,90 @@
+from datetime import datetime
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
+from ..catalog_version import catalog_version
 from ..models.category import Category
+from ..models.product import Product
 from ..schemas.category import CategoryCreate
 
 
+def select_categories():
+    return select(Category).order_by(Category.id)
+
+
+def select_category_by_id(category_id: int):
+    return select(Category).where(Category.id == category_id)
+
+
+def select_category_by_slug(slug: str):
+    return select(Category).where(Category.slug == slug)
+
+
+def select_category_has_products(category_id: int):
+    return select(select(Product.id).where(Product.category_id == category_id).exists())
+
+
+def category_stats_values() -> dict:
+    """Correlated aggregates for ``update(Category).values(...)``.
+
+    Each is answered from the ``(category_id, price)`` index without touching product rows.
+    """
+    in_category = Product.category_id == Category.id
+    return {
+        "product_count": select(func.count(Product.id)).where(in_category).scalar_subquery(),
+        "min_price": select(func.min(Product.price)).where(in_category).scalar_subquery(),
+        "max_price": select(func.max(Product.price)).where(in_category).scalar_subquery(),
+    }
+
+
+def rebuild_category_stats():
+    """Recompute every category's aggregates, dating each to its most recently changed product."""
+    last_updated = select(func.max(Product.updated_at)).where(Product.category_id == Category.id).scalar_subquery()
+    return update(Category).values(**category_stats_values(), products_updated_at=last_updated)
+
+
 class CategoryRepository:
     def __init__(self, db: Session):
         self.db = db
 
     def get_all(self) -> List[Category]:
-        return self.db.query(Category).all()
+        return list(self.db.scalars(select_categories()))
 
     def get_by_id(self, category_id: int) -> Optional[Category]:
-        return self.db.query(Category).filter(Category.id == category_id).first()
+        return self.db.scalars(select_category_by_id(category_id)).first()
 
     def get_by_slug(self, slug: str) -> Optional[Category]:
-        return self.db.query(Category).filter(Category.slug == slug).first()
+        return self.db.scalars(select_category_by_slug(slug)).first()
+
+    def has_products(self, category_id: int) -> bool:
+        return bool(self.db.scalar(select_category_has_products(category_id)))
+
+    def refresh_stats(self, category_ids: Iterable[int]) -> None:
+        """Recompute the product aggregates of ``category_ids`` in the pending transaction."""
+        category_ids = sorted({category_id for category_id in category_ids if category_id is not None})
+        if not category_ids:
+            return
+        self.db.flush()
+        self.db.execute(
+            update(Category)
+            .where(Category.id.in_(category_ids))
+            .values(**category_stats_values(), products_updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+
+    def rebuild_stats(self) -> None:
+        self.db.execute(rebuild_category_stats().execution_options(synchronize_session=False))
+        catalog_version.bump(self.db)
+        self.db.commit()
 
     def create(self, category_data: CategoryCreate, **extra_fields) -> Category:
         payload = category_data.model_dump()
         payload.update(extra_fields)
         db_category = Category(**payload)
         self.db.add(db_category)
+        catalog_version.bump(self.db)
         self.db.commit()
         self.db.refresh(db_category)
         return db_category
@@ -31,10 +93,42 @@ class CategoryRepository:
         for key, value in kwargs.items():
             setattr(category, key, value)
         self.db.add(category)
+        catalog_version.bump(self.db)
         self.db.commit()
         self.db.refresh(category)
         return category
 
+    def apply_translation(self, category_id: int, source_text: str, name_ru: str, name_en: str) -> bool:
+        """Store name translations unless the category was renamed meanwhile."""
+        result = self.db.execute(
+            update(Category)
+            .where(Category.id == category_id, Category.name == source_text)
+            .values(name_ru=name_ru, name_en=name_en)
+        )
+        if result.rowcount == 0:
+            self.db.rollback()
+            return False
+        catalog_version.bump(self.db)
+        self.db.commit()
+        return True
+
     def delete(self, category: Category) -> None:
         self.db.delete(category)
+        catalog_version.bump(self.db)
         self.db.commit()
+
+
+class AsyncCategoryRepository:
+    """Read-only counterpart of ``CategoryRepository`` for ``AsyncSession``."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_all(self) -> List[Category]:
+        return list(await self.db.scalars(select_categories()))
+
+    async def get_by_id(self, category_id: int) -> Optional[Category]:
+        return (await self.db.scalars(select_category_by_id(category_id))).first()
+
+    async def get_by_slug(self, slug: str) -> Optional[Category]:
+        return (await self.db.scalars(select_category_by_slug(slug))).first()
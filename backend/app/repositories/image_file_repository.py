@@ -0,0 +1,56 @@
+from collections import Counter
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.image_file import ImageFile
+
+
+class ImageFileRepository:
+    """Reference counts of stored images. Changes join the caller's transaction; nothing is committed here."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def acquire(self, image_urls: Iterable[str]) -> None:
+        for image_url, count in Counter(image_urls).items():
+            if self._increment(image_url, count):
+                continue
+            try:
+                with self.db.begin_nested():
+                    self.db.execute(
+                        insert(ImageFile).values(image_url=image_url, ref_count=count, created_at=datetime.utcnow())
+                    )
+            except IntegrityError:
+                # Another transaction stored the same file first.
+                self._increment(image_url, count)
+
+    def _increment(self, image_url: str, count: int) -> bool:
+        result = self.db.execute(
+            update(ImageFile)
+            .where(ImageFile.image_url == image_url)
+            .values(ref_count=ImageFile.ref_count + count)
+        )
+        return result.rowcount == 1
+
+    def release(self, image_urls: Iterable[str]) -> None:
+        counts = Counter(image_urls)
+        for image_url, count in counts.items():
+            self.db.execute(
+                update(ImageFile)
+                .where(ImageFile.image_url == image_url)
+                .values(ref_count=ImageFile.ref_count - count)
+            )
+        if counts:
+            self.db.execute(delete(ImageFile).where(ImageFile.image_url.in_(counts), ImageFile.ref_count <= 0))
+
+    def unreferenced(self, image_urls: Iterable[str]) -> list[str]:
+        """The given urls that no product image points at any more, in input order."""
+        candidates = list(dict.fromkeys(image_urls))
+        if not candidates:
+            return []
+        referenced = set(self.db.scalars(select(ImageFile.image_url).where(ImageFile.image_url.in_(candidates))))
+        return [image_url for image_url in candidates if image_url not in referenced]
@@ -0,0 +1,60 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import Select
+
+MAX_PAGE_LIMIT = 100
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(sort: str, values: list) -> str:
+    serialized = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps({"s": sort, "v": serialized}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, sort: str, columns: list) -> list:
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursorError("Cursor is malformed") from exc
+
+    if not isinstance(payload, dict) or payload.get("s") != sort:
+        raise InvalidCursorError("Cursor does not match the requested sort order")
+
+    values = payload.get("v")
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise InvalidCursorError("Cursor is malformed")
+
+    parsed = []
+    for column, value in zip(columns, values):
+        if value is not None and column.type.python_type is datetime:
+            try:
+                value = datetime.fromisoformat(value)
+            except (TypeError, ValueError) as exc:
+                raise InvalidCursorError("Cursor is malformed") from exc
+        parsed.append(value)
+    return parsed
+
+
+def apply_keyset(stmt: Select, order: list[tuple], cursor_values: list | None) -> Select:
+    """Order ``stmt`` by ``order`` and, when given, start right after ``cursor_values``.
+
+    ``order`` is a list of ``(column, descending)`` pairs; the last pair must be a unique column.
+    """
+    if cursor_values is not None:
+        branches = []
+        for index, (column, descending) in enumerate(order):
+            equal_prefix = [prior == cursor_values[prior_index] for prior_index, (prior, _) in enumerate(order[:index])]
+            beyond = column < cursor_values[index] if descending else column > cursor_values[index]
+            branches.append(and_(*equal_prefix, beyond))
+        stmt = stmt.where(or_(*branches))
+
+    return stmt.order_by(*[column.desc() if descending else column.asc() for column, descending in order])
@@ -1,11 +1,373 @@
-from typing import List
+from collections import Counter
+from datetime import datetime
+from typing import Iterator, List
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, case, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from ..catalog_version import catalog_version
+from ..models.category import Category
 from ..models.product import Product
 from ..models.product_image import ProductImage
 from ..schemas.product import ProductCreate
+from .category_repository import CategoryRepository
+from .image_file_repository import ImageFileRepository
+from .pagination import apply_keyset, decode_cursor, encode_cursor
+from .search_index import search_subquery
+
+PRODUCT_SORTS = {
+    "newest": [(Product.created_at, True), (Product.id, True)],
+    "oldest": [(Product.created_at, False), (Product.id, False)],
+    "price_asc": [(Product.price, False), (Product.id, False)],
+    "price_desc": [(Product.price, True), (Product.id, True)],
+}
+# Sorts on the display name; the column depends on the requested locale.
+NAME_SORTS = {"name_asc": False, "name_desc": True}
+NAME_LOCALE_COLUMNS = {"ru": Product.name_ru, "en": Product.name_en}
+
+# Upper bounds of the price facet buckets; the last bucket is open-ended.
+PRICE_BUCKET_BOUNDS = (1000, 5000, 10000, 50000)
+
+
+# Column projections that list queries can select instead of full ``Product`` entities:
+# "summary" feeds ``ProductSummary``, "version" identifies cached JSON fragments.
+PRODUCT_PROJECTIONS = {
+    "summary": ("id", "name", "name_ru", "name_en", "price", "category_id", "image_url", "created_at"),
+    "version": ("id", "updated_at"),
+}
+
+
+def with_product_relations(stmt):
+    """Eager-load everything ``ProductResponse`` reads; async sessions cannot lazy-load."""
+    return stmt.options(joinedload(Product.category), selectinload(Product.product_images))
+
+
+def primary_image_url_column():
+    """The first non-empty ``product_images`` url, else the legacy ``image_url``, as a correlated subquery."""
+    primary_image = (
+        select(ProductImage.image_url)
+        .where(ProductImage.product_id == Product.id, ProductImage.image_url != "")
+        .order_by(ProductImage.sort_order, ProductImage.id)
+        .limit(1)
+        .correlate(Product)
+        .scalar_subquery()
+    )
+    return func.coalesce(primary_image, Product.image_url)
+
+
+def product_projection_columns(projection: str) -> tuple:
+    """Columns for ``projection``, in the order of its ``PRODUCT_PROJECTIONS`` names."""
+    if projection == "summary":
+        return (
+            Product.id,
+            Product.name,
+            Product.name_ru,
+            Product.name_en,
+            Product.price,
+            Product.category_id,
+            primary_image_url_column(),
+            Product.created_at,
+        )
+    return (Product.id, Product.updated_at)
+
+
+def _base_select(projection: str):
+    if projection == "full":
+        return with_product_relations(select(Product))
+    return select(*product_projection_columns(projection))
+
+
+def projection_rows_to_dicts(rows, projection: str) -> list[dict]:
+    names = PRODUCT_PROJECTIONS[projection]
+    return [dict(zip(names, row[:len(names)])) for row in rows]
+
+
+def product_name_column(locale: str | None = None):
+    """The product name in ``locale``, falling back to the source name until it is translated."""
+    translated = NAME_LOCALE_COLUMNS.get(locale)
+    if translated is None:
+        return Product.name
+    return func.coalesce(translated, Product.name)
+
+
+def has_images_clause():
+    """True for products with at least one image, in ``product_images`` or the legacy column."""
+    gallery = (
+        select(ProductImage.id)
+        .where(ProductImage.product_id == Product.id, ProductImage.image_url != "")
+        .exists()
+    )
+    return or_(gallery, func.coalesce(Product.image_url, "") != "")
+
+
+def price_bucket_column():
+    """Index of the ``PRICE_BUCKET_BOUNDS`` bucket holding the product's price."""
+    return case(
+        *[(Product.price < bound, index) for index, bound in enumerate(PRICE_BUCKET_BOUNDS)],
+        else_=len(PRICE_BUCKET_BOUNDS),
+    )
+
+
+def _category_clause(category_id: int | None = None, category_ids=None):
+    ids = set(category_ids or ())
+    if category_id is not None:
+        ids.add(category_id)
+    if not ids:
+        return None
+    if len(ids) == 1:
+        return Product.category_id == next(iter(ids))
+    return Product.category_id.in_(sorted(ids))
+
+
+def _price_clause(min_price: float | None = None, max_price: float | None = None):
+    clauses = []
+    if min_price is not None:
+        clauses.append(Product.price >= min_price)
+    if max_price is not None:
+        clauses.append(Product.price <= max_price)
+    if not clauses:
+        return None
+    return and_(*clauses)
+
+
+def _apply_search(stmt, dialect_name: str, query: str | None, has_images: bool | None):
+    rank_column = None
+    if query:
+        search = search_subquery(dialect_name, query)
+        if search is not None:
+            stmt = stmt.join(search, search.c.product_id == Product.id)
+            rank_column = search.c.rank
+        else:
+            like_pattern = f"%{query.strip()}%"
+            stmt = stmt.where(
+                or_(
+                    Product.name.ilike(like_pattern),
+                    Product.name_ru.ilike(like_pattern),
+                    Product.name_en.ilike(like_pattern),
+                    Product.description.ilike(like_pattern),
+                    Product.description_ru.ilike(like_pattern),
+                    Product.description_en.ilike(like_pattern),
+                )
+            )
+    if has_images is not None:
+        stmt = stmt.where(has_images_clause() if has_images else ~has_images_clause())
+    return stmt, rank_column
+
+
+def apply_product_filters(
+    stmt,
+    dialect_name: str,
+    query: str | None = None,
+    category_id: int | None = None,
+    category_ids=None,
+    min_price: float | None = None,
+    max_price: float | None = None,
+    has_images: bool | None = None,
+):
+    """Apply search and attribute filters and return ``(stmt, rank_column)``.
+
+    ``category_id`` and ``category_ids`` combine into one "any of" filter; the price range is
+    inclusive. ``rank_column`` is the full-text relevance (lower is better) when ``query`` is
+    searched through the index, otherwise ``None``.
+    """
+    stmt, rank_column = _apply_search(stmt, dialect_name, query, has_images)
+    for clause in (_category_clause(category_id, category_ids), _price_clause(min_price, max_price)):
+        if clause is not None:
+            stmt = stmt.where(clause)
+    return stmt, rank_column
+
+
+def resolve_product_order(sort: str, rank_column, locale: str | None = None) -> tuple[str, list[tuple]]:
+    """Return ``(cursor tag, [(column, descending), ...])`` for ``sort``.
+
+    Name sorts are tagged with their locale, so a cursor cannot be reused across languages.
+    """
+    if sort == "relevance":
+        if rank_column is None:
+            return "newest", PRODUCT_SORTS["newest"]
+        return sort, [(rank_column, False), (Product.id, False)]
+    if sort in NAME_SORTS:
+        descending = NAME_SORTS[sort]
+        tag = f"{sort}:{locale if locale in NAME_LOCALE_COLUMNS else 'source'}"
+        return tag, [(product_name_column(locale), descending), (Product.id, descending)]
+    return sort, PRODUCT_SORTS[sort]
+
+
+def select_products(
+    dialect_name: str,
+    query: str | None = None,
+    projection: str = "full",
+    sort: str | None = None,
+    locale: str | None = None,
+    **filters,
+):
+    stmt, rank_column = apply_product_filters(_base_select(projection), dialect_name, query=query, **filters)
+    if sort is not None:
+        _, order = resolve_product_order(sort, rank_column, locale)
+        return apply_keyset(stmt, order, None)
+    if rank_column is not None:
+        stmt = stmt.order_by(rank_column, Product.id)
+    return stmt
+
+
+def select_products_page(
+    dialect_name: str,
+    limit: int,
+    cursor: str | None = None,
+    sort: str = "newest",
+    query: str | None = None,
+    projection: str = "full",
+    locale: str | None = None,
+    **filters,
+):
+    """Return ``(stmt, sort)``; rows are ``(Product, *sort values)`` and one extra row past ``limit``.
+
+    For other projections the leading ``Product`` is replaced by the projection's columns.
+    The returned ``sort`` is the tag to encode into the next cursor.
+    """
+    stmt, rank_column = apply_product_filters(_base_select(projection), dialect_name, query=query, **filters)
+    sort, order = resolve_product_order(sort, rank_column, locale)
+    columns = [column for column, _ in order]
+    cursor_values = decode_cursor(cursor, sort, columns) if cursor else None
+
+    stmt = stmt.add_columns(*columns)
+    return apply_keyset(stmt, order, cursor_values).limit(limit + 1), sort
+
+
+def split_products_page(rows, limit: int, sort: str, projection: str = "full") -> tuple[list, str | None]:
+    if projection == "full":
+        width, products = 1, [row[0] for row in rows]
+    else:
+        width, products = len(PRODUCT_PROJECTIONS[projection]), projection_rows_to_dicts(rows, projection)
+    if len(rows) <= limit:
+        return products, None
+    return products[:limit], encode_cursor(sort, list(rows[limit - 1][width:]))
+
+
+def select_product_count(dialect_name: str, query: str | None = None, **filters):
+    stmt, _ = apply_product_filters(
+        select(func.count(Product.id)).select_from(Product), dialect_name, query=query, **filters
+    )
+    return stmt
+
+
+def select_product_facets(
+    dialect_name: str,
+    query: str | None = None,
+    category_id: int | None = None,
+    category_ids=None,
+    min_price: float | None = None,
+    max_price: float | None = None,
+    has_images: bool | None = None,
+):
+    """One aggregate query behind ``count_product_facets``.
+
+    Each facet ignores its own filter, so the other categories and price ranges stay
+    selectable, but honours all the others. Rather than one query per facet, rows are grouped
+    by category and price bucket plus a flag for each of the two filters, and the flags pick
+    which groups every facet adds up. Flags are only selected for filters that are set.
+    """
+    stmt, _ = _apply_search(select(Product.category_id).select_from(Product), dialect_name, query, has_images)
+    bucket = price_bucket_column()
+    group_by = [Product.category_id, bucket]
+    for clause in (_category_clause(category_id, category_ids), _price_clause(min_price, max_price)):
+        if clause is not None:
+            group_by.append(case((clause, 1), else_=0))
+    return stmt.add_columns(*group_by[1:], func.count(Product.id)).group_by(*group_by)
+
+
+def count_product_facets(
+    rows,
+    category_id: int | None = None,
+    category_ids=None,
+    min_price: float | None = None,
+    max_price: float | None = None,
+    **_,
+) -> dict:
+    """Fold ``select_product_facets`` rows into ``{"total", "categories", "price_buckets"}``."""
+    has_category_flag = _category_clause(category_id, category_ids) is not None
+    has_price_flag = _price_clause(min_price, max_price) is not None
+    total = 0
+    categories: Counter = Counter()
+    price_buckets: Counter = Counter()
+    for row in rows:
+        row_category_id, bucket, *flags, count = row
+        category_match = flags.pop(0) if has_category_flag else 1
+        price_match = flags.pop(0) if has_price_flag else 1
+        if price_match:
+            categories[row_category_id] += count
+        if category_match:
+            price_buckets[bucket] += count
+        if category_match and price_match:
+            total += count
+
+    lower_bounds = (0, *PRICE_BUCKET_BOUNDS)
+    upper_bounds = (*PRICE_BUCKET_BOUNDS, None)
+    return {
+        "total": total,
+        "categories": [
+            {"category_id": key, "count": categories[key]} for key in sorted(categories) if categories[key]
+        ],
+        "price_buckets": [
+            {"min_price": lower_bounds[index], "max_price": upper_bounds[index], "count": price_buckets[index]}
+            for index in range(len(lower_bounds))
+        ],
+    }
+
+
+def select_product_by_id(product_id: int):
+    return with_product_relations(select(Product)).where(Product.id == product_id)
+
+
+def select_products_by_category(category_id: int, projection: str = "full"):
+    return _base_select(projection).where(Product.category_id == category_id)
+
+
+def select_products_by_ids(product_ids: List[int]):
+    return with_product_relations(select(Product)).where(Product.id.in_(product_ids))
+
+
+def select_cart_pricing(product_ids: List[int]):
+    """Rows of ``(id, name, name_ru, name_en, price, image_url)`` for pricing a cart.
+
+    The image comes from ``primary_image_url_column`` instead of loading the images.
+    """
+    return select(
+        Product.id,
+        Product.name,
+        Product.name_ru,
+        Product.name_en,
+        Product.price,
+        primary_image_url_column(),
+    ).where(Product.id.in_(product_ids))
+
+
+def select_product_export(category_id: int | None = None):
+    """Flat rows for catalog exports, in id order, without loading ORM entities."""
+    stmt = (
+        select(
+            Product.id,
+            Product.name,
+            Product.name_ru,
+            Product.name_en,
+            Product.description,
+            Product.description_ru,
+            Product.description_en,
+            Product.price,
+            Product.category_id,
+            Category.slug.label("category_slug"),
+            Category.name.label("category_name"),
+            primary_image_url_column().label("image_url"),
+            Product.created_at,
+            Product.updated_at,
+        )
+        .join(Category, Category.id == Product.category_id)
+        .order_by(Product.id)
+    )
+    if category_id is not None:
+        stmt = stmt.where(Product.category_id == category_id)
+    return stmt
 
 
 class ProductRepository:
@@ -27,81 +389,275 @@ class ProductRepository:
             return image_urls[0]
         return fallback
 
-    def get_all(self, query: str | None = None) -> List[Product]:
-        q = self.db.query(Product).options(joinedload(Product.category), joinedload(Product.product_images))
-        if query:
-            like_pattern = f"%{query.strip()}%"
-            q = q.filter(
-                or_(
-                    Product.name.ilike(like_pattern),
-                    Product.name_ru.ilike(like_pattern),
-                    Product.name_en.ilike(like_pattern),
-                    Product.description.ilike(like_pattern),
-                    Product.description_ru.ilike(like_pattern),
-                    Product.description_en.ilike(like_pattern),
-                )
-            )
-        return q.all()
+    @staticmethod
+    def _build_images(
+        image_urls: list[str],
+        image_metadata: dict[str, dict] | None = None,
+        existing: list[ProductImage] | None = None,
+    ) -> list[ProductImage]:
+        """ProductImage rows in ``image_urls`` order, reusing existing rows (and their variants) by url."""
+        existing_by_url = {image.image_url: image for image in existing or []}
+        images = []
+        for index, image_url in enumerate(image_urls):
+            image = existing_by_url.pop(image_url, None) or ProductImage(image_url=image_url)
+            image.sort_order = index
+            metadata = (image_metadata or {}).get(image_url)
+            if metadata:
+                image.width = metadata["width"]
+                image.height = metadata["height"]
+                image.variants = metadata["variants"]
+            images.append(image)
+        return images
 
-    def get_by_id(self, product_id: int) -> Product:
-        return (
-            self.db.query(Product)
-            .options(joinedload(Product.category), joinedload(Product.product_images))
-            .filter(Product.id == product_id)
-            .first()
+    @property
+    def _dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    def get_all(
+        self,
+        query: str | None = None,
+        sort: str | None = None,
+        locale: str | None = None,
+        **filters,
+    ) -> List[Product]:
+        stmt = select_products(self._dialect_name, query=query, sort=sort, locale=locale, **filters)
+        return list(self.db.scalars(stmt).unique())
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        sort: str = "newest",
+        query: str | None = None,
+        locale: str | None = None,
+        **filters,
+    ) -> tuple[List[Product], str | None]:
+        stmt, sort = select_products_page(
+            self._dialect_name, limit, cursor=cursor, sort=sort, query=query, locale=locale, **filters
         )
+        return split_products_page(self.db.execute(stmt).all(), limit, sort)
+
+    def count(self, query: str | None = None, **filters) -> int:
+        return self.db.scalar(select_product_count(self._dialect_name, query=query, **filters)) or 0
+
+    def get_facets(self, query: str | None = None, **filters) -> dict:
+        rows = self.db.execute(select_product_facets(self._dialect_name, query=query, **filters))
+        return count_product_facets(rows, **filters)
+
+    def get_by_id(self, product_id: int) -> Product:
+        return self.db.scalars(select_product_by_id(product_id)).unique().first()
 
     def get_by_category(self, category_id: int) -> List[Product]:
-        return (
-            self.db.query(Product)
-            .options(joinedload(Product.category), joinedload(Product.product_images))
-            .filter(Product.category_id == category_id)
-            .all()
-        )
+        return list(self.db.scalars(select_products_by_category(category_id)).unique())
 
-    def create(self, product_data: ProductCreate, image_urls: list[str] | None = None, **extra_fields) -> Product:
+    def create(
+        self,
+        product_data: ProductCreate,
+        image_urls: list[str] | None = None,
+        image_metadata: dict[str, dict] | None = None,
+        **extra_fields,
+    ) -> Product:
         normalized_images = self._normalize_image_urls(image_urls)
         payload = product_data.model_dump()
         payload.update(extra_fields)
         payload["image_url"] = self._resolve_primary_image_url(normalized_images, payload.get("image_url"))
 
         db_product = Product(**payload)
-        db_product.product_images = [
-            ProductImage(image_url=image_url, sort_order=index)
-            for index, image_url in enumerate(normalized_images)
-        ]
+        db_product.product_images = self._build_images(normalized_images, image_metadata)
         self.db.add(db_product)
+        ImageFileRepository(self.db).acquire(normalized_images)
+        CategoryRepository(self.db).refresh_stats([db_product.category_id])
+        catalog_version.bump(self.db)
         self.db.commit()
         self.db.refresh(db_product)
         return db_product
 
+    def create_many(self, items: list[tuple[ProductCreate, list[str]]]) -> list[int]:
+        """Insert ``(product, image urls)`` pairs in one transaction with executemany; returns the new ids in order."""
+        if not items:
+            return []
+        now = datetime.utcnow()
+        product_rows = []
+        for product_data, image_urls in items:
+            payload = product_data.model_dump()
+            payload["image_url"] = self._resolve_primary_image_url(image_urls, payload.get("image_url"))
+            payload.update(
+                name_ru=product_data.name,
+                name_en=product_data.name,
+                description_ru=product_data.description,
+                description_en=product_data.description,
+                created_at=now,
+                updated_at=now,
+            )
+            product_rows.append(payload)
+        product_ids = list(
+            self.db.scalars(insert(Product).returning(Product.id, sort_by_parameter_order=True), product_rows)
+        )
+
+        image_rows = [
+            {"product_id": product_id, "image_url": image_url, "sort_order": index, "created_at": now}
+            for product_id, (_, image_urls) in zip(product_ids, items)
+            for index, image_url in enumerate(image_urls)
+        ]
+        if image_rows:
+            self.db.execute(insert(ProductImage), image_rows)
+            ImageFileRepository(self.db).acquire(row["image_url"] for row in image_rows)
+        CategoryRepository(self.db).refresh_stats(row["category_id"] for row in product_rows)
+        catalog_version.bump(self.db)
+        self.db.commit()
+        return product_ids
+
     def get_multiple_by_ids(self, product_ids: List[int]) -> List[Product]:
-        return (
-            self.db.query(Product)
-            .options(joinedload(Product.category), joinedload(Product.product_images))
-            .filter(Product.id.in_(product_ids))
-            .all()
+        return list(self.db.scalars(select_products_by_ids(product_ids)).unique())
+
+    def iter_export_rows(self, category_id: int | None = None, batch_size: int = 1000) -> Iterator:
+        """Stream export rows ``batch_size`` at a time over a server-side cursor."""
+        result = self.db.execute(select_product_export(category_id).execution_options(yield_per=batch_size))
+        for row in result:
+            yield row._mapping
+
+    def get_image_metadata(self, image_urls: list[str]) -> dict[str, dict]:
+        """Dimensions and variants already recorded for these urls on any product."""
+        if not image_urls:
+            return {}
+        rows = self.db.execute(
+            select(ProductImage.image_url, ProductImage.width, ProductImage.height, ProductImage.variants).where(
+                ProductImage.image_url.in_(image_urls),
+                ProductImage.variants.is_not(None),
+            )
         )
+        return {
+            image_url: {"width": width, "height": height, "variants": variants}
+            for image_url, width, height, variants in rows
+        }
+
+    def get_cart_pricing(self, product_ids: List[int]) -> list[tuple]:
+        return [tuple(row) for row in self.db.execute(select_cart_pricing(product_ids))]
 
-    def update(self, product: Product, image_urls: list[str] | None = None, replace_images: bool = False, **kwargs) -> Product:
+    def update(
+        self,
+        product: Product,
+        image_urls: list[str] | None = None,
+        replace_images: bool = False,
+        image_metadata: dict[str, dict] | None = None,
+        **kwargs,
+    ) -> Product:
+        previous_category_id = product.category_id
         for key, value in kwargs.items():
             setattr(product, key, value)
 
         normalized_images = self._normalize_image_urls(image_urls)
         if replace_images:
-            product.product_images = [
-                ProductImage(image_url=image_url, sort_order=index)
-                for index, image_url in enumerate(normalized_images)
-            ]
+            previous_images = Counter(image.image_url for image in product.product_images)
+            product.product_images = self._build_images(normalized_images, image_metadata, product.product_images)
+            image_files = ImageFileRepository(self.db)
+            image_files.acquire((Counter(normalized_images) - previous_images).elements())
+            image_files.release((previous_images - Counter(normalized_images)).elements())
             product.image_url = self._resolve_primary_image_url(normalized_images, kwargs.get("image_url"))
         elif normalized_images:
             product.image_url = self._resolve_primary_image_url(normalized_images, product.image_url)
 
+        # Image changes alone do not touch the product row, so bump the version explicitly.
+        product.updated_at = datetime.utcnow()
         self.db.add(product)
+        CategoryRepository(self.db).refresh_stats([previous_category_id, product.category_id])
+        catalog_version.bump(self.db)
         self.db.commit()
         self.db.refresh(product)
         return product
 
+    def apply_translation(self, product_id: int, field: str, source_text: str, value_ru: str, value_en: str) -> bool:
+        """Store translations of ``field`` unless the product's source text changed meanwhile."""
+        source_column = getattr(Product, field)
+        result = self.db.execute(
+            update(Product)
+            .where(Product.id == product_id, source_column == source_text)
+            .values({f"{field}_ru": value_ru, f"{field}_en": value_en})
+        )
+        if result.rowcount == 0:
+            self.db.rollback()
+            return False
+        catalog_version.bump(self.db)
+        self.db.commit()
+        return True
+
     def delete(self, product: Product) -> None:
+        ImageFileRepository(self.db).release(image.image_url for image in product.product_images)
         self.db.delete(product)
+        CategoryRepository(self.db).refresh_stats([product.category_id])
+        catalog_version.bump(self.db)
         self.db.commit()
+
+
+class AsyncProductRepository:
+    """Read-only counterpart of ``ProductRepository`` for ``AsyncSession``."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @property
+    def _dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    async def get_all(
+        self,
+        query: str | None = None,
+        projection: str = "full",
+        sort: str | None = None,
+        locale: str | None = None,
+        **filters,
+    ) -> list:
+        """Products, or dicts of the projection's fields for any projection but "full"."""
+        stmt = select_products(
+            self._dialect_name, query=query, projection=projection, sort=sort, locale=locale, **filters
+        )
+        if projection != "full":
+            return projection_rows_to_dicts(await self.db.execute(stmt), projection)
+        return list((await self.db.scalars(stmt)).unique())
+
+    async def get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        sort: str = "newest",
+        query: str | None = None,
+        projection: str = "full",
+        locale: str | None = None,
+        **filters,
+    ) -> tuple[list, str | None]:
+        stmt, sort = select_products_page(
+            self._dialect_name,
+            limit,
+            cursor=cursor,
+            sort=sort,
+            query=query,
+            projection=projection,
+            locale=locale,
+            **filters,
+        )
+        return split_products_page((await self.db.execute(stmt)).all(), limit, sort, projection=projection)
+
+    async def count(self, query: str | None = None, **filters) -> int:
+        return await self.db.scalar(select_product_count(self._dialect_name, query=query, **filters)) or 0
+
+    async def get_facets(self, query: str | None = None, **filters) -> dict:
+        rows = await self.db.execute(select_product_facets(self._dialect_name, query=query, **filters))
+        return count_product_facets(rows, **filters)
+
+    async def get_by_id(self, product_id: int) -> Product | None:
+        return (await self.db.scalars(select_product_by_id(product_id))).unique().first()
+
+    async def get_by_category(self, category_id: int, projection: str = "full") -> list:
+        stmt = select_products_by_category(category_id, projection=projection)
+        if projection != "full":
+            return projection_rows_to_dicts(await self.db.execute(stmt), projection)
+        return list((await self.db.scalars(stmt)).unique())
+
+    async def get_multiple_by_ids(self, product_ids: List[int]) -> List[Product]:
+        return list((await self.db.scalars(select_products_by_ids(product_ids))).unique())
+
+    async def get_cart_pricing(self, product_ids: List[int]) -> list[tuple]:
+        return [tuple(row) for row in await self.db.execute(select_cart_pricing(product_ids))]
+
+    async def exists(self, product_id: int) -> bool:
+        return await self.db.scalar(select(Product.id).where(Product.id == product_id)) is not None
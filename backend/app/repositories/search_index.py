@@ -0,0 +1,172 @@
+import re
+
+from sqlalchemy import Float, func, literal_column, select, table, text
+from sqlalchemy.engine import Connection
+
+from ..models.product import Product
+
+SEARCH_TABLE = "product_search"
+SEARCH_NAME_COLUMNS = ("name", "name_ru", "name_en")
+SEARCH_DESCRIPTION_COLUMNS = ("description", "description_ru", "description_en")
+SEARCH_COLUMNS = SEARCH_NAME_COLUMNS + SEARCH_DESCRIPTION_COLUMNS
+# Product name matches outrank description matches in BM25 scoring.
+SEARCH_COLUMN_WEIGHTS = (10.0, 10.0, 10.0, 1.0, 1.0, 1.0)
+# The same ratio for Postgres, where names are tsvector weight A and descriptions weight B.
+# ts_rank takes the weights in {D, C, B, A} order.
+POSTGRES_RANK_WEIGHTS = "{0, 0, 0.1, 1.0}"
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def _tokenize(query: str) -> list[str]:
+    return _TOKEN_PATTERN.findall((query or "").lower())
+
+
+def _sqlite_match_expression(query: str) -> str | None:
+    tokens = _tokenize(query)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def _postgres_tsquery_expression(query: str) -> str | None:
+    tokens = _tokenize(query)
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*" for token in tokens)
+
+
+def search_subquery(dialect_name: str, query: str):
+    """Return a ``(product_id, rank)`` subquery for ``query``, lower rank meaning a better match.
+
+    Returns ``None`` when the dialect has no full-text index, so callers can fall back to LIKE.
+    """
+    if dialect_name == "sqlite":
+        match_expression = _sqlite_match_expression(query)
+        search_table = table(SEARCH_TABLE)
+        stmt = select(
+            literal_column(f"{SEARCH_TABLE}.rowid").label("product_id"),
+            func.bm25(literal_column(SEARCH_TABLE), *SEARCH_COLUMN_WEIGHTS, type_=Float).label("rank"),
+        ).select_from(search_table)
+        if match_expression is None:
+            return stmt.where(literal_column("0") == 1).subquery("search")
+        return stmt.where(literal_column(SEARCH_TABLE).op("MATCH")(match_expression)).subquery("search")
+
+    if dialect_name == "postgresql":
+        ts_expression = _postgres_tsquery_expression(query)
+        search_vector = literal_column("product.search_vector")
+        if ts_expression is None:
+            return select(Product.id.label("product_id"), literal_column("0.0", Float).label("rank")).where(
+                literal_column("false")
+            ).subquery("search")
+        ts_query = func.to_tsquery("simple", ts_expression)
+        return (
+            select(
+                Product.id.label("product_id"),
+                (
+                    -func.ts_rank(
+                        literal_column(f"'{POSTGRES_RANK_WEIGHTS}'::float4[]"), search_vector, ts_query, type_=Float
+                    )
+                ).label("rank"),
+            )
+            .where(search_vector.op("@@")(ts_query))
+            .subquery("search")
+        )
+
+    return None
+
+
+def ensure_search_index(connection: Connection) -> None:
+    dialect_name = connection.dialect.name
+    if dialect_name == "sqlite":
+        _ensure_sqlite_index(connection)
+    elif dialect_name == "postgresql":
+        _ensure_postgres_index(connection)
+
+
+def rebuild_search_index(connection: Connection) -> None:
+    dialect_name = connection.dialect.name
+    if dialect_name == "sqlite":
+        _ensure_sqlite_index(connection)
+        connection.execute(text(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')"))
+        connection.execute(text(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')"))
+    elif dialect_name == "postgresql":
+        _ensure_postgres_index(connection)
+        connection.execute(text("REINDEX INDEX ix_product_search_vector"))
+
+
+def _ensure_sqlite_index(connection: Connection) -> None:
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": SEARCH_TABLE},
+    ).first()
+    if exists:
+        return
+
+    columns = ", ".join(SEARCH_COLUMNS)
+    new_values = ", ".join(f"new.{column}" for column in SEARCH_COLUMNS)
+    old_values = ", ".join(f"old.{column}" for column in SEARCH_COLUMNS)
+
+    connection.execute(
+        text(
+            f"""
+            CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5(
+                {columns},
+                content='product',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3'
+            )
+            """
+        )
+    )
+    connection.execute(
+        text(
+            f"""
+            CREATE TRIGGER {SEARCH_TABLE}_ai AFTER INSERT ON product BEGIN
+                INSERT INTO {SEARCH_TABLE}(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+            """
+        )
+    )
+    connection.execute(
+        text(
+            f"""
+            CREATE TRIGGER {SEARCH_TABLE}_ad AFTER DELETE ON product BEGIN
+                INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            END
+            """
+        )
+    )
+    connection.execute(
+        text(
+            f"""
+            CREATE TRIGGER {SEARCH_TABLE}_au AFTER UPDATE OF {columns} ON product BEGIN
+                INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO {SEARCH_TABLE}(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+            """
+        )
+    )
+    connection.execute(text(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')"))
+
+
+def _postgres_weighted_document(columns: tuple[str, ...], weight: str) -> str:
+    document = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+    return f"setweight(to_tsvector('simple', {document}), '{weight}')"
+
+
+def _ensure_postgres_index(connection: Connection) -> None:
+    name_document = _postgres_weighted_document(SEARCH_NAME_COLUMNS, "A")
+    description_document = _postgres_weighted_document(SEARCH_DESCRIPTION_COLUMNS, "B")
+    connection.execute(
+        text(
+            f"""
+            ALTER TABLE product ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS ({name_document} || {description_document}) STORED
+            """
+        )
+    )
+    connection.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_product_search_vector ON product USING GIN (search_vector)")
+    )
@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import Session
+
+from ..models.translation_job import TranslationJob
+
+
+class TranslationJobRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(self, entity_type: str, entity_id: int, field: str, source_text: str) -> TranslationJob:
+        """Queue a translation, reusing a not-yet-finished job for the same entity field."""
+        job = self.db.scalar(
+            select(TranslationJob).where(
+                TranslationJob.entity_type == entity_type,
+                TranslationJob.entity_id == entity_id,
+                TranslationJob.field == field,
+                TranslationJob.status.in_(("pending", "failed")),
+            )
+        )
+        now = datetime.utcnow()
+        if job is None:
+            job = TranslationJob(entity_type=entity_type, entity_id=entity_id, field=field)
+        job.source_text = source_text
+        job.status = "pending"
+        job.attempts = 0
+        job.last_error = None
+        job.next_attempt_at = now
+        self.db.add(job)
+        self.db.commit()
+        self.db.refresh(job)
+        return job
+
+    def enqueue_many(self, entries: list[tuple[str, int, str, str]]) -> None:
+        """Queue ``(entity_type, entity_id, field, source_text)`` jobs with one executemany INSERT.
+
+        Unlike ``enqueue`` this does not look for an existing job, so use it for new entities only.
+        """
+        if not entries:
+            return
+        now = datetime.utcnow()
+        self.db.execute(
+            insert(TranslationJob),
+            [
+                {
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "field": field,
+                    "source_text": source_text,
+                    "status": "pending",
+                    "attempts": 0,
+                    "next_attempt_at": now,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for entity_type, entity_id, field, source_text in entries
+            ],
+        )
+        self.db.commit()
+
+    def get_by_id(self, job_id: int) -> Optional[TranslationJob]:
+        return self.db.get(TranslationJob, job_id)
+
+    def get_due_ids(self, limit: int) -> List[int]:
+        return list(
+            self.db.scalars(
+                select(TranslationJob.id)
+                .where(TranslationJob.status == "pending", TranslationJob.next_attempt_at <= datetime.utcnow())
+                .order_by(TranslationJob.next_attempt_at, TranslationJob.id)
+                .limit(limit)
+            )
+        )
+
+    def claim(self, job_id: int) -> bool:
+        """Atomically move a pending job to running; False if another worker got it first."""
+        result = self.db.execute(
+            update(TranslationJob)
+            .where(TranslationJob.id == job_id, TranslationJob.status == "pending")
+            .values(status="running", attempts=TranslationJob.attempts + 1, updated_at=datetime.utcnow())
+        )
+        self.db.commit()
+        return result.rowcount == 1
+
+    def mark_done(self, job: TranslationJob) -> None:
+        job.status = "done"
+        job.last_error = None
+        self.db.add(job)
+        self.db.commit()
+
+    def mark_failed(self, job: TranslationJob, error: str, retry_at: datetime | None) -> None:
+        job.last_error = error
+        if retry_at is None:
+            job.status = "failed"
+        else:
+            job.status = "pending"
+            job.next_attempt_at = retry_at
+        self.db.add(job)
+        self.db.commit()
+
+    def requeue_expired(self, lease_seconds: float) -> int:
+        """Return jobs left running past their lease, by a stopped process, to the queue.
+
+        A claim stamps ``updated_at``, so a job another worker is still running keeps its lease.
+        """
+        expired_before = datetime.utcnow() - timedelta(seconds=lease_seconds)
+        result = self.db.execute(
+            update(TranslationJob)
+            .where(TranslationJob.status == "running", TranslationJob.updated_at < expired_before)
+            .values(status="pending", updated_at=datetime.utcnow())
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def get_all(self, status: str | None = None, limit: int = 100) -> List[TranslationJob]:
+        stmt = select(TranslationJob).order_by(TranslationJob.id.desc()).limit(limit)
+        if status:
+            stmt = stmt.where(TranslationJob.status == status)
+        return list(self.db.scalars(stmt))
+
+    def count_by_status(self) -> dict[str, int]:
+        rows = self.db.execute(
+            select(TranslationJob.status, func.count(TranslationJob.id)).group_by(TranslationJob.status)
+        ).all()
+        return {status: count for status, count in rows}
@@ -0,0 +1,42 @@
+from typing import Iterator, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models.translation import Translation
+
+
+class TranslationRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, text_hash: str, source_lang: str, target_lang: str) -> Optional[Translation]:
+        return self.db.scalar(
+            select(Translation).where(
+                Translation.text_hash == text_hash,
+                Translation.source_lang == source_lang,
+                Translation.target_lang == target_lang,
+            )
+        )
+
+    def save(self, text_hash: str, source_lang: str, target_lang: str, source_text: str, translated_text: str) -> None:
+        self.save_many([(text_hash, source_lang, target_lang, source_text, translated_text)])
+
+    def save_many(self, entries: list[tuple[str, str, str, str, str]]) -> None:
+        """Upsert ``(text_hash, source_lang, target_lang, source_text, translated_text)`` rows in one commit."""
+        for text_hash, source_lang, target_lang, source_text, translated_text in entries:
+            translation = self.get(text_hash, source_lang, target_lang)
+            if translation is None:
+                translation = Translation(
+                    text_hash=text_hash,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    source_text=source_text,
+                )
+            translation.translated_text = translated_text
+            self.db.add(translation)
+            self.db.flush()
+        self.db.commit()
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Translation]:
+        return self.db.scalars(select(Translation).order_by(Translation.id).execution_options(yield_per=batch_size))
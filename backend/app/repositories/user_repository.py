@@ -1,27 +1,127 @@
+import sys
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from ..models.user import User
+from .pagination import apply_keyset, decode_cursor, encode_cursor
+
+USER_SORTS = {
+    "newest": [(User.created_at, True), (User.id, True)],
+    "oldest": [(User.created_at, False), (User.id, False)],
+}
+
+
+def select_user_by_id(user_id: int):
+    return select(User).where(User.id == user_id)
+
+
+def select_user_by_email(email: str):
+    return select(User).where(User.email == email)
+
+
+def select_user_by_google_sub(google_sub: str):
+    return select(User).where(User.google_sub == google_sub)
+
+
+def select_user_count_by_role(role: str):
+    return select(func.count(User.id)).where(User.role == role)
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Smallest string greater than every string starting with ``prefix``; ``None`` if unbounded."""
+    stripped = prefix.rstrip(chr(sys.maxunicode))
+    if not stripped:
+        return None
+    return stripped[:-1] + chr(ord(stripped[-1]) + 1)
+
+
+def _email_prefix_filter(dialect_name: str, email_prefix: str):
+    # Emails are stored lower-cased.
+    prefix = email_prefix.strip().lower()
+    if dialect_name != "sqlite":
+        return User.email.startswith(prefix, autoescape=True)
+    # SQLite never uses an index for a case-insensitive LIKE with an ESCAPE clause, but a
+    # range on the BINARY-collated column walks the email index from the prefix onwards.
+    upper_bound = _prefix_upper_bound(prefix)
+    if upper_bound is None:
+        return User.email >= prefix
+    return and_(User.email >= prefix, User.email < upper_bound)
+
+
+def apply_user_filters(
+    stmt,
+    dialect_name: str,
+    role: str | None = None,
+    provider: str | None = None,
+    email_prefix: str | None = None,
+):
+    if role:
+        stmt = stmt.where(User.role == role)
+    if provider:
+        stmt = stmt.where(User.provider == provider)
+    if email_prefix:
+        stmt = stmt.where(_email_prefix_filter(dialect_name, email_prefix))
+    return stmt
+
+
+def select_users_page(dialect_name: str, limit: int, cursor: str | None = None, sort: str = "newest", **filters):
+    """Rows are ``(User, *sort values)`` with one extra row past ``limit``."""
+    order = USER_SORTS[sort]
+    columns = [column for column, _ in order]
+    cursor_values = decode_cursor(cursor, sort, columns) if cursor else None
+    stmt = apply_user_filters(select(User, *columns), dialect_name, **filters)
+    return apply_keyset(stmt, order, cursor_values).limit(limit + 1)
 
 
 class UserRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    @property
+    def _dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
+
     def get_by_id(self, user_id: int) -> Optional[User]:
-        return self.db.query(User).filter(User.id == user_id).first()
+        return self.db.scalars(select_user_by_id(user_id)).first()
 
     def get_by_email(self, email: str) -> Optional[User]:
-        return self.db.query(User).filter(User.email == email).first()
+        return self.db.scalars(select_user_by_email(email)).first()
 
     def get_by_google_sub(self, google_sub: str) -> Optional[User]:
-        return self.db.query(User).filter(User.google_sub == google_sub).first()
+        return self.db.scalars(select_user_by_google_sub(google_sub)).first()
 
-    def get_all(self) -> list[User]:
-        return self.db.query(User).order_by(User.created_at.desc()).all()
+    def get_all(self, **filters) -> list[User]:
+        stmt = apply_user_filters(select(User), self._dialect_name, **filters)
+        return list(self.db.scalars(stmt.order_by(User.created_at.desc())))
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        sort: str = "newest",
+        **filters,
+    ) -> tuple[list[User], str | None]:
+        rows = self.db.execute(select_users_page(self._dialect_name, limit, cursor=cursor, sort=sort, **filters)).all()
+        users = [row[0] for row in rows]
+        if len(rows) <= limit:
+            return users, None
+        return users[:limit], encode_cursor(sort, list(rows[limit - 1][1:]))
+
+    def count(self, **filters) -> int:
+        return self.db.scalar(apply_user_filters(select(func.count(User.id)), self._dialect_name, **filters)) or 0
+
+    def count_by(self, column_name: str, **filters) -> dict[str, int]:
+        """Number of users matching ``filters`` per value of ``role`` or ``provider``."""
+        column = getattr(User, column_name)
+        stmt = apply_user_filters(select(column, func.count(User.id)), self._dialect_name, **filters)
+        rows = self.db.execute(stmt.group_by(column))
+        return {value: count for value, count in rows}
 
     def count_by_role(self, role: str) -> int:
-        return self.db.query(User).filter(User.role == role).count()
+        return self.db.scalar(select_user_count_by_role(role)) or 0
 
     def create(self, **kwargs) -> User:
         user = User(**kwargs)
@@ -41,3 +141,35 @@ class UserRepository:
     def delete(self, user: User) -> None:
         self.db.delete(user)
         self.db.commit()
+
+
+class AsyncUserRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        return (await self.db.scalars(select_user_by_id(user_id))).first()
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return (await self.db.scalars(select_user_by_email(email))).first()
+
+    async def get_by_google_sub(self, google_sub: str) -> Optional[User]:
+        return (await self.db.scalars(select_user_by_google_sub(google_sub))).first()
+
+    async def count_by_role(self, role: str) -> int:
+        return await self.db.scalar(select_user_count_by_role(role)) or 0
+
+    async def create(self, **kwargs) -> User:
+        user = User(**kwargs)
+        self.db.add(user)
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
+
+    async def update(self, user: User, **kwargs) -> User:
+        for key, value in kwargs.items():
+            setattr(user, key, value)
+        self.db.add(user)
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
@@ -1,36 +1,73 @@
+from datetime import datetime
 from pathlib import Path
+import hashlib
 import json
+import os
 import shutil
+import threading
 import uuid
-from typing import List
+from typing import List, Union
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from ..config import settings
-from ..database import get_db
+from ..database import SessionLocal, get_db
+from ..repositories.image_file_repository import ImageFileRepository
+from ..repositories.pagination import MAX_PAGE_LIMIT, InvalidCursorError
 from ..repositories.product_repository import ProductRepository
+from ..repositories.translation_job_repository import TranslationJobRepository
 from ..repositories.user_repository import UserRepository
 from ..routes.auth import require_admin
-from ..schemas.admin import MessageResponse, UserRoleUpdateRequest
+from ..schemas.admin import (
+    MessageResponse,
+    MetricsResponse,
+    ProductImportResponse,
+    TranslationJobListResponse,
+    TranslationJobResponse,
+    UserListResponse,
+    UserRoleUpdateRequest,
+    UserSort,
+)
 from ..schemas.auth import UserResponse
 from ..schemas.category import CategoryCreate, CategoryResponse
-from ..schemas.product import ProductCreate, ProductListResponse, ProductResponse
+from ..schemas.product import ProductCreate, ProductListResponse, ProductResponse, ProductSort
+from ..services.catalog_cache import catalog_cache
 from ..services.category_service import CategoryService
+from ..services.image_processing import (
+    LOCAL_IMAGE_PREFIX,
+    fill_missing_image_variants,
+    generate_image_variants,
+    remove_image_variants,
+)
+from ..services.principal_cache import invalidate_principal, principal_cache
+from ..services.product_export import EXPORT_FORMATS, iter_product_export
+from ..services.product_import import ProductImporter, detect_import_format, iter_import_records, iter_text_lines
 from ..services.product_service import ProductService
+from ..services.translation_memo import translation_memo
 
 router = APIRouter(prefix="/api/admin", tags=["admin"], dependencies=[Depends(require_admin)])
 
-LOCAL_IMAGE_PREFIX = "/static/images/"
 MAX_PRODUCT_IMAGES = 5
 ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
+UPLOAD_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+# Orders "no product references this file, unlink it" against an upload checking, after its
+# own reference is committed, that a file it reused instead of writing is still there.
+_image_files_lock = threading.Lock()
 
 
 def _ensure_images_dir() -> None:
     Path(settings.images_dir).mkdir(parents=True, exist_ok=True)
 
 
-def _save_uploaded_image(image_file: UploadFile) -> str:
+def _save_uploaded_image(image_file: UploadFile) -> tuple[str, bool]:
+    """Store an upload under the SHA-256 of its bytes; returns ``(url, created)``.
+
+    Identical bytes map to the same file, so a repeated upload is only read, never written.
+    """
     if not image_file.filename:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Image filename is missing")
 
@@ -44,19 +81,34 @@ def _save_uploaded_image(image_file: UploadFile) -> str:
     if image_file.content_type and not image_file.content_type.startswith("image/"):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Uploaded file must be an image")
 
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: image_file.file.read(UPLOAD_HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    filename = f"{digest.hexdigest()}{'.jpg' if extension == '.jpeg' else extension}"
+    image_url = f"{LOCAL_IMAGE_PREFIX}{filename}"
+
     _ensure_images_dir()
-    filename = f"{uuid.uuid4().hex}{extension}"
     destination = Path(settings.images_dir) / filename
-    with destination.open("wb") as buffer:
-        shutil.copyfileobj(image_file.file, buffer)
+    if destination.exists():
+        return image_url, False
 
-    return f"{LOCAL_IMAGE_PREFIX}{filename}"
+    image_file.file.seek(0)
+    # Write under a private name and rename, so readers never see a partial file.
+    partial = destination.with_name(f".{filename}.{uuid.uuid4().hex}.part")
+    try:
+        with partial.open("wb") as buffer:
+            shutil.copyfileobj(image_file.file, buffer)
+        os.replace(partial, destination)
+    finally:
+        partial.unlink(missing_ok=True)
+    return image_url, True
 
 
-def _save_uploaded_images(image_files: list[UploadFile] | None) -> list[str]:
+def _save_uploaded_images(image_files: list[UploadFile] | None, db: Session) -> tuple[list[str], list[str]]:
+    """Store uploads; returns their urls and the subset that created new files."""
     files = [file for file in (image_files or []) if file and file.filename]
     if not files:
-        return []
+        return [], []
 
     if len(files) > MAX_PRODUCT_IMAGES:
         raise HTTPException(
@@ -65,15 +117,27 @@ def _save_uploaded_images(image_files: list[UploadFile] | None) -> list[str]:
         )
 
     image_urls: list[str] = []
+    created_urls: list[str] = []
     try:
         for image_file in files:
-            image_urls.append(_save_uploaded_image(image_file))
-        return image_urls
+            image_url, created = _save_uploaded_image(image_file)
+            if image_url not in image_urls:
+                image_urls.append(image_url)
+            if created:
+                created_urls.append(image_url)
+        return image_urls, created_urls
     except Exception:
-        _remove_local_images(image_urls)
+        _remove_unreferenced_images(db, created_urls)
         raise
 
 
+def _image_metadata(repository: ProductRepository, image_urls: list[str]) -> dict[str, dict]:
+    """Reuse the variants of files another product already uses; render the rest."""
+    metadata = repository.get_image_metadata(image_urls)
+    metadata.update(generate_image_variants([image_url for image_url in image_urls if image_url not in metadata]))
+    return metadata
+
+
 def _parse_existing_image_urls(raw_value: str | None, existing_images: list[str]) -> list[str] | None:
     if raw_value in (None, ""):
         return None
@@ -104,25 +168,114 @@ def _is_local_image(image_url: str | None) -> bool:
     return bool(image_url and image_url.startswith(LOCAL_IMAGE_PREFIX))
 
 
+def _local_image_path(image_url: str) -> Path:
+    return Path(settings.images_dir) / image_url.replace(LOCAL_IMAGE_PREFIX, "", 1)
+
+
 def _remove_local_image(image_url: str | None) -> None:
     if not _is_local_image(image_url):
         return
-    filename = image_url.replace(LOCAL_IMAGE_PREFIX, "", 1)
-    path = Path(settings.images_dir) / filename
+    path = _local_image_path(image_url)
     if path.exists():
         path.unlink()
+    remove_image_variants(path)
 
 
-def _remove_local_images(image_urls: list[str] | None) -> None:
-    for image_url in image_urls or []:
-        _remove_local_image(image_url)
+def _remove_unreferenced_images(db: Session, image_urls: list[str] | None) -> None:
+    """Delete the files of ``image_urls`` that no product image references any more."""
+    if not image_urls:
+        return
+    db.rollback()
+    with _image_files_lock:
+        for image_url in ImageFileRepository(db).unreferenced(image_urls):
+            _remove_local_image(image_url)
+
+
+def _restore_reused_images(
+    image_files: list[UploadFile] | None,
+    image_urls: list[str],
+    created_urls: list[str],
+) -> None:
+    """Rewrite files this upload reused that a concurrent delete removed meanwhile.
+
+    Call after the product write has committed: from then on the reference is visible to
+    ``_remove_unreferenced_images``, and the lock makes this check wait for an unlink that
+    had already decided the file was unreferenced. Across worker processes the lock does not
+    apply, but the check still repairs a file removed before it ran.
+    """
+    reused = [image_url for image_url in image_urls if image_url not in created_urls]
+    if not reused:
+        return
+    with _image_files_lock:
+        if all(_local_image_path(image_url).exists() for image_url in reused):
+            return
+        restored: list[str] = []
+        for image_file in image_files or []:
+            if not image_file or not image_file.filename:
+                continue
+            image_file.file.seek(0)
+            image_url, created = _save_uploaded_image(image_file)
+            if created and image_url in reused:
+                restored.append(image_url)
+        if restored:
+            generate_image_variants(restored)
+
+
+@router.get("/metrics", response_model=MetricsResponse, status_code=status.HTTP_200_OK)
+def get_metrics():
+    return MetricsResponse(
+        catalog_cache=catalog_cache.stats(),
+        principal_cache=principal_cache.stats(),
+        translation_memo=translation_memo.stats(),
+    )
+
+
+@router.get("/translation-jobs", response_model=TranslationJobListResponse, status_code=status.HTTP_200_OK)
+def get_translation_jobs(
+    job_status: str | None = Query(default=None, alias="status", pattern="^(pending|running|done|failed)$"),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_LIMIT),
+    db: Session = Depends(get_db),
+):
+    repository = TranslationJobRepository(db)
+    jobs = repository.get_all(status=job_status, limit=limit)
+    return TranslationJobListResponse(
+        jobs=[TranslationJobResponse.model_validate(job) for job in jobs],
+        counts=repository.count_by_status(),
+    )
 
 
-@router.get("/users", response_model=List[UserResponse], status_code=status.HTTP_200_OK)
-def get_users(db: Session = Depends(get_db)):
+@router.get("/users", response_model=Union[List[UserResponse], UserListResponse], status_code=status.HTTP_200_OK)
+def get_users(
+    role: str | None = Query(default=None, pattern="^(user|admin)$"),
+    provider: str | None = Query(default=None, pattern="^(local|google)$"),
+    email: str | None = Query(default=None, min_length=1, max_length=254, description="Email prefix"),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = Query(default=None, max_length=512),
+    sort: UserSort = Query(default="newest"),
+    include_total: bool = Query(default=False),
+    db: Session = Depends(get_db),
+):
+    """Without ``limit`` every matching user is returned as a plain list, as before."""
     repository = UserRepository(db)
-    users = repository.get_all()
-    return [UserResponse.model_validate(user) for user in users]
+    filters = {"role": role, "provider": provider, "email_prefix": email}
+    if limit is None:
+        return [UserResponse.model_validate(user) for user in repository.get_all(**filters)]
+
+    try:
+        users, next_cursor = repository.get_page(limit, cursor=cursor, sort=sort, **filters)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    total = counts = None
+    if include_total:
+        total = repository.count(**filters)
+        counts = {"role": repository.count_by("role", **filters), "provider": repository.count_by("provider", **filters)}
+    return UserListResponse(
+        users=[UserResponse.model_validate(user) for user in users],
+        total=total,
+        counts=counts,
+        next_cursor=next_cursor,
+    )
 
 
 @router.patch("/users/{user_id}/role", response_model=UserResponse, status_code=status.HTTP_200_OK)
@@ -143,6 +296,7 @@ def update_user_role(
         )
 
     updated = repository.update(user, role=payload.role)
+    invalidate_principal(updated.id)
     return UserResponse.model_validate(updated)
 
 
@@ -159,6 +313,7 @@ def delete_user(user_id: int, db: Session = Depends(get_db), current_admin=Depen
         )
 
     repository.delete(user)
+    invalidate_principal(user_id)
     return MessageResponse(message="User deleted")
 
 
@@ -188,9 +343,64 @@ def delete_category(category_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/products", response_model=ProductListResponse, status_code=status.HTTP_200_OK)
-def get_products(db: Session = Depends(get_db)):
+def get_products(
+    q: str | None = Query(default=None, min_length=1, max_length=100),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = Query(default=None, max_length=512),
+    sort: ProductSort | None = Query(default=None),
+    include_total: bool = Query(default=False),
+    db: Session = Depends(get_db),
+):
     service = ProductService(db)
-    return service.get_all_products()
+    return service.get_all_products(
+        query=q,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        include_total=include_total,
+    )
+
+
+@router.get("/products/export", status_code=status.HTTP_200_OK)
+def export_products(
+    export_format: str = Query(default="ndjson", alias="format", pattern="^(ndjson|csv|xml)$"),
+    category_id: int | None = Query(default=None, ge=1),
+):
+    media_type, extension = EXPORT_FORMATS[export_format]
+    filename = f"products-{datetime.utcnow():%Y%m%d-%H%M%S}.{extension}"
+    return StreamingResponse(
+        iter_product_export(export_format, category_id=category_id),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def _fill_missing_image_variants() -> None:
+    with SessionLocal() as db:
+        fill_missing_image_variants(db)
+
+
+@router.post("/products/import", response_model=ProductImportResponse, status_code=status.HTTP_200_OK)
+def import_products(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    import_format: str | None = Query(default=None, alias="format", pattern="^(csv|jsonl)$"),
+    batch_size: int = Query(default=500, ge=1, le=5000),
+    db: Session = Depends(get_db),
+):
+    resolved_format = detect_import_format(file.filename, import_format)
+    if resolved_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Upload a .csv or .jsonl file, or pass format=csv|jsonl",
+        )
+
+    records = iter_import_records(iter_text_lines(file.file), resolved_format)
+    result = ProductImporter(db, batch_size=batch_size).run(records)
+
+    if result.images_queued:
+        background_tasks.add_task(_fill_missing_image_variants)
+    return result
 
 
 @router.post("/products", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
@@ -202,7 +412,7 @@ def create_product(
     image_files: list[UploadFile] | None = File(default=None),
     db: Session = Depends(get_db),
 ):
-    image_urls = _save_uploaded_images(image_files)
+    image_urls, created_urls = _save_uploaded_images(image_files, db)
     if not image_urls:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Please upload at least one product image")
 
@@ -216,11 +426,15 @@ def create_product(
 
     service = ProductService(db)
     try:
-        return service.create_product(payload, image_urls=image_urls)
+        image_metadata = _image_metadata(ProductRepository(db), image_urls)
+        created_product = service.create_product(payload, image_urls=image_urls, image_metadata=image_metadata)
     except Exception:
-        _remove_local_images(image_urls)
+        _remove_unreferenced_images(db, created_urls)
         raise
 
+    _restore_reused_images(image_files, image_urls, created_urls)
+    return created_product
+
 
 @router.put("/products/{product_id}", response_model=ProductResponse, status_code=status.HTTP_200_OK)
 def update_product(
@@ -240,14 +454,14 @@ def update_product(
 
     existing_images = list(existing.images)
     kept_existing_images = _parse_existing_image_urls(existing_image_urls, existing_images)
-    new_image_urls = _save_uploaded_images(image_files)
+    new_image_urls, created_urls = _save_uploaded_images(image_files, db)
     combined_images = list(kept_existing_images if kept_existing_images is not None else existing_images)
     replace_images = kept_existing_images is not None
 
     if new_image_urls:
-        combined_images.extend(new_image_urls)
+        combined_images.extend(image_url for image_url in new_image_urls if image_url not in combined_images)
         if len(combined_images) > MAX_PRODUCT_IMAGES:
-            _remove_local_images(new_image_urls)
+            _remove_unreferenced_images(db, created_urls)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Maximum {MAX_PRODUCT_IMAGES} images are allowed for one product",
@@ -271,20 +485,23 @@ def update_product(
 
     service = ProductService(db)
     try:
+        image_metadata = _image_metadata(repository, new_image_urls)
         updated_product = service.update_product(
             product_id,
             payload,
             image_urls=combined_images if replace_images else None,
             replace_images=replace_images,
+            image_metadata=image_metadata,
         )
     except Exception:
-        _remove_local_images(new_image_urls)
+        _remove_unreferenced_images(db, created_urls)
         raise
 
+    _restore_reused_images(image_files, new_image_urls, created_urls)
     if replace_images:
         new_images_set = set(combined_images)
         stale_images = [image_url for image_url in existing_images if image_url not in new_images_set]
-        _remove_local_images(stale_images)
+        _remove_unreferenced_images(db, stale_images)
 
     return updated_product
 
@@ -299,5 +516,5 @@ def delete_product(product_id: int, db: Session = Depends(get_db)):
     existing_images = list(existing.images)
     service = ProductService(db)
     service.delete_product(product_id)
-    _remove_local_images(existing_images)
+    _remove_unreferenced_images(db, existing_images)
     return MessageResponse(message="Product deleted")
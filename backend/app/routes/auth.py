@@ -1,18 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import get_db
+from ..database import get_async_db
 from ..schemas.auth import RegisterRequest, LoginRequest, GoogleLoginRequest, AuthResponse, UserResponse
 from ..security import decode_access_token
-from ..services.auth_service import AuthService
+from ..services.auth_service import AsyncAuthService
+from ..services.cart_service import AsyncCartService
+from ..services.principal_cache import Principal, principal_cache
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def _user_id_from_token(token: str) -> int:
     try:
         payload = decode_access_token(token)
     except ValueError as exc:
@@ -26,35 +29,70 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         parsed_user_id = int(user_id)
     except (TypeError, ValueError) as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token payload is invalid") from exc
+    return parsed_user_id
 
-    service = AuthService(db)
-    return service.get_user_by_id(parsed_user_id)
 
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> Principal:
+    user_id = _user_id_from_token(token)
 
-def require_admin(user=Depends(get_current_user)):
+    async def load() -> Principal:
+        return Principal.from_user(await AsyncAuthService(db).get_user_by_id(user_id))
+
+    return await principal_cache.get_or_load_async(user_id, load)
+
+
+async def get_optional_user(
+    token: str | None = Depends(optional_oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """The signed-in user, or ``None`` for anonymous requests; a bad token is still a 401."""
+    if token is None:
+        return None
+    return await get_current_user(token, db)
+
+
+async def _merge_cart(db: AsyncSession, cart_token: str | None, response: AuthResponse) -> AuthResponse:
+    if cart_token:
+        await AsyncCartService(db).merge_anonymous_cart(cart_token, response.user.id)
+    return response
+
+
+async def require_admin(user=Depends(get_current_user)):
     if user.role != "admin":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
     return user
 
 
 @router.post("/register", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
-def register(payload: RegisterRequest, db: Session = Depends(get_db)):
-    service = AuthService(db)
-    return service.register(payload)
+async def register(
+    payload: RegisterRequest,
+    db: AsyncSession = Depends(get_async_db),
+    cart_token: str | None = Header(default=None, alias="X-Cart-Token"),
+):
+    service = AsyncAuthService(db)
+    return await _merge_cart(db, cart_token, await service.register(payload))
 
 
 @router.post("/login", response_model=AuthResponse, status_code=status.HTTP_200_OK)
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
-    service = AuthService(db)
-    return service.login(payload)
+async def login(
+    payload: LoginRequest,
+    db: AsyncSession = Depends(get_async_db),
+    cart_token: str | None = Header(default=None, alias="X-Cart-Token"),
+):
+    service = AsyncAuthService(db)
+    return await _merge_cart(db, cart_token, await service.login(payload))
 
 
 @router.post("/google", response_model=AuthResponse, status_code=status.HTTP_200_OK)
-def google_login(payload: GoogleLoginRequest, db: Session = Depends(get_db)):
-    service = AuthService(db)
-    return service.google_login(payload.id_token)
+async def google_login(
+    payload: GoogleLoginRequest,
+    db: AsyncSession = Depends(get_async_db),
+    cart_token: str | None = Header(default=None, alias="X-Cart-Token"),
+):
+    service = AsyncAuthService(db)
+    return await _merge_cart(db, cart_token, await service.google_login(payload.id_token))
 
 
 @router.get("/me", response_model=UserResponse, status_code=status.HTTP_200_OK)
-def me(user=Depends(get_current_user)):
+async def me(user=Depends(get_current_user)):
     return UserResponse.model_validate(user)
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Dict
-from ..database import get_db
-from ..services.cart_service import CartService
-from ..schemas.cart import CartItemCreate, CartItemUpdate, CartResponse
+from ..database import get_async_db, get_db
+from ..services.cart_service import AsyncCartService, CartService
+from ..schemas.cart import CartItemChange, CartItemCreate, CartItemUpdate, CartQuantityUpdate, CartResponse
+from .auth import get_optional_user
 from pydantic import BaseModel, Field
 
 router = APIRouter(
@@ -48,3 +50,65 @@ def remove_from_cart(product_id: int, request: RemoveFromCartRequest, db: Sessio
     service = CartService(db)
     updated_cart = service.remove_from_cart(request.cart, product_id)
     return {"cart": updated_cart}
+
+
+# Persisted carts. The legacy endpoints above round-trip the whole cart in every request;
+# these keep it server-side and return only the item that changed.
+
+def _owner_id(user) -> int | None:
+    return user.id if user is not None else None
+
+
+def _with_cart_token(change: CartItemChange, response: Response) -> CartItemChange:
+    """Also send a newly issued anonymous cart token as the ``X-Cart-Token`` response header."""
+    if change.cart_token:
+        response.headers["X-Cart-Token"] = change.cart_token
+    return change
+
+
+@router.get("/items", response_model=CartResponse, status_code=status.HTTP_200_OK)
+async def get_stored_cart(
+    user=Depends(get_optional_user),
+    cart_token: str | None = Header(default=None, alias="X-Cart-Token"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    service = AsyncCartService(db)
+    return await service.get_cart(_owner_id(user), cart_token)
+
+
+@router.post("/items", response_model=CartItemChange, status_code=status.HTTP_200_OK)
+async def add_stored_cart_item(
+    item: CartItemCreate,
+    response: Response,
+    user=Depends(get_optional_user),
+    cart_token: str | None = Header(default=None, alias="X-Cart-Token"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    service = AsyncCartService(db)
+    return _with_cart_token(await service.add_item(_owner_id(user), cart_token, item), response)
+
+
+@router.put("/items/{product_id}", response_model=CartItemChange, status_code=status.HTTP_200_OK)
+async def update_stored_cart_item(
+    product_id: int,
+    payload: CartQuantityUpdate,
+    response: Response,
+    user=Depends(get_optional_user),
+    cart_token: str | None = Header(default=None, alias="X-Cart-Token"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    service = AsyncCartService(db)
+    item = CartItemUpdate(product_id=product_id, quantity=payload.quantity)
+    return _with_cart_token(await service.update_item(_owner_id(user), cart_token, item), response)
+
+
+@router.delete("/items/{product_id}", response_model=CartItemChange, status_code=status.HTTP_200_OK)
+async def remove_stored_cart_item(
+    product_id: int,
+    response: Response,
+    user=Depends(get_optional_user),
+    cart_token: str | None = Header(default=None, alias="X-Cart-Token"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    service = AsyncCartService(db)
+    return _with_cart_token(await service.remove_item(_owner_id(user), cart_token, product_id), response)
@@ -1,21 +1,32 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from ..database import get_db
-from ..services.category_service import CategoryService
+from ..database import get_async_db
+from ..services.category_service import AsyncCategoryService
 from ..schemas.category import CategoryResponse
+from .conditional import catalog_conditional
 
 router = APIRouter(
     prefix="/api/categories",
     tags=['categories']
 )
 
-@router.get("", response_model=List[CategoryResponse], status_code=status.HTTP_200_OK)
-def get_categories(db: Session = Depends(get_db)):
-    service = CategoryService(db)
-    return service.get_all_categories()
+@router.get(
+    "",
+    response_model=List[CategoryResponse],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional)],
+)
+async def get_categories(db: AsyncSession = Depends(get_async_db)):
+    service = AsyncCategoryService(db)
+    return await service.get_all_categories()
 
-@router.get('/{category_id}', response_model=CategoryResponse, status_code=status.HTTP_200_OK)
-def get_category(category_id: int, db: Session = Depends(get_db)):
-    service = CategoryService(db)
-    return service.get_category_by_id(category_id)
\ No newline at end of file
+@router.get(
+    '/{category_id}',
+    response_model=CategoryResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional)],
+)
+async def get_category(category_id: int, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncCategoryService(db)
+    return await service.get_category_by_id(category_id)
\ No newline at end of file
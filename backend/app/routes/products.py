@@ -1,28 +1,129 @@
-from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session
-from ..database import get_db
-from ..services.product_service import ProductService
-from ..schemas.product import ProductResponse, ProductListResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import get_async_db
+from ..repositories.pagination import MAX_PAGE_LIMIT
+from .conditional import catalog_conditional
+from ..services.product_service import AsyncProductService
+from ..schemas.product import (
+    ProductFacetsResponse,
+    ProductFields,
+    ProductListResponse,
+    ProductLocale,
+    ProductResponse,
+    ProductSort,
+    ProductSummaryListResponse,
+)
 
 router = APIRouter(
     prefix="/api/products",
     tags=["products"]
 )
 
-@router.get("", response_model=ProductListResponse, status_code=status.HTTP_200_OK)
-def get_products(
+
+def _json_body(body: bytes, response: Response) -> Response:
+    """Send an already-serialized list body, keeping headers set by dependencies."""
+    return Response(content=body, media_type="application/json", headers=dict(response.headers))
+
+
+def product_filters(
+    min_price: float | None = Query(default=None, ge=0),
+    max_price: float | None = Query(default=None, ge=0),
+    has_images: bool | None = Query(default=None),
+) -> dict:
+    if min_price is not None and max_price is not None and min_price > max_price:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="min_price must not be greater than max_price",
+        )
+    return {"min_price": min_price, "max_price": max_price, "has_images": has_images}
+
+
+@router.get(
+    "",
+    response_model=ProductListResponse | ProductSummaryListResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional)],
+)
+async def get_products(
+    response: Response,
     q: str | None = Query(default=None, min_length=1, max_length=100),
-    db: Session = Depends(get_db),
+    category_ids: list[int] | None = Query(default=None, alias="category_id", description="Repeat for any of several"),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = Query(default=None, max_length=512),
+    sort: ProductSort | None = Query(default=None),
+    lang: ProductLocale | None = Query(default=None, description="Locale of the name used by name sorts"),
+    include_total: bool = Query(default=False),
+    fields: ProductFields = Query(default="full", description="'summary' returns compact grid cards"),
+    filters: dict = Depends(product_filters),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    service = ProductService(db)
-    return service.get_all_products(query=q)
-
-@router.get("/category/{category_id}", response_model=ProductListResponse, status_code=status.HTTP_200_OK)
-def get_products_by_category(category_id: int, db: Session = Depends(get_db)):
-    service = ProductService(db)
-    return service.get_products_by_category(category_id)
-
-@router.get("/{product_id}", response_model=ProductResponse, status_code=status.HTTP_200_OK)
-def get_product(product_id: int, db: Session = Depends(get_db)):
-    service = ProductService(db)
-    return service.get_product_by_id(product_id)
+    service = AsyncProductService(db)
+    body = await service.get_all_products(
+        query=q,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        include_total=include_total,
+        fields=fields,
+        locale=lang,
+        category_ids=category_ids,
+        **filters,
+    )
+    return _json_body(body, response)
+
+
+@router.get(
+    "/facets",
+    response_model=ProductFacetsResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional)],
+)
+async def get_product_facets(
+    q: str | None = Query(default=None, min_length=1, max_length=100),
+    category_ids: list[int] | None = Query(default=None, alias="category_id", description="Repeat for any of several"),
+    filters: dict = Depends(product_filters),
+    db: AsyncSession = Depends(get_async_db),
+):
+    service = AsyncProductService(db)
+    return await service.get_product_facets(query=q, category_ids=category_ids, **filters)
+
+@router.get(
+    "/category/{category_id}",
+    response_model=ProductListResponse | ProductSummaryListResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional)],
+)
+async def get_products_by_category(
+    category_id: int,
+    response: Response,
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = Query(default=None, max_length=512),
+    sort: ProductSort | None = Query(default=None),
+    lang: ProductLocale | None = Query(default=None, description="Locale of the name used by name sorts"),
+    include_total: bool = Query(default=False),
+    fields: ProductFields = Query(default="full", description="'summary' returns compact grid cards"),
+    filters: dict = Depends(product_filters),
+    db: AsyncSession = Depends(get_async_db),
+):
+    service = AsyncProductService(db)
+    body = await service.get_products_by_category(
+        category_id,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        include_total=include_total,
+        fields=fields,
+        locale=lang,
+        **filters,
+    )
+    return _json_body(body, response)
+
+@router.get(
+    "/{product_id}",
+    response_model=ProductResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional)],
+)
+async def get_product(product_id: int, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncProductService(db)
+    return await service.get_product_by_id(product_id)
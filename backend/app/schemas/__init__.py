@@ -1,8 +1,30 @@
 from .auth import AuthResponse, RegisterRequest, LoginRequest, GoogleLoginRequest, UserResponse
-from .category import CategoryCreate, CategoryResponse
-from .product import ProductCreate, ProductResponse, ProductListResponse
-from .cart import CartResponse, CartItemCreate, CartItemUpdate
-from .admin import UserRoleUpdateRequest, MessageResponse
+from .category import CategoryCreate, CategoryResponse, CategorySummary
+from .product import (
+    CategoryFacet,
+    ImageVariant,
+    PriceBucketFacet,
+    ProductFacetsResponse,
+    ProductCreate,
+    ProductImageResponse,
+    ProductResponse,
+    ProductListResponse,
+    ProductSummary,
+    ProductSummaryListResponse,
+)
+from .cart import CartResponse, CartItemCreate, CartItemUpdate, CartItemChange, CartQuantityUpdate
+from .admin import (
+    UserRoleUpdateRequest,
+    MessageResponse,
+    CacheStatsResponse,
+    MetricsResponse,
+    TranslationMemoStatsResponse,
+    TranslationJobResponse,
+    TranslationJobListResponse,
+    UserListResponse,
+    ProductImportRowError,
+    ProductImportResponse,
+)
 
 __all__ = [
     "AuthResponse",
@@ -12,12 +34,30 @@ __all__ = [
     "UserResponse",
     "CategoryCreate",
     "CategoryResponse",
+    "CategorySummary",
     "ProductCreate",
+    "ImageVariant",
+    "ProductImageResponse",
     "ProductResponse",
     "ProductListResponse",
+    "ProductSummary",
+    "ProductSummaryListResponse",
+    "CategoryFacet",
+    "PriceBucketFacet",
+    "ProductFacetsResponse",
     "CartResponse",
     "CartItemCreate",
     "CartItemUpdate",
+    "CartItemChange",
+    "CartQuantityUpdate",
     "UserRoleUpdateRequest",
     "MessageResponse",
+    "CacheStatsResponse",
+    "MetricsResponse",
+    "TranslationMemoStatsResponse",
+    "TranslationJobResponse",
+    "TranslationJobListResponse",
+    "UserListResponse",
+    "ProductImportRowError",
+    "ProductImportResponse",
 ]
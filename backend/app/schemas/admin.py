@@ -1,9 +1,88 @@
+from datetime import datetime
+from typing import Literal, Optional
+
 from pydantic import BaseModel, Field
 
+from .auth import UserResponse
+
+UserSort = Literal["newest", "oldest"]
+
 
 class UserRoleUpdateRequest(BaseModel):
     role: str = Field(..., pattern="^(user|admin)$")
 
 
+class UserListResponse(BaseModel):
+    users: list[UserResponse]
+    total: Optional[int] = Field(None, description="Number of users matching the filters")
+    counts: Optional[dict[str, dict[str, int]]] = Field(
+        None,
+        description="Users matching the filters per role and per provider",
+    )
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
+
 class MessageResponse(BaseModel):
     message: str
+
+
+class CacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    size: int
+    max_entries: int
+    ttl_seconds: float
+
+
+class TranslationMemoStatsResponse(BaseModel):
+    memory_hits: int
+    database_hits: int
+    misses: int
+    hit_rate: float
+    stores: int
+    memory_size: int
+    memory_max_entries: int
+
+
+class MetricsResponse(BaseModel):
+    catalog_cache: CacheStatsResponse
+    principal_cache: CacheStatsResponse
+    translation_memo: TranslationMemoStatsResponse
+
+
+class ProductImportRowError(BaseModel):
+    line: int
+    message: str
+
+
+class ProductImportResponse(BaseModel):
+    created: int
+    failed: int
+    translations_queued: int
+    images_queued: int
+    errors: list[ProductImportRowError] = Field(..., description="First row errors, in file order")
+    error: Optional[str] = Field(None, description="Why the import stopped before the end of the file, if it did")
+
+
+class TranslationJobResponse(BaseModel):
+    id: int
+    entity_type: str
+    entity_id: int
+    field: str
+    source_text: str
+    status: str
+    attempts: int
+    last_error: Optional[str] = None
+    next_attempt_at: datetime
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class TranslationJobListResponse(BaseModel):
+    jobs: list[TranslationJobResponse]
+    counts: dict[str, int] = Field(..., description="Number of jobs per status")
@@ -30,3 +30,16 @@ class CartResponse(BaseModel):
     items: list[CartItem] = Field(..., description="List of items in cart")
     total: float = Field(..., description="Cart total price")
     items_count: int = Field(..., description="Total quantity of items in cart")
+
+
+class CartQuantityUpdate(BaseModel):
+    quantity: int = Field(..., gt=0, description="New quantity (must be greater than 0)")
+
+
+class CartItemChange(BaseModel):
+    product_id: int
+    quantity: int = Field(..., description="Quantity now in the cart, 0 when the item was removed")
+    cart_token: Optional[str] = Field(
+        None,
+        description="Anonymous cart token, returned when a new anonymous cart was created; send it back as X-Cart-Token",
+    )
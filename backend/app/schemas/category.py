@@ -1,3 +1,4 @@
+from datetime import datetime
 from pydantic import BaseModel, Field
 from typing import Optional
 
@@ -11,10 +12,19 @@ class CategoryCreate(CategoryBase):
     pass
 
 
-class CategoryResponse(CategoryBase):
+class CategorySummary(CategoryBase):
+    """A category as embedded in products, without the aggregates that change on every product write."""
+
     id: int = Field(..., description="Unique category identifier")
     name_ru: Optional[str] = None
     name_en: Optional[str] = None
 
     class Config:
         from_attributes = True
+
+
+class CategoryResponse(CategorySummary):
+    product_count: int = Field(0, description="Number of products in the category")
+    min_price: Optional[float] = Field(None, description="Lowest product price, null when empty")
+    max_price: Optional[float] = Field(None, description="Highest product price, null when empty")
+    products_updated_at: Optional[datetime] = Field(None, description="Last product change in the category")
@@ -1,9 +1,14 @@
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
-from .category import CategoryResponse
+from .category import CategorySummary
+
+
+ProductSort = Literal["newest", "oldest", "price_asc", "price_desc", "name_asc", "name_desc", "relevance"]
+ProductFields = Literal["summary", "full"]
+ProductLocale = Literal["ru", "en"]
 
 
 class ProductBase(BaseModel):
@@ -18,6 +23,23 @@ class ProductCreate(ProductBase):
     pass
 
 
+class ImageVariant(BaseModel):
+    width: int
+    height: int
+    url: str = Field(..., description="Resized image in the original format (WebP for WebP/GIF uploads)")
+    webp_url: str
+
+
+class ProductImageResponse(BaseModel):
+    image_url: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    variants: Optional[dict[str, ImageVariant]] = Field(None, description="Derivatives by size name, e.g. thumb")
+
+    class Config:
+        from_attributes = True
+
+
 class ProductResponse(BaseModel):
     id: int = Field(..., description="Unique product id")
     name: str
@@ -30,8 +52,12 @@ class ProductResponse(BaseModel):
     category_id: int
     image_url: Optional[str]
     images: list[str] = Field(default_factory=list, description="All product image urls")
+    image_details: list[ProductImageResponse] = Field(
+        default_factory=list,
+        description="Dimensions and resized variants of each image, for srcset",
+    )
     created_at: datetime
-    category: CategoryResponse = Field(..., description="Product category details")
+    category: CategorySummary = Field(..., description="Product category details")
 
     class Config:
         from_attributes = True
@@ -39,4 +65,44 @@ class ProductResponse(BaseModel):
 
 class ProductListResponse(BaseModel):
     products: list[ProductResponse]
-    total: int = Field(..., description="Total number of products")
+    total: Optional[int] = Field(None, description="Total number of products matching the filters")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
+
+class ProductSummary(BaseModel):
+    """Grid-card view of a product: no descriptions, one image, no nested category."""
+
+    id: int
+    name: str
+    name_ru: Optional[str] = None
+    name_en: Optional[str] = None
+    price: float
+    category_id: int
+    image_url: Optional[str] = Field(None, description="Primary image url")
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ProductSummaryListResponse(BaseModel):
+    products: list[ProductSummary]
+    total: Optional[int] = Field(None, description="Total number of products matching the filters")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
+
+class CategoryFacet(BaseModel):
+    category_id: int
+    count: int
+
+
+class PriceBucketFacet(BaseModel):
+    min_price: float
+    max_price: Optional[float] = Field(None, description="Exclusive upper bound, null for the last bucket")
+    count: int
+
+
+class ProductFacetsResponse(BaseModel):
+    total: int = Field(..., description="Number of products matching all filters")
+    categories: list[CategoryFacet] = Field(..., description="Counts per category, ignoring the category filter")
+    price_buckets: list[PriceBucketFacet] = Field(..., description="Counts per price range, ignoring the price filter")
@@ -1,12 +1,32 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from .config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds)
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusy(RuntimeError):
+    """Every password hashing worker is busy and the wait queue is full."""
+
+
+# bcrypt is slow by design, so it gets its own small pool instead of the shared threadpool
+# that also serves sync endpoints; the semaphore bounds running plus queued calls.
+_password_executor = ThreadPoolExecutor(
+    max_workers=max(settings.password_hash_workers, 1),
+    thread_name_prefix="password-hash",
+)
+_password_slots = threading.BoundedSemaphore(
+    max(settings.password_hash_workers, 1) + max(settings.password_hash_max_pending, 0)
+)
 
 
 def hash_password(password: str) -> str:
@@ -17,6 +37,32 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify a password; the second item is a new hash when the stored one uses an outdated cost."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+async def _run_password_work(fn: Callable[..., T], *args) -> T:
+    if not _password_slots.acquire(blocking=False):
+        raise PasswordHashingBusy()
+    try:
+        future = _password_executor.submit(fn, *args)
+    except BaseException:
+        _password_slots.release()
+        raise
+    # Release on completion rather than on return, so a cancelled request still holds its slot.
+    future.add_done_callback(lambda _: _password_slots.release())
+    return await asyncio.wrap_future(future)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_password_work(hash_password, password)
+
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    return await _run_password_work(verify_and_update_password, plain_password, hashed_password)
+
+
 def create_access_token(subject: str, expires_minutes: int | None = None) -> str:
     expire_delta = timedelta(minutes=expires_minutes or settings.access_token_expire_minutes)
     expire = datetime.now(timezone.utc) + expire_delta
@@ -1,6 +1,15 @@
-from .auth_service import AuthService
-from .category_service import CategoryService
-from .product_service import ProductService
-from .cart_service import CartService
+from .auth_service import AsyncAuthService, AuthService
+from .category_service import AsyncCategoryService, CategoryService
+from .product_service import AsyncProductService, ProductService
+from .cart_service import AsyncCartService, CartService
 
-__all__ = ["AuthService", "CategoryService", "ProductService", "CartService"]
+__all__ = [
+    "AsyncAuthService",
+    "AsyncCartService",
+    "AsyncCategoryService",
+    "AsyncProductService",
+    "AuthService",
+    "CategoryService",
+    "ProductService",
+    "CartService",
+]
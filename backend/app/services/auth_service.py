@@ -1,14 +1,22 @@
-import json
-from datetime import datetime, timezone
-from urllib import parse, request, error
+import asyncio
 
 from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from ..config import settings
-from ..repositories.user_repository import UserRepository
+from ..repositories.user_repository import AsyncUserRepository, UserRepository
 from ..schemas.auth import RegisterRequest, LoginRequest, AuthResponse, UserResponse
-from ..security import hash_password, verify_password, create_access_token
+from ..security import (
+    PasswordHashingBusy,
+    create_access_token,
+    hash_password,
+    hash_password_async,
+    verify_and_update_password,
+    verify_and_update_password_async,
+)
+from .google_id_token import GoogleTokenError, verify_google_id_token
+from .principal_cache import invalidate_principal
 
 
 class AuthService:
@@ -32,20 +40,19 @@ class AuthService:
     def login(self, payload: LoginRequest) -> AuthResponse:
         email = payload.email.strip().lower()
         user = self.user_repository.get_by_email(email)
-        if not user or not user.hashed_password or not verify_password(payload.password, user.hashed_password):
+        if not user or not user.hashed_password:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+        verified, new_hash = verify_and_update_password(payload.password, user.hashed_password)
+        if not verified:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+        if new_hash:
+            user = self.user_repository.update(user, hashed_password=new_hash)
 
         return self._build_auth_response(user.id)
 
     def google_login(self, id_token: str) -> AuthResponse:
         claims = self._verify_google_id_token(id_token)
-
-        google_sub = claims.get("sub")
-        email = (claims.get("email") or "").strip().lower()
-        full_name = claims.get("name") or claims.get("given_name") or "Google User"
-
-        if not google_sub or not email:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Google token payload is invalid")
+        google_sub, email, full_name = self._google_claims_to_profile(claims)
 
         user = self.user_repository.get_by_google_sub(google_sub)
         if user is None:
@@ -61,16 +68,10 @@ class AuthService:
                 role=self._resolve_role_for_email(email),
             )
         else:
-            update_fields = {}
-            if not user.google_sub:
-                update_fields["google_sub"] = google_sub
-            if user.provider != "google":
-                update_fields["provider"] = "google"
-            desired_role = self._resolve_role_for_email(email)
-            if user.role != desired_role and desired_role == "admin":
-                update_fields["role"] = desired_role
+            update_fields = self._google_account_updates(user, google_sub, self._resolve_role_for_email(email))
             if update_fields:
                 user = self.user_repository.update(user, **update_fields)
+                invalidate_principal(user.id)
 
         return self._build_auth_response(user.id)
 
@@ -85,46 +86,152 @@ class AuthService:
         token = create_access_token(str(user.id))
         return AuthResponse(access_token=token, user=UserResponse.model_validate(user))
 
-    def _verify_google_id_token(self, id_token: str) -> dict:
-        if not settings.google_client_id:
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Google auth is not configured")
+    @staticmethod
+    def _google_account_updates(user, google_sub: str, desired_role: str) -> dict:
+        update_fields = {}
+        if not user.google_sub:
+            update_fields["google_sub"] = google_sub
+        if user.provider != "google":
+            update_fields["provider"] = "google"
+        if user.role != desired_role and desired_role == "admin":
+            update_fields["role"] = desired_role
+        return update_fields
+
+    @staticmethod
+    def _google_claims_to_profile(claims: dict) -> tuple[str, str, str]:
+        google_sub = claims.get("sub")
+        email = (claims.get("email") or "").strip().lower()
+        full_name = claims.get("name") or claims.get("given_name") or "Google User"
 
-        query = parse.urlencode({"id_token": id_token})
-        url = f"https://oauth2.googleapis.com/tokeninfo?{query}"
+        if not google_sub or not email:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Google token payload is invalid")
+        return google_sub, email, full_name
 
-        try:
-            with request.urlopen(url, timeout=10) as response:
-                body = response.read().decode("utf-8")
-                claims = json.loads(body)
-        except error.HTTPError as exc:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Google token") from exc
-        except Exception as exc:
-            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Failed to verify Google token") from exc
-
-        aud = claims.get("aud")
-        exp_raw = claims.get("exp")
-        email_verified = claims.get("email_verified") in ("true", True)
+    @staticmethod
+    def _admin_emails() -> set[str]:
+        return {admin_email.strip().lower() for admin_email in settings.admin_emails}
 
-        if aud != settings.google_client_id:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Google token audience mismatch")
+    @staticmethod
+    def _verify_google_id_token(id_token: str) -> dict:
+        if not settings.google_client_id:
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Google auth is not configured")
 
         try:
-            exp = int(exp_raw)
-        except (TypeError, ValueError):
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Google token expiration is invalid")
-
-        if exp <= int(datetime.now(timezone.utc).timestamp()):
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Google token is expired")
+            claims = verify_google_id_token(id_token, settings.google_client_id)
+        except GoogleTokenError as exc:
+            raise HTTPException(status_code=exc.status_code, detail=exc.detail) from exc
 
+        email_verified = claims.get("email_verified") in ("true", True)
         if not email_verified:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Google account email is not verified")
 
         return claims
 
     def _resolve_role_for_email(self, email: str) -> str:
-        normalized_admin_emails = {admin_email.strip().lower() for admin_email in settings.admin_emails}
+        normalized_admin_emails = self._admin_emails()
         if email in normalized_admin_emails:
             return "admin"
         if not normalized_admin_emails and self.user_repository.count_by_role("admin") == 0:
             return "admin"
         return "user"
+
+
+class AsyncAuthService:
+    """``AuthService`` for async endpoints.
+
+    Password hashing and the Google token check block, so they run in worker threads and
+    only the database calls stay on the event loop. The read transaction is ended before
+    bcrypt runs, so a queue of logins does not hold pooled connections that catalog reads need.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.user_repository = AsyncUserRepository(db)
+
+    async def register(self, payload: RegisterRequest) -> AuthResponse:
+        email = payload.email.strip().lower()
+        if await self.user_repository.get_by_email(email):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
+
+        await self.db.commit()
+        hashed_password = await self._password_work(hash_password_async(payload.password))
+        user = await self.user_repository.create(
+            email=email,
+            full_name=payload.full_name.strip(),
+            hashed_password=hashed_password,
+            provider="local",
+            role=await self._resolve_role_for_email(email),
+        )
+        return self._build_auth_response(user)
+
+    async def login(self, payload: LoginRequest) -> AuthResponse:
+        email = payload.email.strip().lower()
+        user = await self.user_repository.get_by_email(email)
+        if not user or not user.hashed_password:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+        await self.db.commit()
+        verified, new_hash = await self._password_work(
+            verify_and_update_password_async(payload.password, user.hashed_password)
+        )
+        if not verified:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+        if new_hash:
+            user = await self.user_repository.update(user, hashed_password=new_hash)
+
+        return self._build_auth_response(user)
+
+    @staticmethod
+    async def _password_work(work):
+        try:
+            return await work
+        except PasswordHashingBusy as exc:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many sign-in attempts in progress, please retry",
+                headers={"Retry-After": "1"},
+            ) from exc
+
+    async def google_login(self, id_token: str) -> AuthResponse:
+        claims = await asyncio.to_thread(AuthService._verify_google_id_token, id_token)
+        google_sub, email, full_name = AuthService._google_claims_to_profile(claims)
+
+        user = await self.user_repository.get_by_google_sub(google_sub)
+        if user is None:
+            user = await self.user_repository.get_by_email(email)
+
+        if user is None:
+            user = await self.user_repository.create(
+                email=email,
+                full_name=full_name,
+                provider="google",
+                google_sub=google_sub,
+                hashed_password=None,
+                role=await self._resolve_role_for_email(email),
+            )
+        else:
+            desired_role = await self._resolve_role_for_email(email)
+            update_fields = AuthService._google_account_updates(user, google_sub, desired_role)
+            if update_fields:
+                user = await self.user_repository.update(user, **update_fields)
+                invalidate_principal(user.id)
+
+        return self._build_auth_response(user)
+
+    async def get_user_by_id(self, user_id: int):
+        user = await self.user_repository.get_by_id(user_id)
+        if not user:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+        return user
+
+    @staticmethod
+    def _build_auth_response(user) -> AuthResponse:
+        token = create_access_token(str(user.id))
+        return AuthResponse(access_token=token, user=UserResponse.model_validate(user))
+
+    async def _resolve_role_for_email(self, email: str) -> str:
+        normalized_admin_emails = AuthService._admin_emails()
+        if email in normalized_admin_emails:
+            return "admin"
+        if not normalized_admin_emails and await self.user_repository.count_by_role("admin") == 0:
+            return "admin"
+        return "user"
@@ -1,8 +1,11 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Dict
-from ..repositories.product_repository import ProductRepository
-from ..schemas.cart import CartResponse, \
-                            CartItemCreate, CartItemUpdate
+from ..models.cart import Cart
+from ..repositories.cart_repository import AsyncCartRepository
+from ..repositories.product_repository import AsyncProductRepository, ProductRepository
+from ..schemas.cart import CartResponse, CartItem, \
+                            CartItemCreate, CartItemUpdate, CartItemChange
 from fastapi import HTTPException, status
 
 
@@ -68,39 +71,136 @@ class CartService:
         if not cart_data:
             return CartResponse(items=[], total=0.0, items_count=0)
 
-        product_ids = list(cart_data.keys())
-        products = self.product_repository.get_multiple_by_ids(product_ids)
-        products_dict = {product.id: product for product in products}
+        pricing_rows = self.product_repository.get_cart_pricing(list(cart_data.keys()))
+        return build_cart_response(cart_data, pricing_rows)
 
-        cart_items = []
-        total_price = 0.0
-        total_items = 0
 
-        for product_id, quantity in cart_data.items():
-            product = products_dict.get(product_id)
+def build_cart_response(quantities: Dict[int, int], pricing_rows: list[tuple]) -> CartResponse:
+    """Price a cart from ``select_cart_pricing`` rows; products that no longer exist are skipped."""
+    rows_by_id = {row[0]: row for row in pricing_rows}
 
-            if not product:
-                continue
+    cart_items = []
+    total_price = 0.0
+    total_items = 0
 
-            item_total = product.price * quantity
-            total_price += item_total
-            total_items += quantity
-
-            cart_items.append(
-                {
-                    "product_id": product.id,
-                    "name": product.name,
-                    "name_ru": product.name_ru,
-                    "name_en": product.name_en,
-                    "price": product.price,
-                    "quantity": quantity,
-                    "subtotal": round(item_total, 2),
-                    "image_url": product.primary_image_url or product.image_url,
-                }
-            )
+    for product_id, quantity in quantities.items():
+        row = rows_by_id.get(product_id)
+
+        if not row:
+            continue
 
-        return CartResponse(
-            items=cart_items,
-            total=round(total_price, 2),
-            items_count=total_items
+        _, name, name_ru, name_en, price, image_url = row
+        item_total = price * quantity
+        total_price += item_total
+        total_items += quantity
+
+        cart_items.append(
+            CartItem(
+                product_id=product_id,
+                name=name,
+                name_ru=name_ru,
+                name_en=name_en,
+                price=price,
+                quantity=quantity,
+                subtotal=round(item_total, 2),
+                image_url=image_url,
+            )
         )
+
+    return CartResponse(
+        items=cart_items,
+        total=round(total_price, 2),
+        items_count=total_items
+    )
+
+
+class AsyncCartService:
+    """Carts persisted in ``carts``/``cart_items``.
+
+    A cart belongs to the signed-in user, or else to the anonymous token the client got
+    back from its first add and sends as ``X-Cart-Token``.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.repository = AsyncCartRepository(db)
+        self.product_repository = AsyncProductRepository(db)
+
+    async def _find_cart(self, user_id: int | None, cart_token: str | None) -> Cart | None:
+        if user_id is not None:
+            return await self.repository.get_by_user_id(user_id)
+        if cart_token:
+            return await self.repository.get_by_token(cart_token)
+        return None
+
+    async def _require_cart(self, user_id: int | None, cart_token: str | None, product_id: int) -> int:
+        cart = await self._find_cart(user_id, cart_token)
+        if cart is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Product with id {product_id} not found in cart"
+            )
+        return cart.id
+
+    async def get_cart(self, user_id: int | None, cart_token: str | None) -> CartResponse:
+        cart = await self._find_cart(user_id, cart_token)
+        if cart is None:
+            return CartResponse(items=[], total=0.0, items_count=0)
+
+        quantities = dict(await self.repository.get_items(cart.id))
+        if not quantities:
+            return CartResponse(items=[], total=0.0, items_count=0)
+        pricing_rows = await self.product_repository.get_cart_pricing(list(quantities.keys()))
+        return build_cart_response(quantities, pricing_rows)
+
+    async def add_item(self, user_id: int | None, cart_token: str | None, item: CartItemCreate) -> CartItemChange:
+        if not await self.product_repository.exists(item.product_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'Product with id {item.product_id} not found'
+            )
+
+        new_token = None
+        if user_id is not None:
+            cart = await self.repository.get_or_create_for_user(user_id)
+        else:
+            cart = await self.repository.get_by_token(cart_token) if cart_token else None
+            if cart is None:
+                cart = await self.repository.create_anonymous()
+                new_token = cart.token
+
+        quantity = await self.repository.add_quantity(cart.id, item.product_id, item.quantity)
+        return CartItemChange(product_id=item.product_id, quantity=quantity, cart_token=new_token)
+
+    async def update_item(self, user_id: int | None, cart_token: str | None, item: CartItemUpdate) -> CartItemChange:
+        cart_id = await self._require_cart(user_id, cart_token, item.product_id)
+        if not await self.repository.set_quantity(cart_id, item.product_id, item.quantity):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Product with id {item.product_id} not found in cart"
+            )
+        return CartItemChange(product_id=item.product_id, quantity=item.quantity)
+
+    async def remove_item(self, user_id: int | None, cart_token: str | None, product_id: int) -> CartItemChange:
+        cart_id = await self._require_cart(user_id, cart_token, product_id)
+        if not await self.repository.remove_item(cart_id, product_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Product with id {product_id} not found in cart"
+            )
+        return CartItemChange(product_id=product_id, quantity=0)
+
+    async def merge_anonymous_cart(self, cart_token: str, user_id: int) -> None:
+        """Move the anonymous cart's items into the user's cart after login."""
+        anonymous = await self.repository.get_by_token(cart_token)
+        if anonymous is None:
+            return
+
+        user_cart = await self.repository.get_by_user_id(user_id)
+        if user_cart is None:
+            if await self.repository.claim_for_user(anonymous, user_id):
+                return
+            user_cart = await self.repository.get_by_user_id(user_id)
+            anonymous = await self.repository.get_by_token(cart_token)
+            if anonymous is None:
+                return
+        await self.repository.merge(anonymous, user_cart)
@@ -0,0 +1,44 @@
+from ..cache import TTLCache
+from ..catalog_version import catalog_version
+from ..config import settings
+
+# Keys are tuples whose first item names what is cached:
+#   ("product", id), ("product_list", ...), ("product_facets", ...), ("category", id), ("category_list",)
+catalog_cache = TTLCache(
+    max_entries=settings.catalog_cache_max_entries,
+    ttl_seconds=settings.catalog_cache_ttl_seconds,
+)
+
+# Serialized ``ProductResponse`` JSON keyed by ``(product id, updated_at)``. A product write
+# changes ``updated_at`` and so the key; only category changes need an explicit flush.
+product_fragment_cache = TTLCache(
+    max_entries=settings.product_fragment_cache_max_entries,
+    ttl_seconds=settings.product_fragment_cache_ttl_seconds,
+)
+
+# Another worker process changed the catalog; nothing tells us what, so start over.
+catalog_version.add_external_change_listener(catalog_cache.clear)
+catalog_version.add_external_change_listener(product_fragment_cache.clear)
+
+PRODUCT_NAMESPACES = {"product", "product_list", "product_facets"}
+PRODUCT_AGGREGATE_NAMESPACES = {"product_list", "product_facets"}
+CATEGORY_NAMESPACES = {"category", "category_list"}
+
+
+def invalidate_product(product_id: int | None = None) -> None:
+    """Drop product lists, facet counts and category entries (they carry product aggregates)
+    and, when given, the detail entry of one product.
+
+    Products embed a ``CategorySummary`` without the aggregates, so fragments stay valid.
+    """
+    if product_id is not None:
+        catalog_cache.delete(("product", product_id))
+    catalog_cache.delete_where(
+        lambda key: key[0] in PRODUCT_AGGREGATE_NAMESPACES or key[0] in CATEGORY_NAMESPACES
+    )
+
+
+def invalidate_categories() -> None:
+    """Drop category entries and every product entry, since products embed their category."""
+    catalog_cache.delete_where(lambda key: key[0] in CATEGORY_NAMESPACES or key[0] in PRODUCT_NAMESPACES)
+    product_fragment_cache.clear()
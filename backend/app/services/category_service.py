@@ -1,22 +1,29 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
-from ..repositories.category_repository import CategoryRepository
-from ..repositories.product_repository import ProductRepository
+from ..repositories.category_repository import AsyncCategoryRepository, CategoryRepository
 from ..schemas.category import CategoryResponse, CategoryCreate
-from .translation_service import TranslationService
+from .catalog_cache import catalog_cache, invalidate_categories
+from .translation_jobs import enqueue_category_translation
 from fastapi import HTTPException, status
 
 
 class CategoryService:
     def __init__(self, db: Session):
+        self.db = db
         self.repository = CategoryRepository(db)
-        self.product_repository = ProductRepository(db)
 
     def get_all_categories(self) -> List[CategoryResponse]:
+        return catalog_cache.get_or_load(("category_list",), self._load_categories)
+
+    def _load_categories(self) -> List[CategoryResponse]:
         categories = self.repository.get_all()
         return [CategoryResponse.model_validate(cat) for cat in categories]
 
     def get_category_by_id(self, category_id: int) -> CategoryResponse:
+        return catalog_cache.get_or_load(("category", category_id), lambda: self._load_category(category_id))
+
+    def _load_category(self, category_id: int) -> CategoryResponse:
         category = self.repository.get_by_id(category_id)
         if not category:
             raise HTTPException(
@@ -32,9 +39,11 @@ class CategoryService:
                 detail=f"Category with slug '{category_data.slug}' already exists",
             )
 
-        name_ru, name_en = TranslationService.build_ru_en(category_data.name)
-        category = self.repository.create(category_data, name_ru=name_ru, name_en=name_en)
-        return CategoryResponse.model_validate(category)
+        category = self.repository.create(category_data, name_ru=category_data.name, name_en=category_data.name)
+        invalidate_categories()
+        response = CategoryResponse.model_validate(category)
+        enqueue_category_translation(self.db, category.id, category_data.name)
+        return response
 
     def update_category(self, category_id: int, category_data: CategoryCreate) -> CategoryResponse:
         category = self.repository.get_by_id(category_id)
@@ -51,16 +60,20 @@ class CategoryService:
                 detail=f"Category with slug '{category_data.slug}' already exists",
             )
 
-        name_ru, name_en = TranslationService.build_ru_en(category_data.name)
+        name_changed = category.name != category_data.name
+        translated_fields = {"name_ru": category_data.name, "name_en": category_data.name} if name_changed else {}
 
         updated = self.repository.update(
             category,
             name=category_data.name,
             slug=category_data.slug,
-            name_ru=name_ru,
-            name_en=name_en,
+            **translated_fields,
         )
-        return CategoryResponse.model_validate(updated)
+        invalidate_categories()
+        response = CategoryResponse.model_validate(updated)
+        if name_changed:
+            enqueue_category_translation(self.db, category_id, category_data.name)
+        return response
 
     def delete_category(self, category_id: int) -> None:
         category = self.repository.get_by_id(category_id)
@@ -70,11 +83,38 @@ class CategoryService:
                 detail=f"Category with id {category_id} not found",
             )
 
-        products = self.product_repository.get_by_category(category_id)
-        if products:
+        if self.repository.has_products(category_id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete category with existing products",
             )
 
         self.repository.delete(category)
+        invalidate_categories()
+
+
+class AsyncCategoryService:
+    """Category reads for async endpoints; shares ``catalog_cache`` entries with ``CategoryService``."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = AsyncCategoryRepository(db)
+
+    async def get_all_categories(self) -> List[CategoryResponse]:
+        return await catalog_cache.get_or_load_async(("category_list",), self._load_categories)
+
+    async def _load_categories(self) -> List[CategoryResponse]:
+        categories = await self.repository.get_all()
+        return [CategoryResponse.model_validate(cat) for cat in categories]
+
+    async def get_category_by_id(self, category_id: int) -> CategoryResponse:
+        return await catalog_cache.get_or_load_async(("category", category_id), lambda: self._load_category(category_id))
+
+    async def _load_category(self, category_id: int) -> CategoryResponse:
+        category = await self.repository.get_by_id(category_id)
+        if not category:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'Category with id {category_id} not found'
+            )
+        return CategoryResponse.model_validate(category)
@@ -0,0 +1,166 @@
+"""Local verification of Google Sign-In ID tokens.
+
+Tokens are checked against Google's published signing keys (JWKS). The keys are kept in
+memory for as long as the ``Cache-Control: max-age`` of the key response allows, and are
+refreshed in a background thread shortly before that, so a login normally needs no
+network round trip. An unknown ``kid`` (Google rotated its keys) forces a refresh,
+rate-limited to one per ``min_refresh_seconds``.
+
+The key source is pluggable: tests and offline setups can install a
+``StaticKeySource`` built from a locally generated key set with ``google_keys.set_source``.
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from typing import Protocol
+from urllib import request
+
+from jose import jwt
+from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+class GoogleTokenError(Exception):
+    """The token is invalid; ``status_code`` is 401, or 503 when the keys are unavailable."""
+
+    def __init__(self, detail: str, status_code: int = 401):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+class KeySource(Protocol):
+    def fetch(self) -> tuple[dict, float | None]:
+        """Return a JWKS document and how many seconds it may be cached (``None`` if unknown)."""
+
+
+class HttpKeySource:
+    def __init__(self, url: str, timeout_seconds: float = 10.0):
+        self.url = url
+        self.timeout_seconds = timeout_seconds
+
+    def fetch(self) -> tuple[dict, float | None]:
+        with request.urlopen(self.url, timeout=self.timeout_seconds) as response:
+            jwks = json.loads(response.read().decode("utf-8"))
+            match = _MAX_AGE_PATTERN.search(response.headers.get("Cache-Control", ""))
+            if match is None:
+                return jwks, None
+            try:
+                age = int(response.headers.get("Age", "0"))
+            except ValueError:
+                age = 0
+            return jwks, max(int(match.group(1)) - age, 0)
+
+
+class StaticKeySource:
+    def __init__(self, jwks: dict, max_age_seconds: float | None = None):
+        self.jwks = jwks
+        self.max_age_seconds = max_age_seconds
+
+    def fetch(self) -> tuple[dict, float | None]:
+        return self.jwks, self.max_age_seconds
+
+
+class GoogleKeyCache:
+    def __init__(
+        self,
+        source: KeySource,
+        default_max_age_seconds: float = 3600.0,
+        refresh_ahead_seconds: float = 300.0,
+        min_refresh_seconds: float = 30.0,
+    ):
+        self.source = source
+        self.default_max_age_seconds = default_max_age_seconds
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.min_refresh_seconds = min_refresh_seconds
+        self._keys: dict[str, dict] = {}
+        self._expires_at = 0.0
+        self._last_refresh_at = float("-inf")
+        self._refresh_lock = threading.Lock()
+        self._background_refresh: threading.Thread | None = None
+
+    def set_source(self, source: KeySource) -> None:
+        with self._refresh_lock:
+            self.source = source
+            self._keys = {}
+            self._expires_at = 0.0
+            self._last_refresh_at = float("-inf")
+
+    def get_key(self, kid: str) -> dict | None:
+        now = time.monotonic()
+        if not self._keys or now >= self._expires_at:
+            self.refresh()
+        elif now >= self._expires_at - self.refresh_ahead_seconds:
+            self.refresh_in_background()
+
+        key = self._keys.get(kid)
+        if key is None and time.monotonic() - self._last_refresh_at >= self.min_refresh_seconds:
+            self.refresh()
+            key = self._keys.get(kid)
+        return key
+
+    def refresh(self) -> None:
+        with self._refresh_lock:
+            jwks, max_age = self.source.fetch()
+            now = time.monotonic()
+            self._keys = {key["kid"]: key for key in jwks.get("keys", []) if key.get("kid")}
+            self._expires_at = now + (self.default_max_age_seconds if max_age is None else max_age)
+            self._last_refresh_at = now
+
+    def refresh_in_background(self) -> None:
+        if self._background_refresh is not None and self._background_refresh.is_alive():
+            return
+        self._background_refresh = threading.Thread(target=self._refresh_logged, name="google-jwks", daemon=True)
+        self._background_refresh.start()
+
+    def _refresh_logged(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.warning("Could not refresh Google signing keys", exc_info=True)
+
+
+google_keys = GoogleKeyCache(HttpKeySource(settings.google_jwks_url))
+
+
+def verify_google_id_token(id_token: str, client_id: str) -> dict:
+    """Check signature, audience, issuer and expiry; returns the token claims."""
+    try:
+        kid = jwt.get_unverified_header(id_token).get("kid")
+    except JWTError as exc:
+        raise GoogleTokenError("Invalid Google token") from exc
+    if not kid:
+        raise GoogleTokenError("Invalid Google token")
+
+    try:
+        key = google_keys.get_key(kid)
+    except Exception as exc:
+        raise GoogleTokenError("Failed to verify Google token", status_code=503) from exc
+    if key is None:
+        raise GoogleTokenError("Invalid Google token")
+
+    try:
+        return jwt.decode(
+            id_token,
+            key,
+            algorithms=["RS256"],
+            audience=client_id,
+            issuer=GOOGLE_ISSUERS,
+            options={"verify_at_hash": False},
+        )
+    except ExpiredSignatureError as exc:
+        raise GoogleTokenError("Google token is expired") from exc
+    except JWTClaimsError as exc:
+        detail = "Google token audience mismatch" if "audience" in str(exc).lower() else "Invalid Google token"
+        raise GoogleTokenError(detail) from exc
+    except JWTError as exc:
+        raise GoogleTokenError("Invalid Google token") from exc
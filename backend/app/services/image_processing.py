@@ -0,0 +1,161 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..catalog_version import catalog_version
+from ..config import settings
+from ..models.product_image import ProductImage
+
+logger = logging.getLogger(__name__)
+
+LOCAL_IMAGE_PREFIX = "/static/images/"
+
+# Pillow format names for the re-encoded (non-WebP) copy of each variant.
+_SAVE_FORMATS = {".jpg": "JPEG", ".jpeg": "JPEG", ".png": "PNG", ".webp": "WEBP"}
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def variant_filename(filename: str, variant: str, extension: str | None = None) -> str:
+    path = Path(filename)
+    return f"{path.stem}_{variant}{extension or path.suffix.lower()}"
+
+
+def variant_filenames(filename: str) -> list[str]:
+    """Every file name the pipeline can derive from ``filename``."""
+    names = []
+    for variant in settings.image_variant_sizes:
+        names.append(variant_filename(filename, variant))
+        names.append(variant_filename(filename, variant, ".webp"))
+    return names
+
+
+def _render_variants(
+    source_path: str,
+    sizes: dict[str, int],
+    jpeg_quality: int,
+    webp_quality: int,
+) -> dict:
+    """Write resized and WebP copies of ``source_path``; runs in a worker process.
+
+    Returns ``{"width", "height", "variants": {name: {"width", "height", "file", "webp_file"}}}``.
+    Sizes that would not shrink the image are skipped, and so are animated images.
+    """
+    from PIL import Image, ImageOps
+
+    source = Path(source_path)
+    with Image.open(source) as opened:
+        image = ImageOps.exif_transpose(opened)
+        width, height = image.size
+        result = {"width": width, "height": height, "variants": {}}
+        if getattr(opened, "is_animated", False):
+            return result
+
+        save_format = _SAVE_FORMATS.get(source.suffix.lower())
+        for name, max_edge in sorted(sizes.items(), key=lambda item: item[1]):
+            if max_edge >= max(width, height):
+                continue
+            resized = image.copy()
+            resized.thumbnail((max_edge, max_edge), Image.LANCZOS)
+
+            variant = {"width": resized.width, "height": resized.height, "file": None, "webp_file": None}
+            if save_format and save_format != "WEBP":
+                target = source.with_name(variant_filename(source.name, name))
+                if save_format == "JPEG":
+                    resized.convert("RGB").save(target, "JPEG", quality=jpeg_quality, optimize=True, progressive=True)
+                else:
+                    resized.save(target, save_format, optimize=True)
+                variant["file"] = target.name
+
+            webp_target = source.with_name(variant_filename(source.name, name, ".webp"))
+            if resized.mode not in ("RGB", "RGBA"):
+                resized = resized.convert("RGBA" if "A" in resized.getbands() else "RGB")
+            resized.save(webp_target, "WEBP", quality=webp_quality, method=4)
+            variant["webp_file"] = webp_target.name
+            result["variants"][name] = variant
+    return result
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=max(settings.image_workers, 1))
+    return _executor
+
+
+def shutdown_image_workers() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def _to_metadata(rendered: dict) -> dict:
+    variants = {}
+    for name, variant in rendered["variants"].items():
+        variants[name] = {
+            "width": variant["width"],
+            "height": variant["height"],
+            "url": f"{LOCAL_IMAGE_PREFIX}{variant['file'] or variant['webp_file']}",
+            "webp_url": f"{LOCAL_IMAGE_PREFIX}{variant['webp_file']}",
+        }
+    return {"width": rendered["width"], "height": rendered["height"], "variants": variants}
+
+
+def generate_image_variants(image_urls: list[str]) -> dict[str, dict]:
+    """Render derivatives of local images in the process pool and wait for all of them.
+
+    Returns ``{image_url: {"width", "height", "variants"}}``. Images that cannot be decoded
+    are logged and left out, so they are still served, just without derivatives.
+    """
+    futures = {}
+    for image_url in image_urls:
+        if not image_url or not image_url.startswith(LOCAL_IMAGE_PREFIX):
+            continue
+        source_path = Path(settings.images_dir) / image_url[len(LOCAL_IMAGE_PREFIX):]
+        futures[image_url] = _get_executor().submit(
+            _render_variants,
+            str(source_path),
+            dict(settings.image_variant_sizes),
+            settings.image_jpeg_quality,
+            settings.image_webp_quality,
+        )
+
+    metadata: dict[str, dict] = {}
+    for image_url, future in futures.items():
+        try:
+            metadata[image_url] = _to_metadata(future.result())
+        except Exception:
+            logger.warning("Could not generate variants for %s", image_url, exc_info=True)
+    return metadata
+
+
+def fill_missing_image_variants(db: Session, batch_size: int = 50, regenerate: bool = False) -> int:
+    """Render variants for product images stored without them; returns how many got variants."""
+    stmt = select(ProductImage).order_by(ProductImage.id)
+    if not regenerate:
+        stmt = stmt.where(ProductImage.variants.is_(None))
+    images = list(db.scalars(stmt))
+    processed = 0
+    for start in range(0, len(images), batch_size):
+        batch = images[start:start + batch_size]
+        metadata = generate_image_variants([image.image_url for image in batch])
+        for image in batch:
+            rendered = metadata.get(image.image_url)
+            if rendered:
+                image.width = rendered["width"]
+                image.height = rendered["height"]
+                image.variants = rendered["variants"]
+                processed += 1
+        # Running servers drop their cached product JSON when the version moves.
+        catalog_version.bump(db)
+        db.commit()
+    return processed
+
+
+def remove_image_variants(image_path: Path) -> None:
+    for name in variant_filenames(image_path.name):
+        image_path.with_name(name).unlink(missing_ok=True)
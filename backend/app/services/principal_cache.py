@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from ..cache import TTLCache
+from ..config import settings
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Read-only snapshot of an authenticated user, safe to share between requests."""
+
+    id: int
+    email: str
+    full_name: str
+    provider: str
+    role: str
+    created_at: datetime
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            provider=user.provider,
+            role=user.role,
+            created_at=user.created_at,
+        )
+
+
+# Principals keyed by user id (the token subject). This process drops an entry whenever
+# it changes that user; other worker processes see the change within ``ttl_seconds``.
+principal_cache = TTLCache(
+    max_entries=settings.principal_cache_max_entries,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+)
+
+
+def invalidate_principal(user_id: int) -> None:
+    principal_cache.delete(user_id)
@@ -0,0 +1,129 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterable, Iterator
+from xml.sax.saxutils import escape
+
+from ..config import settings
+from ..database import SessionLocal
+from ..repositories.product_repository import ProductRepository
+
+# format -> (media type, file extension)
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "xml": ("application/xml", "xml"),
+}
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+CSV_COLUMNS = (
+    "id",
+    "name",
+    "name_ru",
+    "name_en",
+    "description",
+    "description_ru",
+    "description_en",
+    "price",
+    "category_id",
+    "category_slug",
+    "category_name",
+    "image_url",
+    "created_at",
+    "updated_at",
+)
+
+
+def _absolute_url(path: str | None) -> str | None:
+    if not path or "://" in path:
+        return path
+    return f"{settings.public_base_url.rstrip('/')}/{path.lstrip('/')}"
+
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _ndjson_lines(rows: Iterable) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps({key: _json_value(row[key]) for key in CSV_COLUMNS}, ensure_ascii=False) + "\n"
+
+
+def _csv_lines(rows: Iterable) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def take() -> str:
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return value
+
+    writer.writerow(CSV_COLUMNS)
+    yield take()
+    for row in rows:
+        writer.writerow([_json_value(row[key]) for key in CSV_COLUMNS])
+        yield take()
+
+
+def _xml_lines(rows: Iterable) -> Iterator[str]:
+    """An RSS 2.0 feed with Google Merchant ``g:`` fields, as price-comparison sites expect."""
+    base_url = settings.public_base_url.rstrip("/")
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0" xmlns:g="http://base.google.com/ns/1.0">\n<channel>\n'
+        f"<title>{escape(settings.app_name)}</title>\n<link>{escape(base_url)}</link>\n"
+        f"<description>{escape(settings.app_name)} product feed</description>\n"
+    )
+    for row in rows:
+        image_link = _absolute_url(row["image_url"])
+        yield (
+            "<item>"
+            f"<g:id>{row['id']}</g:id>"
+            f"<title>{escape(row['name'] or '')}</title>"
+            f"<description>{escape(row['description'] or row['name'] or '')}</description>"
+            f"<link>{escape(base_url)}/product/{row['id']}</link>"
+            + (f"<g:image_link>{escape(image_link)}</g:image_link>" if image_link else "")
+            + f"<g:price>{row['price']:.2f} {escape(settings.feed_currency)}</g:price>"
+            f"<g:product_type>{escape(row['category_name'] or '')}</g:product_type>"
+            "<g:availability>in stock</g:availability>"
+            "<g:condition>new</g:condition>"
+            "</item>\n"
+        )
+    yield "</channel>\n</rss>\n"
+
+
+_ENCODERS = {"ndjson": _ndjson_lines, "csv": _csv_lines, "xml": _xml_lines}
+
+
+def _chunks(pieces: Iterable[str]) -> Iterator[bytes]:
+    """Join encoded pieces into ~``EXPORT_CHUNK_BYTES`` writes; the first piece goes out alone."""
+    buffer: list[bytes] = []
+    size = 0
+    first = True
+    for piece in pieces:
+        data = piece.encode("utf-8")
+        if first:
+            yield data
+            first = False
+            continue
+        buffer.append(data)
+        size += len(data)
+        if size >= EXPORT_CHUNK_BYTES:
+            yield b"".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def iter_product_export(export_format: str, category_id: int | None = None, batch_size: int = 1000) -> Iterator[bytes]:
+    """Encoded export chunks for a ``StreamingResponse``.
+
+    The generator outlives the request's dependencies, so it opens its own session, and
+    reads rows ``batch_size`` at a time; memory use does not grow with the catalog.
+    """
+    with SessionLocal() as db:
+        rows = ProductRepository(db).iter_export_rows(category_id=category_id, batch_size=batch_size)
+        yield from _chunks(_ENCODERS[export_format](rows))
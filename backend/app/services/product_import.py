@@ -0,0 +1,220 @@
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from ..repositories.category_repository import CategoryRepository
+from ..repositories.product_repository import ProductRepository
+from ..repositories.translation_job_repository import TranslationJobRepository
+from ..schemas.admin import ProductImportResponse, ProductImportRowError
+from ..schemas.product import ProductCreate
+from .catalog_cache import invalidate_product
+from .image_processing import LOCAL_IMAGE_PREFIX
+from .translation_jobs import PRODUCT_TRANSLATABLE_FIELDS, translation_worker
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("csv", "jsonl")
+MAX_REPORTED_ERRORS = 1000
+# CSV cells hold several image urls separated by this character.
+CSV_IMAGE_SEPARATOR = "|"
+
+# (line number, parsed record or None, parse error or None)
+ImportRecord = tuple[int, dict[str, Any] | None, str | None]
+
+
+def detect_import_format(filename: str | None, requested: str | None = None) -> str | None:
+    if requested:
+        return requested
+    suffix = Path(filename or "").suffix.lower().lstrip(".")
+    if suffix == "ndjson":
+        return "jsonl"
+    return suffix if suffix in IMPORT_FORMATS else None
+
+
+def iter_text_lines(binary: BinaryIO) -> Iterator[str]:
+    """Decode an upload line by line (UTF-8, optional BOM).
+
+    Unlike a ``TextIOWrapper``, whose read-ahead chunk fails as a whole, an invalid byte
+    surfaces at the line that holds it, after the lines before it were imported.
+    """
+    for index, raw_line in enumerate(binary):
+        yield raw_line.decode("utf-8-sig" if index == 0 else "utf-8")
+
+
+def iter_csv_records(stream: Iterable[str]) -> Iterator[ImportRecord]:
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, row, None
+
+
+def iter_jsonl_records(stream: Iterable[str]) -> Iterator[ImportRecord]:
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield line_number, None, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Each line must be a JSON object"
+            continue
+        yield line_number, record, None
+
+
+def iter_import_records(stream: Iterable[str], import_format: str) -> Iterator[ImportRecord]:
+    if import_format == "csv":
+        return iter_csv_records(stream)
+    return iter_jsonl_records(stream)
+
+
+def _blank_to_none(value: Any) -> Any:
+    if isinstance(value, str) and not value.strip():
+        return None
+    return value
+
+
+def _text(record: dict[str, Any], key: str) -> str | None:
+    """``record[key]`` as stripped text; numbers are accepted, other JSON types are not."""
+    value = record.get(key)
+    if value is None:
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        value = str(value)
+    if not isinstance(value, str):
+        raise ValueError(f"{key}: must be a string")
+    return value.strip() or None
+
+
+class ProductImporter:
+    """Create products from a stream of records, ``batch_size`` rows per transaction.
+
+    Each row is validated against ``ProductCreate`` with its category resolved by slug (or
+    id) from a map loaded once. Valid rows are inserted with executemany; invalid rows are
+    reported with their line number and skipped. Translations are queued for the worker
+    after each batch, and uploaded images get their variants afterwards (see
+    ``fill_missing_image_variants``), so neither slows the insert down.
+    """
+
+    def __init__(self, db: Session, batch_size: int = 500):
+        self.db = db
+        self.batch_size = max(batch_size, 1)
+        self.product_repository = ProductRepository(db)
+        self.translation_job_repository = TranslationJobRepository(db)
+        categories = CategoryRepository(db).get_all()
+        self.category_ids_by_slug = {category.slug: category.id for category in categories}
+        self.category_ids = set(self.category_ids_by_slug.values())
+
+    def run(self, records: Iterable[ImportRecord]) -> ProductImportResponse:
+        result = ProductImportResponse(created=0, failed=0, translations_queued=0, images_queued=0, errors=[])
+        batch: list[tuple[ProductCreate, list[str]]] = []
+        records = iter(records)
+        last_line = 0
+        while True:
+            # The file is decoded while it is read, so a bad byte stops the import here; the
+            # rows before it are still saved and counted.
+            try:
+                line_number, record, error = next(records)
+            except StopIteration:
+                break
+            except (UnicodeDecodeError, csv.Error) as exc:
+                reason = "the file is not valid UTF-8" if isinstance(exc, UnicodeDecodeError) else str(exc)
+                result.error = f"Import stopped after line {last_line}: {reason}"
+                break
+            last_line = line_number
+            if error is None:
+                try:
+                    batch.append(self._parse(record))
+                except ValueError as exc:
+                    error = str(exc)
+            if error is not None:
+                result.failed += 1
+                if len(result.errors) < MAX_REPORTED_ERRORS:
+                    result.errors.append(ProductImportRowError(line=line_number, message=error))
+                continue
+            if len(batch) >= self.batch_size:
+                self._flush(batch, result)
+                batch = []
+        if batch:
+            self._flush(batch, result)
+        return result
+
+    def _parse(self, record: dict[str, Any]) -> tuple[ProductCreate, list[str]]:
+        record = {key.strip().lower(): _blank_to_none(value) for key, value in record.items() if key}
+        category_id = self._resolve_category_id(record)
+        image_urls = self._image_urls(record)
+        try:
+            product = ProductCreate(
+                name=_text(record, "name") or "",
+                description=_text(record, "description"),
+                price=record.get("price"),
+                category_id=category_id,
+                image_url=image_urls[0] if image_urls else None,
+            )
+        except ValidationError as exc:
+            raise ValueError(
+                "; ".join(f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in exc.errors())
+            ) from exc
+        return product, image_urls
+
+    def _resolve_category_id(self, record: dict[str, Any]) -> int:
+        slug = _text(record, "category_slug") or _text(record, "category")
+        if slug is not None:
+            category_id = self.category_ids_by_slug.get(slug)
+            if category_id is None:
+                raise ValueError(f"Unknown category slug '{slug}'")
+            return category_id
+        raw_id = record.get("category_id")
+        if isinstance(raw_id, bool) or not isinstance(raw_id, (int, str)):
+            raise ValueError("category_slug or category_id is required")
+        try:
+            category_id = int(raw_id)
+        except ValueError:
+            raise ValueError("category_id must be an integer") from None
+        if category_id not in self.category_ids:
+            raise ValueError(f"Category with id {category_id} does not exist")
+        return category_id
+
+    @staticmethod
+    def _image_urls(record: dict[str, Any]) -> list[str]:
+        raw = record.get("image_urls")
+        if raw is None:
+            raw = []
+        elif isinstance(raw, str):
+            raw = raw.split(CSV_IMAGE_SEPARATOR)
+        elif not isinstance(raw, list):
+            raise ValueError("image_urls: must be a list of urls or a '|'-separated string")
+        urls: list[str] = []
+        for value in [*raw, record.get("image_url")]:
+            if value is None:
+                continue
+            if not isinstance(value, str):
+                raise ValueError("image_urls: every url must be a string")
+            value = value.strip()
+            if value and value not in urls:
+                urls.append(value)
+        return urls
+
+    def _flush(self, batch: list[tuple[ProductCreate, list[str]]], result: ProductImportResponse) -> None:
+        product_ids = self.product_repository.create_many(batch)
+        jobs = [
+            ("product", product_id, field, getattr(product, field))
+            for product_id, (product, _) in zip(product_ids, batch)
+            for field in PRODUCT_TRANSLATABLE_FIELDS
+            if getattr(product, field)
+        ]
+        self.translation_job_repository.enqueue_many(jobs)
+        translation_worker.notify()
+        invalidate_product()
+
+        result.created += len(product_ids)
+        result.translations_queued += len(jobs)
+        result.images_queued += sum(
+            1 for _, image_urls in batch for image_url in image_urls if image_url.startswith(LOCAL_IMAGE_PREFIX)
+        )
+        logger.info("Imported %s products (%s rejected so far)", result.created, result.failed)
@@ -0,0 +1,39 @@
+import json
+
+from ..cache import MISSING
+from ..schemas.product import ProductResponse
+from .catalog_cache import product_fragment_cache
+
+# Products loaded per query when rendering fragments; keeps IN lists under driver limits.
+FRAGMENT_LOAD_CHUNK = 500
+
+
+def get_cached_fragments(versions: list[dict]) -> dict[int, bytes]:
+    """Cached fragments for ``{"id", "updated_at"}`` rows, by product id; misses are omitted."""
+    fragments: dict[int, bytes] = {}
+    for version in versions:
+        fragment = product_fragment_cache.get((version["id"], version["updated_at"]))
+        if fragment is not MISSING:
+            fragments[version["id"]] = fragment
+    return fragments
+
+
+def render_product_fragment(product, generation: int | None = None) -> bytes:
+    fragment = ProductResponse.model_validate(product).model_dump_json().encode()
+    product_fragment_cache.set((product.id, product.updated_at), fragment, generation=generation)
+    return fragment
+
+
+def render_product_list(fragments: list[bytes], total: int | None, next_cursor: str | None) -> bytes:
+    """The ``ProductListResponse`` JSON body, spliced together from product fragments."""
+    return b"".join(
+        (
+            b'{"products":[',
+            b",".join(fragments),
+            b'],"total":',
+            json.dumps(total).encode(),
+            b',"next_cursor":',
+            json.dumps(next_cursor).encode(),
+            b"}",
+        )
+    )
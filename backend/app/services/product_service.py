@@ -1,23 +1,117 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..repositories.product_repository import ProductRepository
-from ..repositories.category_repository import CategoryRepository
-from ..schemas.product import ProductResponse, ProductListResponse, ProductCreate
-from .translation_service import TranslationService
+from ..repositories.pagination import InvalidCursorError
+from ..repositories.product_repository import AsyncProductRepository, ProductRepository
+from ..repositories.category_repository import AsyncCategoryRepository, CategoryRepository
+from ..schemas.product import (
+    ProductCreate,
+    ProductFacetsResponse,
+    ProductListResponse,
+    ProductResponse,
+    ProductSummary,
+    ProductSummaryListResponse,
+)
+from .catalog_cache import catalog_cache, invalidate_product, product_fragment_cache
+from .product_json import (
+    FRAGMENT_LOAD_CHUNK,
+    get_cached_fragments,
+    render_product_fragment,
+    render_product_list,
+)
+from .translation_jobs import enqueue_product_translations
 from fastapi import HTTPException, status
 
 
+def product_filters_key(filters: dict) -> tuple:
+    """Hashable form of the set list filters, for catalog cache keys."""
+    return tuple(
+        (name, tuple(sorted(value)) if isinstance(value, (list, set, tuple)) else value)
+        for name, value in sorted(filters.items())
+        if value is not None
+    )
+
+
 class ProductService:
     def __init__(self, db: Session):
+        self.db = db
         self.product_repository = ProductRepository(db)
         self.category_repository = CategoryRepository(db)
 
-    def get_all_products(self, query: str | None = None) -> ProductListResponse:
-        products = self.product_repository.get_all(query=query)
+    def get_all_products(
+        self,
+        query: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        sort: str | None = None,
+        include_total: bool = False,
+        locale: str | None = None,
+        **filters,
+    ) -> ProductListResponse:
+        if limit is not None:
+            sort = sort or ("relevance" if query else "newest")
+        filters_key = product_filters_key(filters)
+        cache_key = ("product_list", query, None, limit, cursor, sort, include_total, locale, filters_key)
+        return catalog_cache.get_or_load(
+            cache_key,
+            lambda: self._load_products(query, limit, cursor, sort, include_total, locale, filters),
+        )
+
+    def _load_products(
+        self,
+        query: str | None,
+        limit: int | None,
+        cursor: str | None,
+        sort: str | None,
+        include_total: bool,
+        locale: str | None,
+        filters: dict,
+    ) -> ProductListResponse:
+        if limit is None:
+            products = self.product_repository.get_all(query=query, sort=sort, locale=locale, **filters)
+            products_response = [ProductResponse.model_validate(prod) for prod in products]
+            return ProductListResponse(products=products_response, total=len(products_response))
+
+        return self._get_products_page(
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
+            include_total=include_total,
+            query=query,
+            locale=locale,
+            **filters,
+        )
+
+    def _get_products_page(
+        self,
+        limit: int,
+        cursor: str | None,
+        sort: str,
+        include_total: bool,
+        query: str | None = None,
+        locale: str | None = None,
+        **filters,
+    ) -> ProductListResponse:
+        try:
+            products, next_cursor = self.product_repository.get_page(
+                limit=limit,
+                cursor=cursor,
+                sort=sort,
+                query=query,
+                locale=locale,
+                **filters,
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+        total = self.product_repository.count(query=query, **filters) if include_total else None
         products_response = [ProductResponse.model_validate(prod) for prod in products]
-        return ProductListResponse(products=products_response, total=len(products_response))
+        return ProductListResponse(products=products_response, total=total, next_cursor=next_cursor)
 
     def get_product_by_id(self, product_id: int) -> ProductResponse:
+        return catalog_cache.get_or_load(("product", product_id), lambda: self._load_product(product_id))
+
+    def _load_product(self, product_id: int) -> ProductResponse:
         product = self.product_repository.get_by_id(product_id)
         if not product:
             raise HTTPException(
@@ -26,7 +120,35 @@ class ProductService:
             )
         return ProductResponse.model_validate(product)
 
-    def get_products_by_category(self, category_id: int) -> ProductListResponse:
+    def get_products_by_category(
+        self,
+        category_id: int,
+        limit: int | None = None,
+        cursor: str | None = None,
+        sort: str | None = None,
+        include_total: bool = False,
+        locale: str | None = None,
+        **filters,
+    ) -> ProductListResponse:
+        if limit is not None:
+            sort = sort or "newest"
+        filters_key = product_filters_key(filters)
+        cache_key = ("product_list", None, category_id, limit, cursor, sort, include_total, locale, filters_key)
+        return catalog_cache.get_or_load(
+            cache_key,
+            lambda: self._load_products_by_category(category_id, limit, cursor, sort, include_total, locale, filters),
+        )
+
+    def _load_products_by_category(
+        self,
+        category_id: int,
+        limit: int | None,
+        cursor: str | None,
+        sort: str | None,
+        include_total: bool,
+        locale: str | None,
+        filters: dict,
+    ) -> ProductListResponse:
         category = self.category_repository.get_by_id(category_id)
         if not category:
             raise HTTPException(
@@ -34,11 +156,33 @@ class ProductService:
                 detail=f"Category with id {category_id} not found"
             )
 
-        products = self.product_repository.get_by_category(category_id)
+        if limit is not None:
+            return self._get_products_page(
+                limit=limit,
+                cursor=cursor,
+                sort=sort,
+                include_total=include_total,
+                locale=locale,
+                category_id=category_id,
+                **filters,
+            )
+
+        products = self.product_repository.get_all(sort=sort, locale=locale, category_id=category_id, **filters)
         products_response = [ProductResponse.model_validate(prod) for prod in products]
         return ProductListResponse(products=products_response, total=len(products_response))
 
-    def create_product(self, product_data: ProductCreate, image_urls: list[str] | None = None) -> ProductResponse:
+    def get_product_facets(self, query: str | None = None, **filters) -> ProductFacetsResponse:
+        return catalog_cache.get_or_load(
+            ("product_facets", query, product_filters_key(filters)),
+            lambda: ProductFacetsResponse.model_validate(self.product_repository.get_facets(query=query, **filters)),
+        )
+
+    def create_product(
+        self,
+        product_data: ProductCreate,
+        image_urls: list[str] | None = None,
+        image_metadata: dict[str, dict] | None = None,
+    ) -> ProductResponse:
         category = self.category_repository.get_by_id(product_data.category_id)
         if not category:
             raise HTTPException(
@@ -46,17 +190,24 @@ class ProductService:
                 detail=f"Category with id {product_data.category_id} does not exist"
             )
 
-        name_ru, name_en = TranslationService.build_ru_en(product_data.name)
-        description_ru, description_en = TranslationService.build_ru_en(product_data.description)
+        # Translations are filled in by the background worker; serve the source text until then.
         product = self.product_repository.create(
             product_data,
             image_urls=image_urls,
-            name_ru=name_ru,
-            name_en=name_en,
-            description_ru=description_ru,
-            description_en=description_en,
+            image_metadata=image_metadata,
+            name_ru=product_data.name,
+            name_en=product_data.name,
+            description_ru=product_data.description,
+            description_en=product_data.description,
         )
-        return ProductResponse.model_validate(product)
+        invalidate_product()
+        response = ProductResponse.model_validate(product)
+        enqueue_product_translations(
+            self.db,
+            product.id,
+            {"name": product_data.name, "description": product_data.description},
+        )
+        return response
 
     def update_product(
         self,
@@ -64,6 +215,7 @@ class ProductService:
         product_data: ProductCreate,
         image_urls: list[str] | None = None,
         replace_images: bool = False,
+        image_metadata: dict[str, dict] | None = None,
     ) -> ProductResponse:
         product = self.product_repository.get_by_id(product_id)
         if not product:
@@ -79,20 +231,29 @@ class ProductService:
                 detail=f"Category with id {product_data.category_id} does not exist",
             )
 
-        name_ru, name_en = TranslationService.build_ru_en(product_data.name)
-        description_ru, description_en = TranslationService.build_ru_en(product_data.description)
+        # Keep existing translations of unchanged text; changed text is re-translated in the background.
+        pending_translations: dict[str, str | None] = {}
+        translated_fields: dict[str, str | None] = {}
+        for field in ("name", "description"):
+            source_text = getattr(product_data, field)
+            if source_text != getattr(product, field):
+                pending_translations[field] = source_text
+                translated_fields[f"{field}_ru"] = source_text
+                translated_fields[f"{field}_en"] = source_text
 
         updated = self.product_repository.update(
             product,
             image_urls=image_urls,
             replace_images=replace_images,
-            name_ru=name_ru,
-            name_en=name_en,
-            description_ru=description_ru,
-            description_en=description_en,
+            image_metadata=image_metadata,
+            **translated_fields,
             **product_data.model_dump(),
         )
-        return ProductResponse.model_validate(updated)
+        invalidate_product(product_id)
+        response = ProductResponse.model_validate(updated)
+        if pending_translations:
+            enqueue_product_translations(self.db, product_id, pending_translations)
+        return response
 
     def delete_product(self, product_id: int) -> None:
         product = self.product_repository.get_by_id(product_id)
@@ -102,3 +263,201 @@ class ProductService:
                 detail=f"Product with id {product_id} not found",
             )
         self.product_repository.delete(product)
+        invalidate_product(product_id)
+
+
+class AsyncProductService:
+    """Catalog reads for async endpoints; shares ``catalog_cache`` entries with ``ProductService``.
+
+    List methods return the finished JSON body. Full lists are assembled from per-product
+    fragments cached by ``(id, updated_at)``, so only products that changed since they were
+    last rendered are loaded and validated.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.product_repository = AsyncProductRepository(db)
+        self.category_repository = AsyncCategoryRepository(db)
+
+    @staticmethod
+    def _projection(fields: str) -> str:
+        return "summary" if fields == "summary" else "version"
+
+    async def _render_list(
+        self,
+        rows: list[dict],
+        fields: str,
+        generation: int,
+        total: int | None = None,
+        next_cursor: str | None = None,
+    ) -> bytes:
+        if fields == "summary":
+            summaries = [ProductSummary.model_validate(row) for row in rows]
+            return ProductSummaryListResponse(products=summaries, total=total, next_cursor=next_cursor).model_dump_json().encode()
+
+        fragments = get_cached_fragments(rows)
+        missing_ids = [row["id"] for row in rows if row["id"] not in fragments]
+        for start in range(0, len(missing_ids), FRAGMENT_LOAD_CHUNK):
+            products = await self.product_repository.get_multiple_by_ids(missing_ids[start:start + FRAGMENT_LOAD_CHUNK])
+            for product in products:
+                fragments[product.id] = render_product_fragment(product, generation)
+        # Products deleted since the version query are simply left out.
+        return render_product_list([fragments[row["id"]] for row in rows if row["id"] in fragments], total, next_cursor)
+
+    async def get_all_products(
+        self,
+        query: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        sort: str | None = None,
+        include_total: bool = False,
+        fields: str = "full",
+        locale: str | None = None,
+        **filters,
+    ) -> bytes:
+        if limit is not None:
+            sort = sort or ("relevance" if query else "newest")
+        filters_key = product_filters_key(filters)
+        cache_key = ("product_list", query, None, limit, cursor, sort, include_total, fields, locale, filters_key)
+        return await catalog_cache.get_or_load_async(
+            cache_key,
+            lambda: self._load_products(query, limit, cursor, sort, include_total, fields, locale, filters),
+        )
+
+    async def _load_products(
+        self,
+        query: str | None,
+        limit: int | None,
+        cursor: str | None,
+        sort: str | None,
+        include_total: bool,
+        fields: str,
+        locale: str | None,
+        filters: dict,
+    ) -> bytes:
+        generation = product_fragment_cache.generation
+        if limit is None:
+            rows = await self.product_repository.get_all(
+                query=query, projection=self._projection(fields), sort=sort, locale=locale, **filters
+            )
+            return await self._render_list(rows, fields, generation, total=len(rows))
+
+        return await self._get_products_page(
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
+            include_total=include_total,
+            fields=fields,
+            generation=generation,
+            query=query,
+            locale=locale,
+            **filters,
+        )
+
+    async def _get_products_page(
+        self,
+        limit: int,
+        cursor: str | None,
+        sort: str,
+        include_total: bool,
+        fields: str,
+        generation: int,
+        query: str | None = None,
+        locale: str | None = None,
+        **filters,
+    ) -> bytes:
+        try:
+            rows, next_cursor = await self.product_repository.get_page(
+                limit=limit,
+                cursor=cursor,
+                sort=sort,
+                query=query,
+                projection=self._projection(fields),
+                locale=locale,
+                **filters,
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+        total = await self.product_repository.count(query=query, **filters) if include_total else None
+        return await self._render_list(rows, fields, generation, total=total, next_cursor=next_cursor)
+
+    async def get_product_by_id(self, product_id: int) -> ProductResponse:
+        return await catalog_cache.get_or_load_async(("product", product_id), lambda: self._load_product(product_id))
+
+    async def _load_product(self, product_id: int) -> ProductResponse:
+        product = await self.product_repository.get_by_id(product_id)
+        if not product:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Product with id {product_id} not found"
+            )
+        return ProductResponse.model_validate(product)
+
+    async def get_products_by_category(
+        self,
+        category_id: int,
+        limit: int | None = None,
+        cursor: str | None = None,
+        sort: str | None = None,
+        include_total: bool = False,
+        fields: str = "full",
+        locale: str | None = None,
+        **filters,
+    ) -> bytes:
+        if limit is not None:
+            sort = sort or "newest"
+        filters_key = product_filters_key(filters)
+        cache_key = ("product_list", None, category_id, limit, cursor, sort, include_total, fields, locale, filters_key)
+        return await catalog_cache.get_or_load_async(
+            cache_key,
+            lambda: self._load_products_by_category(
+                category_id, limit, cursor, sort, include_total, fields, locale, filters
+            ),
+        )
+
+    async def _load_products_by_category(
+        self,
+        category_id: int,
+        limit: int | None,
+        cursor: str | None,
+        sort: str | None,
+        include_total: bool,
+        fields: str,
+        locale: str | None,
+        filters: dict,
+    ) -> bytes:
+        generation = product_fragment_cache.generation
+        category = await self.category_repository.get_by_id(category_id)
+        if not category:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Category with id {category_id} not found"
+            )
+
+        if limit is not None:
+            return await self._get_products_page(
+                limit=limit,
+                cursor=cursor,
+                sort=sort,
+                include_total=include_total,
+                fields=fields,
+                generation=generation,
+                locale=locale,
+                category_id=category_id,
+                **filters,
+            )
+
+        rows = await self.product_repository.get_all(
+            projection=self._projection(fields), sort=sort, locale=locale, category_id=category_id, **filters
+        )
+        return await self._render_list(rows, fields, generation, total=len(rows))
+
+    async def get_product_facets(self, query: str | None = None, **filters) -> ProductFacetsResponse:
+        return await catalog_cache.get_or_load_async(
+            ("product_facets", query, product_filters_key(filters)),
+            lambda: self._load_product_facets(query, filters),
+        )
+
+    async def _load_product_facets(self, query: str | None, filters: dict) -> ProductFacetsResponse:
+        return ProductFacetsResponse.model_validate(await self.product_repository.get_facets(query=query, **filters))
@@ -0,0 +1,186 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
+
+from ..catalog_version import catalog_version
+from ..models.backfill_checkpoint import BackfillCheckpoint
+from ..models.category import Category
+from ..models.product import Product
+from .translation_service import TranslationError, TranslationService
+
+logger = logging.getLogger(__name__)
+
+# Checkpoint name -> (model, translatable source columns)
+BACKFILL_TARGETS = {
+    "translations:categories": (Category, ("name",)),
+    "translations:product": (Product, ("name", "description")),
+}
+
+
+def needs_translation(source_value: str | None, ru_value: str | None, en_value: str | None) -> bool:
+    source = (source_value or "").strip()
+    if not source:
+        return False
+    ru = (ru_value or "").strip()
+    en = (en_value or "").strip()
+    if not ru or not en:
+        return True
+    return ru == source and en == source
+
+
+class TranslationBackfill:
+    """Fill missing ``*_ru``/``*_en`` columns for existing rows.
+
+    Rows are scanned in primary-key order ``batch_size`` at a time. Each batch's strings are
+    split across ``workers`` threads, which pack them into as few translator requests as
+    possible; results are written with one executemany UPDATE per field and committed
+    together with a checkpoint, so an interrupted run resumes after the last committed batch.
+
+    Translation is strict: a string the translator failed on is left untranslated rather
+    than filled with its source text, and the checkpoint does not move past the first such
+    row, so the next run retries it. Each UPDATE only applies while the source text is still
+    the one that was translated; an admin edit made meanwhile wins.
+    """
+
+    def __init__(self, db: Session, workers: int = 4, batch_size: int = 200, restart: bool = False):
+        self.db = db
+        self.workers = max(workers, 1)
+        self.batch_size = max(batch_size, 1)
+        self.restart = restart
+
+    def run(self) -> None:
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="translation-backfill") as executor:
+            for name, (model, fields) in BACKFILL_TARGETS.items():
+                self._run_target(executor, name, model, fields)
+
+    def _load_checkpoint(self, name: str) -> BackfillCheckpoint:
+        checkpoint = self.db.get(BackfillCheckpoint, name)
+        if checkpoint is None:
+            checkpoint = BackfillCheckpoint(name=name, last_id=0, processed=0, updated=0)
+            self.db.add(checkpoint)
+        elif self.restart:
+            checkpoint.last_id = 0
+            checkpoint.processed = 0
+            checkpoint.updated = 0
+        self.db.commit()
+        return checkpoint
+
+    def _translate(
+        self, executor: ThreadPoolExecutor, texts: list[str]
+    ) -> list[tuple[str | None, str | None] | None]:
+        """``build_ru_en`` results for ``texts``, ``None`` where translation failed."""
+        if not texts:
+            return []
+        chunk_size = -(-len(texts) // self.workers)
+        chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+        results: list[tuple[str | None, str | None] | None] = []
+        for chunk_result in executor.map(self._translate_chunk, chunks):
+            results.extend(chunk_result)
+        return results
+
+    @staticmethod
+    def _translate_chunk(texts: list[str]) -> list[tuple[str | None, str | None] | None]:
+        try:
+            return TranslationService.build_ru_en_many(texts, strict=True)
+        except TranslationError:
+            pass
+        # Find out which strings failed; the ones that did get through are memo hits now.
+        results: list[tuple[str | None, str | None] | None] = []
+        for text in texts:
+            try:
+                results.append(TranslationService.build_ru_en(text, strict=True))
+            except TranslationError:
+                results.append(None)
+        return results
+
+    def _run_target(self, executor: ThreadPoolExecutor, name: str, model, fields: tuple[str, ...]) -> None:
+        checkpoint = self._load_checkpoint(name)
+        table = model.__table__
+        columns = [table.c.id]
+        for field in fields:
+            columns.extend((table.c[field], table.c[f"{field}_ru"], table.c[f"{field}_en"]))
+
+        update_stmts = {
+            field: (
+                table.update()
+                .where(table.c.id == bindparam("row_id"), table.c[field] == bindparam("source_text"))
+                .values({f"{field}_ru": bindparam("value_ru"), f"{field}_en": bindparam("value_en")})
+            )
+            for field in fields
+        }
+
+        started_at = time.monotonic()
+        processed_this_run = 0
+        failed_this_run = 0
+        scan_after_id = checkpoint.last_id
+        first_failed_id: int | None = None
+        logger.info("%s: starting after id %s", name, checkpoint.last_id)
+
+        while True:
+            rows = self.db.execute(
+                select(*columns).where(table.c.id > scan_after_id).order_by(table.c.id).limit(self.batch_size)
+            ).all()
+            if not rows:
+                break
+
+            pending: list[tuple[int, str, str]] = []
+            for row in rows:
+                for field in fields:
+                    mapping = row._mapping
+                    if needs_translation(mapping[field], mapping[f"{field}_ru"], mapping[f"{field}_en"]):
+                        pending.append((row.id, field, mapping[field]))
+
+            params_by_field: dict[str, list[dict]] = {field: [] for field in fields}
+            failed_row_ids: set[int] = set()
+            translations = self._translate(executor, [source_text for _, _, source_text in pending])
+            for (row_id, field, source_text), translation in zip(pending, translations):
+                if translation is None:
+                    failed_row_ids.add(row_id)
+                    continue
+                value_ru, value_en = translation
+                params_by_field[field].append(
+                    {"row_id": row_id, "source_text": source_text, "value_ru": value_ru, "value_en": value_en}
+                )
+
+            updated_row_ids: set[int] = set()
+            for field, params in params_by_field.items():
+                if params:
+                    self.db.connection().execute(update_stmts[field], params)
+                    updated_row_ids.update(item["row_id"] for item in params)
+            if updated_row_ids:
+                catalog_version.bump(self.db)
+
+            scan_after_id = rows[-1].id
+            if failed_row_ids and first_failed_id is None:
+                first_failed_id = min(failed_row_ids)
+                checkpoint.last_id = max(checkpoint.last_id, first_failed_id - 1)
+            elif first_failed_id is None:
+                checkpoint.last_id = scan_after_id
+            checkpoint.processed += len(rows)
+            checkpoint.updated += len(updated_row_ids)
+            self.db.commit()
+
+            processed_this_run += len(rows)
+            failed_this_run += len(failed_row_ids)
+            elapsed = max(time.monotonic() - started_at, 1e-6)
+            logger.info(
+                "%s: %s rows scanned (%s updated, %s failed this run), last id %s, %.1f rows/s",
+                name,
+                checkpoint.processed,
+                checkpoint.updated,
+                failed_this_run,
+                scan_after_id,
+                processed_this_run / elapsed,
+            )
+
+        if first_failed_id is not None:
+            logger.warning(
+                "%s: %s rows could not be translated; checkpoint kept before id %s so the next run retries them",
+                name,
+                failed_this_run,
+                first_failed_id,
+            )
+        logger.info("%s: done, %s rows scanned, %s updated", name, checkpoint.processed, checkpoint.updated)
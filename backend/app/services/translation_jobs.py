@@ -0,0 +1,145 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import SessionLocal
+from ..repositories.category_repository import CategoryRepository
+from ..repositories.product_repository import ProductRepository
+from ..repositories.translation_job_repository import TranslationJobRepository
+from .catalog_cache import invalidate_categories, invalidate_product
+from .translation_service import TranslationError, TranslationService
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_TRANSLATABLE_FIELDS = ("name", "description")
+
+
+def enqueue_product_translations(db: Session, product_id: int, sources: dict[str, str | None]) -> None:
+    repository = TranslationJobRepository(db)
+    for field, source_text in sources.items():
+        if source_text:
+            repository.enqueue("product", product_id, field, source_text)
+    translation_worker.notify()
+
+
+def enqueue_category_translation(db: Session, category_id: int, name: str) -> None:
+    TranslationJobRepository(db).enqueue("category", category_id, "name", name)
+    translation_worker.notify()
+
+
+class TranslationWorker:
+    """Drains the ``translation_jobs`` table with a pool of asyncio tasks.
+
+    Translation calls are blocking HTTP requests, so each job runs in a thread via
+    ``asyncio.to_thread``; the pool size bounds how many run at once.
+    """
+
+    def __init__(self, concurrency: int, poll_seconds: float):
+        self.concurrency = concurrency
+        self.poll_seconds = poll_seconds
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._queue: asyncio.Queue[int] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._queued_ids: set[int] = set()
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._queue = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        self._tasks = [asyncio.create_task(self._dispatch())]
+        self._tasks.extend(asyncio.create_task(self._work()) for _ in range(self.concurrency))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queued_ids.clear()
+        self._loop = None
+
+    def notify(self) -> None:
+        """Wake the dispatcher; safe to call from request threads."""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _dispatch(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                job_ids = await asyncio.to_thread(self._fetch_due_ids)
+            except Exception:
+                logger.exception("Failed to poll translation jobs")
+                job_ids = []
+
+            for job_id in job_ids:
+                if job_id not in self._queued_ids:
+                    self._queued_ids.add(job_id)
+                    await self._queue.put(job_id)
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _work(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await asyncio.to_thread(run_translation_job, job_id)
+            except Exception:
+                logger.exception("Translation job %s crashed", job_id)
+            finally:
+                self._queued_ids.discard(job_id)
+                self._queue.task_done()
+
+    def _fetch_due_ids(self) -> list[int]:
+        with SessionLocal() as db:
+            repository = TranslationJobRepository(db)
+            requeued = repository.requeue_expired(settings.translation_job_lease_seconds)
+            if requeued:
+                logger.info("Requeued %s interrupted translation jobs", requeued)
+            return repository.get_due_ids(limit=self.concurrency * 2)
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    seconds = settings.translation_retry_base_seconds * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(seconds, settings.translation_retry_max_seconds))
+
+
+def run_translation_job(job_id: int) -> None:
+    with SessionLocal() as db:
+        repository = TranslationJobRepository(db)
+        if not repository.claim(job_id):
+            return
+        job = repository.get_by_id(job_id)
+
+        try:
+            value_ru, value_en = TranslationService.build_ru_en(job.source_text, strict=True)
+        except TranslationError as exc:
+            retry_at = None
+            if job.attempts < settings.translation_max_attempts:
+                retry_at = datetime.utcnow() + _retry_delay(job.attempts)
+            repository.mark_failed(job, str(exc), retry_at)
+            return
+
+        if job.entity_type == "product":
+            if ProductRepository(db).apply_translation(job.entity_id, job.field, job.source_text, value_ru, value_en):
+                invalidate_product(job.entity_id)
+        elif job.entity_type == "category":
+            if CategoryRepository(db).apply_translation(job.entity_id, job.source_text, value_ru, value_en):
+                invalidate_categories()
+
+        repository.mark_done(job)
+
+
+translation_worker = TranslationWorker(
+    concurrency=settings.translation_workers,
+    poll_seconds=settings.translation_poll_seconds,
+)
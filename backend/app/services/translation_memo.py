@@ -0,0 +1,86 @@
+import hashlib
+import logging
+import threading
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..cache import MISSING, TTLCache
+from ..config import settings
+from ..database import SessionLocal
+from ..repositories.translation_repository import TranslationRepository
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class TranslationMemo:
+    """Two-tier memo of finished translations: a bounded in-memory LRU over the ``translations`` table.
+
+    Database errors are logged and treated as misses so a locked or missing table never
+    breaks translation itself.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.memory = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+        self.database_hits = 0
+        self.stores = 0
+
+    def get(self, text: str, source_lang: str, target_lang: str) -> str | None:
+        key = (text_hash(text), source_lang, target_lang)
+        value = self.memory.get(key)
+        if value is not MISSING:
+            return value
+
+        try:
+            with SessionLocal() as db:
+                translation = TranslationRepository(db).get(*key)
+        except SQLAlchemyError:
+            logger.warning("Translation memo lookup failed", exc_info=True)
+            return None
+
+        if translation is None:
+            return None
+        with self._lock:
+            self.database_hits += 1
+        self.memory.set(key, translation.translated_text)
+        return translation.translated_text
+
+    def put(self, text: str, source_lang: str, target_lang: str, translated_text: str) -> None:
+        key = (text_hash(text), source_lang, target_lang)
+        self.memory.set(key, translated_text)
+        try:
+            with SessionLocal() as db:
+                TranslationRepository(db).save(*key, normalize_text(text), translated_text)
+        except SQLAlchemyError:
+            logger.warning("Translation memo store failed", exc_info=True)
+            return
+        with self._lock:
+            self.stores += 1
+
+    def stats(self) -> dict:
+        memory_stats = self.memory.stats()
+        lookups = memory_stats["hits"] + memory_stats["misses"]
+        hits = memory_stats["hits"] + self.database_hits
+        return {
+            "memory_hits": memory_stats["hits"],
+            "database_hits": self.database_hits,
+            "misses": lookups - hits,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "stores": self.stores,
+            "memory_size": memory_stats["size"],
+            "memory_max_entries": memory_stats["max_entries"],
+        }
+
+
+translation_memo = TranslationMemo(
+    max_entries=settings.translation_memo_max_entries,
+    ttl_seconds=settings.translation_memo_ttl_seconds,
+)
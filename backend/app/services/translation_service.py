@@ -2,9 +2,18 @@
 import re
 from urllib import error, parse, request
 
+from ..config import settings
+from .translation_memo import translation_memo
+
+
+class TranslationError(Exception):
+    pass
+
 
 class TranslationService:
     GOOGLE_TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
+    # Budget for the URL-encoded ``q`` parameter when several strings share one request.
+    BATCH_MAX_ENCODED_LENGTH = 5000
     _EN_LAYOUT = "`qwertyuiop[]asdfghjkl;'zxcvbnm,./"
     _RU_LAYOUT = "ёйцукенгшщзхъфывапролджэячсмитьбю."
     _EN_TO_RU_LAYOUT_MAP = str.maketrans(_EN_LAYOUT + _EN_LAYOUT.upper(), _RU_LAYOUT + _RU_LAYOUT.upper())
@@ -26,22 +35,21 @@ class TranslationService:
         mapped = value.translate(cls._EN_TO_RU_LAYOUT_MAP if to_ru else cls._RU_TO_EN_LAYOUT_MAP)
         return mapped.strip() or value
 
-    @classmethod
-    def translate_text(cls, text: str, target_lang: str, source_lang: str = "auto") -> str:
-        source = (source_lang or "auto").strip() or "auto"
-        target = (target_lang or "").strip().lower()
-        content = (text or "").strip()
+    @staticmethod
+    def _stub_translate(content: str, target_lang: str) -> str:
+        # Deterministic offline translator for tests and local development.
+        return f"[{target_lang}] {content}"
 
-        if not content or not target:
-            return content
-        if source == target:
-            return content
+    @classmethod
+    def _request_translation(cls, content: str, target_lang: str, source_lang: str) -> str:
+        if settings.translation_backend == "stub":
+            return cls._stub_translate(content, target_lang)
 
         query = parse.urlencode(
             {
                 "client": "gtx",
-                "sl": source,
-                "tl": target,
+                "sl": source_lang,
+                "tl": target_lang,
                 "dt": "t",
                 "q": content,
             }
@@ -49,35 +57,151 @@ class TranslationService:
         url = f"{cls.GOOGLE_TRANSLATE_URL}?{query}"
 
         try:
-            with request.urlopen(url, timeout=8) as response:
+            with request.urlopen(url, timeout=settings.translation_timeout_seconds) as response:
                 body = response.read().decode("utf-8")
                 payload = json.loads(body)
-        except (error.URLError, error.HTTPError, TimeoutError, ValueError):
-            return content
+        except (error.URLError, error.HTTPError, TimeoutError, ValueError) as exc:
+            raise TranslationError(f"Translation request failed: {exc}") from exc
 
         try:
             chunks = payload[0]
             translated = "".join(chunk[0] for chunk in chunks if isinstance(chunk, list) and chunk and chunk[0])
-            return translated.strip() or content
-        except (TypeError, IndexError, KeyError):
-            return content
+        except (TypeError, IndexError, KeyError) as exc:
+            raise TranslationError("Unexpected translation response") from exc
+        return translated.strip() or content
 
     @classmethod
-    def build_ru_en(cls, text: str | None) -> tuple[str | None, str | None]:
-        value = (text or "").strip()
-        if not value:
-            return None, None
+    def _request_translation_batch(cls, contents: list[str], target_lang: str, source_lang: str) -> list[str]:
+        """Translate single-line strings in one request by joining them with newlines."""
+        if settings.translation_backend == "stub":
+            return [cls._stub_translate(content, target_lang) for content in contents]
+        if len(contents) == 1:
+            return [cls._request_translation(contents[0], target_lang, source_lang)]
+
+        translated = cls._request_translation("\n".join(contents), target_lang, source_lang).split("\n")
+        if len(translated) != len(contents):
+            raise TranslationError("Batched translation returned a different number of lines")
+        return [line.strip() or content for line, content in zip(translated, contents)]
+
+    @classmethod
+    def _pack_batches(cls, contents: list[str]) -> list[list[str]]:
+        batches: list[list[str]] = []
+        current: list[str] = []
+        current_length = 0
+        for content in contents:
+            encoded_length = len(parse.quote(content)) + 3
+            if "\n" in content:
+                batches.append([content])
+                continue
+            if current and current_length + encoded_length > cls.BATCH_MAX_ENCODED_LENGTH:
+                batches.append(current)
+                current, current_length = [], 0
+            current.append(content)
+            current_length += encoded_length
+        if current:
+            batches.append(current)
+        return batches
+
+    @classmethod
+    def translate_many(
+        cls,
+        texts: list[str],
+        target_lang: str,
+        source_lang: str = "auto",
+        strict: bool = False,
+    ) -> list[str]:
+        """Batch variant of ``translate_text``: memo hits are free, misses share as few requests as possible."""
+        source = (source_lang or "auto").strip() or "auto"
+        target = (target_lang or "").strip().lower()
+        contents = [(text or "").strip() for text in texts]
+        if not target or source == target:
+            return contents
+
+        results: dict[str, str] = {}
+        misses: list[str] = []
+        for content in dict.fromkeys(contents):
+            if not content:
+                results[content] = content
+                continue
+            memoized = translation_memo.get(content, source, target)
+            if memoized is None:
+                misses.append(content)
+            else:
+                results[content] = memoized
+
+        for batch in cls._pack_batches(misses):
+            try:
+                translated_batch = cls._request_translation_batch(batch, target, source)
+            except TranslationError:
+                # Fall back to one request per string; a batch split mismatch is not fatal.
+                translated_batch = [cls.translate_text(content, target, source, strict=strict) for content in batch]
+                results.update(zip(batch, translated_batch))
+                continue
+            for content, translated in zip(batch, translated_batch):
+                results[content] = translated
+                translation_memo.put(content, source, target, translated)
 
+        return [results[content] for content in contents]
+
+    @classmethod
+    def translate_text(cls, text: str, target_lang: str, source_lang: str = "auto", strict: bool = False) -> str:
+        """Translate ``text``; on failure return it unchanged, or raise ``TranslationError`` if ``strict``."""
+        source = (source_lang or "auto").strip() or "auto"
+        target = (target_lang or "").strip().lower()
+        content = (text or "").strip()
+
+        if not content or not target:
+            return content
+        if source == target:
+            return content
+
+        memoized = translation_memo.get(content, source, target)
+        if memoized is not None:
+            return memoized
+
+        try:
+            translated = cls._request_translation(content, target, source)
+        except TranslationError:
+            if strict:
+                raise
+            return content
+
+        translation_memo.put(content, source, target, translated)
+        return translated
+
+    @classmethod
+    def _finalize_ru_en(cls, value: str, translated: str | None) -> tuple[str, str]:
         if cls._contains_cyrillic(value):
-            ru = value
-            en = cls.translate_text(value, target_lang="en", source_lang="ru")
+            en = translated
             if (en or "").strip().lower() == value.lower():
                 en = cls._keyboard_layout_fallback(value, to_ru=False)
-            return ru or value, en or value
+            return value, en or value
 
-        en = value
-        ru = cls.translate_text(value, target_lang="ru", source_lang="en")
+        ru = translated
         if cls._contains_latin(value) and (ru or "").strip().lower() == value.lower():
             ru = cls._keyboard_layout_fallback(value, to_ru=True)
-        return ru or value, en or value
+        return ru or value, value
+
+    @classmethod
+    def build_ru_en(cls, text: str | None, strict: bool = False) -> tuple[str | None, str | None]:
+        value = (text or "").strip()
+        if not value:
+            return None, None
+
+        if cls._contains_cyrillic(value):
+            translated = cls.translate_text(value, target_lang="en", source_lang="ru", strict=strict)
+        else:
+            translated = cls.translate_text(value, target_lang="ru", source_lang="en", strict=strict)
+        return cls._finalize_ru_en(value, translated)
+
+    @classmethod
+    def build_ru_en_many(cls, texts: list[str | None], strict: bool = False) -> list[tuple[str | None, str | None]]:
+        """Batch variant of ``build_ru_en``."""
+        values = [(text or "").strip() for text in texts]
+        ru_sources = [value for value in values if value and cls._contains_cyrillic(value)]
+        en_sources = [value for value in values if value and not cls._contains_cyrillic(value)]
+
+        translated = dict(zip(ru_sources, cls.translate_many(ru_sources, "en", "ru", strict=strict)))
+        translated.update(zip(en_sources, cls.translate_many(en_sources, "ru", "en", strict=strict)))
 
+        return [cls._finalize_ru_en(value, translated[value]) if value else (None, None) for value in values]
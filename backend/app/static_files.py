@@ -0,0 +1,53 @@
+"""Static delivery for uploaded product images.
+
+Uploads are stored under the SHA-256 of their bytes (see ``routes/admin.py``), and their
+derivatives add a ``_<variant>`` suffix to that name. A file name therefore never changes
+content, and such files are sent with a one-year ``immutable`` ``Cache-Control``. Other
+files (uploads from before content addressing) stay cacheable but are revalidated, which
+the ``ETag``/``Last-Modified`` checks of ``StaticFiles`` answer with a 304. ``Range``
+requests are served by ``FileResponse``.
+
+Clients that accept WebP get the ``.webp`` copy of a JPEG/PNG variant when one exists.
+"""
+
+import re
+import stat
+from pathlib import PurePosixPath
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+FINGERPRINTED_NAME = re.compile(r"^[0-9a-f]{64}(_[a-z0-9]+)?\.[a-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+WEBP_NEGOTIABLE_SUFFIXES = {".jpg", ".jpeg", ".png"}
+
+
+class ImageStaticFiles(StaticFiles):
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        requested = PurePosixPath(path)
+        negotiable = requested.suffix.lower() in WEBP_NEGOTIABLE_SUFFIXES
+        response = None
+        if negotiable and scope["method"] in ("GET", "HEAD") and self._accepts_webp(scope):
+            full_path, stat_result = await anyio.to_thread.run_sync(
+                self.lookup_path, str(requested.with_suffix(".webp"))
+            )
+            if stat_result and stat.S_ISREG(stat_result.st_mode):
+                response = self.file_response(full_path, stat_result, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        if FINGERPRINTED_NAME.match(requested.name):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+        if negotiable:
+            response.headers["Vary"] = "Accept"
+        return response
+
+    @staticmethod
+    def _accepts_webp(scope: Scope) -> bool:
+        return "image/webp" in Headers(scope=scope).get("accept", "")
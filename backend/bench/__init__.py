@@ -0,0 +1 @@
+"""Reproducible benchmarks. Run from ``backend/`` as ``python -m bench.<name>``."""
@@ -0,0 +1,47 @@
+"""Pricing a cart from eager-loaded products vs the column-only pricing query.
+
+    python -m bench.cart_pricing [--items 50] [--repeat 300]
+"""
+import argparse
+
+from .common import seed_products, timed, use_scratch_database
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+
+    use_scratch_database("cart-pricing")
+    from app.database import SessionLocal, init_db
+    from app.services.cart_service import CartService, build_cart_response
+
+    init_db()
+    with SessionLocal() as db:
+        # Four images and a ~2.4 KB description per product, like a real catalog row.
+        product_ids = seed_products(db, 200, images=4, description_words=200)
+        cart = {product_id: 2 for product_id in product_ids[: args.items]}
+        service = CartService(db)
+
+        def eager_loaded():
+            products = service.product_repository.get_multiple_by_ids(list(cart))
+            rows = [
+                (p.id, p.name, p.name_ru, p.name_en, p.price, p.primary_image_url or p.image_url) for p in products
+            ]
+            response = build_cart_response(cart, rows)
+            db.expunge_all()
+            return response
+
+        def pricing_query():
+            response = service.get_cart_details(cart)
+            db.expunge_all()
+            return response
+
+        assert eager_loaded() == pricing_query(), "both paths must price the cart identically"
+        for label, fn in (("eager-loaded products", eager_loaded), ("pricing query", pricing_query)):
+            print(f"{label:<22} {timed(fn, args.repeat) * 1000:.2f} ms per {args.items}-item cart")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import atexit
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+
+def use_scratch_database(name: str, **env: str) -> Path:
+    """Point the app at a throwaway SQLite file; call before anything imports ``app``.
+
+    Extra keyword arguments are exported as environment variables, so a run can
+    override any setting (``SQLITE_SYNCHRONOUS="FULL"`` and so on).
+    """
+    workdir = Path(tempfile.mkdtemp(prefix=f"bench-{name}-"))
+    atexit.register(shutil.rmtree, workdir, ignore_errors=True)
+    os.environ.update(
+        DATABASE_URL=f"sqlite:///{workdir / 'shop.db'}",
+        STATIC_DIR=str(workdir / "static"),
+        IMAGES_DIR=str(workdir / "static" / "images"),
+        TRANSLATION_WORKER_ENABLED="false",
+        TRANSLATION_BACKEND="stub",
+    )
+    os.environ.update(env)
+    return workdir
+
+
+def seed_products(db, count: int, *, images: int = 0, description_words: int = 40) -> list[int]:
+    """Insert ``count`` products into a fresh category and return their ids."""
+    from app.models import Category, Product, ProductImage
+
+    category = Category(name="Bench", slug="bench", name_ru="Bench", name_en="Bench")
+    db.add(category)
+    db.flush()
+    products = []
+    for i in range(count):
+        product = Product(
+            name=f"Product {i}",
+            name_ru=f"Product {i}",
+            name_en=f"Product {i}",
+            description="lorem ipsum " * description_words,
+            price=10 + i % 90,
+            category_id=category.id,
+            image_url=f"/static/images/{i}.jpg",
+        )
+        product.product_images = [
+            ProductImage(image_url=f"/static/images/{i}-{k}.jpg", sort_order=k) for k in range(images)
+        ]
+        products.append(product)
+    db.add_all(products)
+    db.commit()
+    return [product.id for product in products]
+
+
+def timed(fn, repeat: int) -> float:
+    """Mean seconds per call of ``fn`` after one warm-up call."""
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat
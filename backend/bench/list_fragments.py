@@ -0,0 +1,84 @@
+"""Rendering an unpaginated product list: per-request model_validate vs cached JSON fragments.
+
+Both paths start from a list-cache miss. "warm" reuses the per-product
+fragments, "cold" builds every fragment from scratch.
+
+    python -m bench.list_fragments [--products 1000 10000] [--repeat 5]
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+from .common import seed_products, use_scratch_database
+
+
+async def run(count: int, repeat: int) -> None:
+    from fastapi.encoders import jsonable_encoder
+
+    from app.database import AsyncSessionLocal, SessionLocal, init_db
+    from app.repositories.product_repository import AsyncProductRepository
+    from app.schemas.product import ProductListResponse, ProductResponse
+    from app.services.catalog_cache import catalog_cache, product_fragment_cache
+    from app.services.product_service import AsyncProductService
+
+    init_db()
+    with SessionLocal() as db:
+        seed_products(db, count, images=2)
+
+    async def model_validate() -> bytes:
+        async with AsyncSessionLocal() as db:
+            products = await AsyncProductRepository(db).get_all()
+            response = ProductListResponse(
+                products=[ProductResponse.model_validate(p) for p in products], total=len(products)
+            )
+            # What FastAPI does with a response_model before encoding the body.
+            validated = ProductListResponse.model_validate(response.model_dump())
+            return json.dumps(jsonable_encoder(validated), ensure_ascii=False).encode()
+
+    async def fragments() -> bytes:
+        catalog_cache.clear()
+        async with AsyncSessionLocal() as db:
+            return await AsyncProductService(db).get_all_products()
+
+    async def timed(fn) -> float:
+        await fn()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            await fn()
+        return (time.perf_counter() - started) / repeat
+
+    expected = json.loads(await model_validate())
+    product_fragment_cache.clear()
+    started = time.perf_counter()
+    assert json.loads(await fragments()) == expected, "both paths must render the same body"
+    cold = time.perf_counter() - started
+
+    print(f"{count:>6} products  model_validate   {await timed(model_validate) * 1000:8.1f} ms")
+    print(f"{count:>6} products  fragments, warm  {await timed(fragments) * 1000:8.1f} ms")
+    print(f"{count:>6} products  fragments, cold  {cold * 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        use_scratch_database(f"list-{args.products[0]}")
+        asyncio.run(run(args.products[0], args.repeat))
+        return
+    # One process per size so every run gets its own database and empty caches.
+    for count in args.products:
+        subprocess.run(
+            [sys.executable, "-m", "bench.list_fragments", "--child", "--products", str(count), "--repeat", str(args.repeat)],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Catalog read latency while a crowd of clients logs in.
+
+Starts uvicorn on a scratch database, runs 4 clients reading
+GET /api/products?limit=20 alone and then next to 64 clients logging in,
+and reports read p50/p99 plus the login status codes. Logins that get a
+503 wait for Retry-After before trying again.
+
+    python -m bench.login_storm [--seconds 8] [--logins 64] [--port 8765]
+"""
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+
+from .common import seed_products, use_scratch_database
+
+EMAIL = "bench@example.com"
+PASSWORD = "password123"
+
+
+def request(conn: http.client.HTTPConnection, method: str, path: str, body: dict | None = None):
+    payload = json.dumps(body) if body is not None else None
+    headers = {"Content-Type": "application/json"} if body is not None else {}
+    conn.request(method, path, body=payload, headers=headers)
+    response = conn.getresponse()
+    response.read()
+    return response
+
+
+def wait_for_server(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            request(conn, "GET", "/api/products?limit=1")
+            conn.close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+def run_load(port: int, seconds: float, readers: int, logins: int) -> None:
+    latencies: list[float] = []
+    codes: Counter = Counter()
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def reader() -> None:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            request(conn, "GET", "/api/products?limit=20")
+            with lock:
+                latencies.append((time.perf_counter() - started) * 1000)
+            time.sleep(0.005)
+
+    def login() -> None:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        while time.monotonic() < deadline:
+            response = request(conn, "POST", "/api/auth/login", {"email": EMAIL, "password": PASSWORD})
+            with lock:
+                codes[response.status] += 1
+            if response.status == 503:
+                time.sleep(float(response.getheader("Retry-After", "1")))
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=login) for _ in range(logins)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    label = f"{logins} logins" if logins else "no logins"
+    print(f"{label:<10} reads={len(latencies):<6} p50={p50:6.1f} ms  p99={p99:7.1f} ms  logins={dict(codes)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=8.0)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    use_scratch_database("login-storm")
+    from app.database import SessionLocal, init_db
+    from app.schemas.auth import RegisterRequest
+    from app.services.auth_service import AuthService
+
+    init_db()
+    with SessionLocal() as db:
+        seed_products(db, 200, images=2)
+        AuthService(db).register(RegisterRequest(email=EMAIL, full_name="Bench", password=PASSWORD))
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"],
+        env=os.environ.copy(),
+    )
+    try:
+        wait_for_server(args.port)
+        run_load(args.port, args.seconds, args.readers, 0)
+        run_load(args.port, args.seconds, args.readers, args.logins)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
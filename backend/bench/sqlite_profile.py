@@ -0,0 +1,104 @@
+"""Catalog reads and price writes under the default SQLite profile vs a rollback-journal baseline.
+
+Each profile runs in its own process because the engine reads its pragmas at import:
+
+    python -m bench.sqlite_profile [--seconds 5] [--readers 8] [--rows 2000]
+"""
+import argparse
+import subprocess
+import sys
+import threading
+import time
+
+from .common import use_scratch_database
+
+PROFILES = {
+    "baseline": {
+        "SQLITE_JOURNAL_MODE": "DELETE",
+        "SQLITE_SYNCHRONOUS": "FULL",
+        "SQLITE_CACHE_SIZE_KIB": "2000",
+        "SQLITE_MMAP_SIZE": "0",
+    },
+    # Whatever app.config ships with.
+    "configured": {},
+}
+
+
+def run_profile(profile: str, seconds: float, readers: int, rows: int) -> None:
+    use_scratch_database(f"sqlite-{profile}", **PROFILES[profile])
+    from sqlalchemy import text
+
+    from app.database import SessionLocal, engine, init_db
+
+    from .common import seed_products
+
+    init_db()
+    with SessionLocal() as db:
+        seed_products(db, rows)
+
+    deadline = time.monotonic() + seconds
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+
+    def bump(key: str) -> None:
+        with lock:
+            counts[key] += 1
+
+    def reader() -> None:
+        while time.monotonic() < deadline:
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT id, name, price FROM product ORDER BY id DESC LIMIT 20")).all()
+                bump("reads")
+            except Exception:
+                bump("errors")
+
+    def writer() -> None:
+        row = 0
+        while time.monotonic() < deadline:
+            try:
+                with engine.begin() as conn:
+                    conn.execute(text("UPDATE product SET price = price + 1 WHERE id = :id"), {"id": row % rows + 1})
+                bump("writes")
+            except Exception:
+                bump("errors")
+            row += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)] + [threading.Thread(target=writer)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(
+        f"{profile:<10} {counts['reads'] / seconds:>9.0f} reads/s {counts['writes'] / seconds:>7.0f} writes/s "
+        f"{counts['errors']} errors"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--profile", choices=PROFILES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.profile:
+        run_profile(args.profile, args.seconds, args.readers, args.rows)
+        return
+    for profile in PROFILES:
+        subprocess.run(
+            [
+                sys.executable, "-m", "bench.sqlite_profile",
+                "--profile", profile,
+                "--seconds", str(args.seconds),
+                "--readers", str(args.readers),
+                "--rows", str(args.rows),
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Settings are read when ``app`` is first imported, so point it at a scratch database first.
+_workdir = Path(tempfile.mkdtemp(prefix="shop-tests-"))
+os.environ.update(
+    DATABASE_URL=f"sqlite:///{_workdir / 'shop.db'}",
+    STATIC_DIR=str(_workdir / "static"),
+    IMAGES_DIR=str(_workdir / "static" / "images"),
+    TRANSLATION_WORKER_ENABLED="false",
+    TRANSLATION_BACKEND="stub",
+)
+
+from app.database import SessionLocal, init_db  # noqa: E402
+from app.models import Category, Product, TranslationJob  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    init_db()
+    yield
+    shutil.rmtree(_workdir, ignore_errors=True)
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.query(TranslationJob).delete()
+        session.commit()
+        session.close()
+
+
+@pytest.fixture
+def product(db):
+    category = Category(name="Test category", slug="test-category")
+    product = Product(name="Test product", description="Test description", price=10.0, category=category)
+    db.add(product)
+    db.commit()
+    yield product
+    db.delete(product)
+    db.delete(category)
+    db.commit()
@@ -0,0 +1,149 @@
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from app.services.google_id_token import (
+    GoogleKeyCache,
+    GoogleTokenError,
+    StaticKeySource,
+    google_keys,
+    verify_google_id_token,
+)
+
+CLIENT_ID = "client-id.apps.googleusercontent.com"
+
+
+def _private_pem() -> bytes:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+
+
+def _public_jwk(private_pem: bytes, kid: str) -> dict:
+    public = jwk.construct(private_pem, "RS256").public_key().to_dict()
+    return {**public, "kid": kid, "use": "sig"}
+
+
+def _token(private_pem: bytes, kid: str, **overrides) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "1234567890",
+        "email": "user@example.com",
+        "iat": now,
+        "exp": now + 600,
+        **overrides,
+    }
+    return jwt.encode(claims, private_pem, algorithm="RS256", headers={"kid": kid})
+
+
+class CountingKeySource(StaticKeySource):
+    def __init__(self, jwks: dict):
+        super().__init__(jwks)
+        self.fetches = 0
+
+    def fetch(self):
+        self.fetches += 1
+        return super().fetch()
+
+
+@pytest.fixture(scope="module")
+def signing_key() -> bytes:
+    return _private_pem()
+
+
+@pytest.fixture
+def key_source(signing_key):
+    original = google_keys.source
+    source = CountingKeySource({"keys": [_public_jwk(signing_key, "key-1")]})
+    google_keys.set_source(source)
+    yield source
+    google_keys.set_source(original)
+
+
+def test_valid_token_returns_claims(signing_key, key_source):
+    claims = verify_google_id_token(_token(signing_key, "key-1"), CLIENT_ID)
+
+    assert claims["sub"] == "1234567890"
+    assert claims["email"] == "user@example.com"
+
+
+def test_keys_are_cached_between_logins(signing_key, key_source):
+    for _ in range(3):
+        verify_google_id_token(_token(signing_key, "key-1"), CLIENT_ID)
+
+    assert key_source.fetches == 1
+
+
+def test_rejects_other_audience(signing_key, key_source):
+    with pytest.raises(GoogleTokenError) as exc_info:
+        verify_google_id_token(_token(signing_key, "key-1", aud="someone-else"), CLIENT_ID)
+
+    assert exc_info.value.detail == "Google token audience mismatch"
+    assert exc_info.value.status_code == 401
+
+
+def test_rejects_other_issuer(signing_key, key_source):
+    with pytest.raises(GoogleTokenError, match="Invalid Google token"):
+        verify_google_id_token(_token(signing_key, "key-1", iss="https://evil.example.com"), CLIENT_ID)
+
+
+def test_rejects_expired_token(signing_key, key_source):
+    issued = int(time.time()) - 7200
+    token = _token(signing_key, "key-1", iat=issued, exp=issued + 3600)
+
+    with pytest.raises(GoogleTokenError, match="Google token is expired"):
+        verify_google_id_token(token, CLIENT_ID)
+
+
+def test_rejects_token_signed_by_another_key(key_source):
+    forged = _token(_private_pem(), "key-1")
+
+    with pytest.raises(GoogleTokenError, match="Invalid Google token"):
+        verify_google_id_token(forged, CLIENT_ID)
+
+
+def test_rejects_token_without_kid(signing_key, key_source):
+    token = jwt.encode({"aud": CLIENT_ID}, signing_key, algorithm="RS256")
+
+    with pytest.raises(GoogleTokenError, match="Invalid Google token"):
+        verify_google_id_token(token, CLIENT_ID)
+
+
+def test_unknown_kid_refreshes_the_key_set(signing_key, key_source, monkeypatch):
+    monkeypatch.setattr(google_keys, "min_refresh_seconds", 0)
+    verify_google_id_token(_token(signing_key, "key-1"), CLIENT_ID)
+    rotated_key = _private_pem()
+    key_source.jwks = {"keys": [_public_jwk(rotated_key, "key-2")]}
+
+    claims = verify_google_id_token(_token(rotated_key, "key-2"), CLIENT_ID)
+
+    assert claims["sub"] == "1234567890"
+    assert key_source.fetches == 2
+
+
+def test_unknown_kid_refresh_is_rate_limited(signing_key):
+    source = CountingKeySource({"keys": [_public_jwk(signing_key, "key-1")]})
+    cache = GoogleKeyCache(source, min_refresh_seconds=60)
+
+    assert cache.get_key("key-1") is not None
+    assert cache.get_key("unknown") is None
+    assert cache.get_key("unknown") is None
+    assert source.fetches == 1
+
+
+def test_key_fetch_failure_is_a_503(signing_key, key_source, monkeypatch):
+    def unavailable():
+        raise OSError("network down")
+
+    monkeypatch.setattr(key_source, "fetch", unavailable)
+
+    with pytest.raises(GoogleTokenError) as exc_info:
+        verify_google_id_token(_token(signing_key, "key-1"), CLIENT_ID)
+
+    assert exc_info.value.status_code == 503
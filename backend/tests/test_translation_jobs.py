@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.config import settings
+from app.models import TranslationJob
+from app.repositories.translation_job_repository import TranslationJobRepository
+from app.services.translation_jobs import run_translation_job
+from app.services.translation_service import TranslationError, TranslationService
+
+
+@pytest.fixture
+def failing_translator(monkeypatch):
+    def fail(cls, content, target_lang, source_lang):
+        raise TranslationError("service unavailable")
+
+    monkeypatch.setattr(TranslationService, "_request_translation", classmethod(fail))
+
+
+def _enqueue(db, product, source_text: str) -> TranslationJob:
+    return TranslationJobRepository(db).enqueue("product", product.id, "name", source_text)
+
+
+def _reload(db, job_id: int) -> TranslationJob:
+    db.expire_all()
+    return db.get(TranslationJob, job_id)
+
+
+def test_job_stores_translation(db, product):
+    product.name = "Red kettle"
+    db.commit()
+    job = _enqueue(db, product, "Red kettle")
+
+    run_translation_job(job.id)
+
+    job = _reload(db, job.id)
+    assert job.status == "done"
+    assert job.attempts == 1
+    db.refresh(product)
+    assert (product.name_ru, product.name_en) == ("[ru] Red kettle", "Red kettle")
+
+
+def test_job_skips_product_edited_meanwhile(db, product):
+    job = _enqueue(db, product, "Name before the edit")
+
+    run_translation_job(job.id)
+
+    assert _reload(db, job.id).status == "done"
+    db.refresh(product)
+    assert product.name_ru is None
+
+
+def test_failed_job_is_retried_with_exponential_backoff(db, product, failing_translator):
+    job = _enqueue(db, product, "Blue kettle")
+
+    for attempt in (1, 2, 3):
+        started = datetime.utcnow()
+        run_translation_job(job.id)
+
+        job = _reload(db, job.id)
+        delay = min(settings.translation_retry_base_seconds * 2 ** (attempt - 1), settings.translation_retry_max_seconds)
+        assert job.status == "pending"
+        assert job.attempts == attempt
+        assert job.last_error == "service unavailable"
+        assert started + timedelta(seconds=delay) <= job.next_attempt_at <= datetime.utcnow() + timedelta(seconds=delay)
+
+
+def test_backoff_is_capped(db, product, failing_translator, monkeypatch):
+    monkeypatch.setattr(settings, "translation_retry_max_seconds", 7.0)
+    job = _enqueue(db, product, "Green kettle")
+    job.attempts = 3
+    db.commit()
+
+    run_translation_job(job.id)
+
+    job = _reload(db, job.id)
+    assert job.attempts == 4
+    assert job.next_attempt_at <= datetime.utcnow() + timedelta(seconds=7)
+
+
+def test_job_fails_permanently_after_max_attempts(db, product, failing_translator):
+    job = _enqueue(db, product, "Yellow kettle")
+    job.attempts = settings.translation_max_attempts - 1
+    db.commit()
+
+    run_translation_job(job.id)
+
+    job = _reload(db, job.id)
+    assert job.status == "failed"
+    assert job.attempts == settings.translation_max_attempts
+    assert job.last_error == "service unavailable"
+    assert TranslationJobRepository(db).get_due_ids(limit=10) == []
+
+
+def test_enqueue_revives_a_failed_job(db, product):
+    job = _enqueue(db, product, "Old name")
+    job.status = "failed"
+    job.attempts = settings.translation_max_attempts
+    db.commit()
+
+    revived = _enqueue(db, product, "New name")
+
+    assert revived.id == job.id
+    assert (revived.status, revived.attempts, revived.source_text) == ("pending", 0, "New name")
+
+
+def test_claimed_job_is_not_run_twice(db, product):
+    job = _enqueue(db, product, "Grey kettle")
+    repository = TranslationJobRepository(db)
+
+    assert repository.claim(job.id)
+    assert not repository.claim(job.id)
+
+
+def test_requeue_only_returns_jobs_past_their_lease(db, product):
+    repository = TranslationJobRepository(db)
+    orphaned = repository.enqueue("product", product.id, "name", "Orphaned")
+    live = repository.enqueue("product", product.id, "description", "Still running")
+    assert repository.claim(orphaned.id) and repository.claim(live.id)
+    _reload(db, orphaned.id).updated_at = datetime.utcnow() - timedelta(seconds=120)
+    db.commit()
+
+    assert repository.requeue_expired(lease_seconds=60) == 1
+
+    assert _reload(db, orphaned.id).status == "pending"
+    assert _reload(db, live.id).status == "running"